@@ -0,0 +1,174 @@
+import bisect
+import heapq
+from collections import Counter
+from typing import List
+from discord import app_commands
+from game_data import get_catalog
+
+MAX_CHOICES = 25  # Discord's limit for autocomplete suggestions
+
+# Longest typo-tolerant candidate list we bother verifying per keystroke
+MAX_FUZZY_CANDIDATES = 40
+
+class AutocompleteIndex:
+    """
+    Ranked name search for slash-command autocomplete.
+
+    Matches are returned in four tiers, each in the original name order:
+      1. names starting with the query
+      2. names with a later word starting with the query ("beam" -> "Ice Beam")
+      3. names containing the query anywhere
+      4. names with a word within one typo of the query ("thundr" -> "Thunder"),
+         or two typos once the query is at least 8 characters long; the
+         first letter has to be right
+    """
+
+    def __init__(self, names: List[str]):
+        self.names = list(names)
+        lowered = [name.lower() for name in self.names]
+
+        prefixes, word_starts, inner = [], [], []
+        bigrams = {}
+        for idx, name in enumerate(lowered):
+            prefixes.append((name, idx))
+            for pos in range(1, len(name)):
+                if not name[pos - 1].isalnum() and name[pos].isalnum():
+                    word_starts.append((name[pos:], idx))
+                else:
+                    inner.append((name[pos:], idx))
+            for gram in {name[i:i + 2] for i in range(len(name) - 1)}:
+                bigrams.setdefault(gram, []).append(idx)
+
+        # Each tier is a sorted list of (text, name index); every entry
+        # starting with the query sits in one contiguous bisect range.
+        self._tiers = []
+        for entries in (prefixes, word_starts, inner):
+            entries.sort()
+            self._tiers.append(([text for text, _ in entries], [idx for _, idx in entries]))
+        self._lowered = lowered
+        self._bigrams = bigrams
+
+    def search(self, current: str, limit: int = MAX_CHOICES) -> List[str]:
+        """Return up to `limit` names for the text typed so far, best matches first."""
+        if not current:
+            return self.names[:limit]
+
+        query = current.lower()
+        results = []
+        seen = set()
+        for keys, indexes in self._tiers:
+            lo = bisect.bisect_left(keys, query)
+            hi = bisect.bisect_left(keys, query + "\uffff")
+            if lo == hi:
+                continue
+            found = {indexes[i] for i in range(lo, hi)} - seen
+            for idx in heapq.nsmallest(limit - len(results), found):
+                results.append(idx)
+                seen.add(idx)
+            if len(results) >= limit:
+                return [self.names[i] for i in results]
+
+        for idx in self._fuzzy(query, limit - len(results), seen):
+            results.append(idx)
+        return [self.names[i] for i in results]
+
+    def choices(self, current: str, limit: int = MAX_CHOICES) -> List[app_commands.Choice[str]]:
+        """Same as search(), wrapped as Discord choices."""
+        return [app_commands.Choice(name=name, value=name) for name in self.search(current, limit)]
+
+    def _fuzzy(self, query: str, needed: int, seen: set) -> List[int]:
+        """Names whose words start with something within a small edit distance of the query."""
+        if needed <= 0 or len(query) < 4:
+            return []
+        max_distance = 1 if len(query) < 8 else 2
+
+        # Every edit breaks at most two bigrams, so a real match still shares most of them
+        query_grams = {query[i:i + 2] for i in range(len(query) - 1)}
+        overlap = Counter()
+        for gram in query_grams:
+            overlap.update(self._bigrams.get(gram, ()))
+        min_overlap = max(1, len(query_grams) - 2 * max_distance)
+        candidates = [idx for idx, count in overlap.most_common() if count >= min_overlap and idx not in seen]
+
+        scored = []
+        for idx in candidates[:MAX_FUZZY_CANDIDATES]:
+            distance = _word_prefix_distance(query, self._lowered[idx], max_distance)
+            if distance <= max_distance:
+                scored.append((distance, idx))
+        scored.sort()
+        return [idx for _, idx in scored[:needed]]
+
+def _word_prefix_distance(query: str, text: str, max_distance: int) -> int:
+    """
+    Smallest edit distance (with adjacent swaps) between the query and the
+    start of any word in text sharing its first letter. Returns
+    max_distance + 1 when nothing is close.
+    """
+    best = max_distance + 1
+    for start in range(len(text)):
+        # Only consider words that begin with the query's first letter
+        if text[start] != query[0] or (start and text[start - 1].isalnum()):
+            continue
+        window = text[start:start + len(query) + max_distance]
+        best = min(best, _prefix_distance(query, window, max_distance))
+        if best == 0:
+            break
+    return best
+
+def _prefix_distance(query: str, text: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between query and the closest prefix of
+    text, only tracking cells within max_distance of the diagonal.
+    """
+    too_far = max_distance + 1
+    n = len(text)
+    prev_prev = None
+    prev = [j if j <= max_distance else too_far for j in range(n + 1)]
+    for i in range(1, len(query) + 1):
+        row = [too_far] * (n + 1)
+        if i <= max_distance:
+            row[0] = i
+        lo = max(1, i - max_distance)
+        hi = min(n, i + max_distance)
+        for j in range(lo, hi + 1):
+            cost = 0 if query[i - 1] == text[j - 1] else 1
+            best = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost)
+            if (prev_prev is not None and j > 1 and query[i - 1] == text[j - 2]
+                    and query[i - 2] == text[j - 1]):
+                best = min(best, prev_prev[j - 2] + 1)
+            row[j] = min(best, too_far)
+        if min(row) > max_distance:
+            return too_far
+        prev_prev, prev = prev, row
+    return min(prev)
+
+_indexes_by_list = {}   # id(name list) -> (name list, index)
+_indexes_by_names = {}  # tuple of names -> index, shared by cogs with the same list
+_indexes_version = None
+
+def get_autocomplete_index(names: List[str]) -> AutocompleteIndex:
+    """
+    Return the index for a cog's cached name list, building it on first use.
+    Cogs that cache the same names (e.g. every move command) share one index.
+    Everything is dropped when the game data changes, so name lists replaced
+    by a reload aren't kept alive.
+    """
+    global _indexes_version
+    version = get_catalog().version
+    if version != _indexes_version:
+        _indexes_by_list.clear()
+        _indexes_by_names.clear()
+        _indexes_version = version
+    entry = _indexes_by_list.get(id(names))
+    if entry is not None and entry[0] is names:
+        return entry[1]
+    key = tuple(names)
+    index = _indexes_by_names.get(key)
+    if index is None:
+        index = _indexes_by_names[key] = AutocompleteIndex(key)
+    _indexes_by_list[id(names)] = (names, index)
+    return index
+
+def autocomplete_choices(names: List[str], current: str) -> List[app_commands.Choice[str]]:
+    """Ranked autocomplete choices for `current` out of a cached name list."""
+    return get_autocomplete_index(names).choices(current)
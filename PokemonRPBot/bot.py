@@ -1,10 +1,13 @@
 import discord_token
+import asyncio
 import discord
 from discord.ext import commands
 import config
 import sys
 import os
 import folder_manager  # Import the folder manager
+import game_data  # In-memory catalog of Data/
+import startup_profiler  # Startup timings and concurrent extension loading
 import error_logger  # Import the error logger
 
 # Add the root directory to sys.path
@@ -17,8 +20,14 @@ intents.reactions = True         # Enable reaction intent
 intents.guilds = True            # Enable guilds intent
 intents.members = True  # This enables the members intent
 
+class PokemonBot(commands.Bot):
+    async def add_cog(self, cog, **kwargs):
+        # Lets the startup profiler split constructor time from setup time
+        startup_profiler.cog_added()
+        await super().add_cog(cog, **kwargs)
+
 # Initialize bot with the updated intents
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = PokemonBot(command_prefix="!", intents=intents)
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -30,35 +39,61 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
     """Handle errors from slash commands"""
     await error_logger.on_app_command_error(bot, interaction, error)
 
-async def load_commands():
-    for extension in config.COMMANDS:
-        try:
-            await bot.load_extension(extension)
-            print(f"Loaded extension: {extension}")
-        except Exception as e:
-            print(f"Failed to load extension {extension}: {e}")
+def warm_caches():
+    """Shared indexes the cogs build on first use: (name, builder) pairs."""
+    import species, learner_index, item_index, move_index, max_move_index, type_matrix, loot_tables
+    return [
+        ("species", species.get_species_resolver),
+        ("ranks", species.get_rank_index),
+        ("learners", learner_index.get_learner_index),
+        ("items", item_index.get_item_index),
+        ("moves", move_index.get_move_index),
+        ("max moves", max_move_index.get_max_move_index),
+        ("type matrix", type_matrix.get_type_matrix),
+        ("loot tables", loot_tables.get_loot_tables),
+    ]
+
+async def load_commands(profiler: startup_profiler.StartupProfiler):
+    # Extensions are independent of each other, so load them all at once;
+    # shared indexes are built in worker threads alongside them.
+    await asyncio.gather(
+        profiler.load_extensions(bot, config.COMMANDS),
+        *(profiler.warm(name, build) for name, build in warm_caches()),
+    )
 
 @bot.event
 async def on_ready():
     print(f"Logged in as {bot.user}")
+    profiler = startup_profiler.StartupProfiler()
     
     # Set up folders for all guilds
     try:
-        await folder_manager.setup_folders(bot)
+        with profiler.phase("folders"):
+            await folder_manager.setup_folders(bot)
         print("Folders set up for all guilds.")
     except Exception as e:
         print(f"Error setting up folders: {e}")
     
+    # Load the game data catalog once, before any cog looks something up
+    try:
+        with profiler.phase("game data"):
+            await asyncio.to_thread(game_data.get_catalog)
+    except Exception as e:
+        print(f"Error loading game data: {e}")
+
     # Load commands
-    await load_commands()
+    await load_commands(profiler)
     
     # Sync commands with Discord
     try:
-        await bot.tree.sync()
+        with profiler.phase("command sync"):
+            await bot.tree.sync()
         print("Commands loaded and synced with Discord.")
     except Exception as e:
         print(f"Error syncing commands: {e}")
 
+    print(profiler.report())
+
 # Register the on_guild_join event from folder_manager
 try:
     bot.event(folder_manager.on_guild_join)
@@ -81,8 +116,11 @@ async def send(ctx):
     message = await ctx.send("React with ❌ to delete this message!")
     await message.add_reaction("❌")
 
-# Run the bot with the token from discord_token module
-try:
-    bot.run(discord_token.TOKEN)
-except Exception as e:
-    print(f"Failed to run the bot: {e}")
+# Run the bot with the token from discord_token module. Guarded so that
+# spawned worker processes (see /encounter_bulk) can import this module
+# without logging in a second time.
+if __name__ == "__main__":
+    try:
+        bot.run(discord_token.TOKEN)
+    except Exception as e:
+        print(f"Failed to run the bot: {e}")
@@ -0,0 +1,176 @@
+import copy
+import json
+import os
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Where character sheets live, one "<user id>_<guild id>_<name>.json" file each
+CHARACTERS_DIR = os.path.join(BASE_DIR, "Characters")
+
+# create_character used to write to a lowercase "characters" folder; on
+# case-sensitive file systems that is a different directory, so read it too
+LEGACY_CHARACTERS_DIR = os.path.join(BASE_DIR, "characters")
+
+def character_filename(user_id: int, guild_id: int, name: str) -> str:
+    return f"{user_id}_{guild_id}_{name.lower()}.json"
+
+def parse_character_filename(filename: str):
+    """
+    Split a character file name into (user id, guild id, name). Files without
+    a guild part give guild id None. Returns None for files that don't follow
+    the naming scheme.
+    """
+    if not filename.endswith(".json"):
+        return None
+    parts = filename[:-5].split("_", 2)
+    if not parts[0].isdigit() or len(parts) < 2:
+        return None
+    user_id = int(parts[0])
+    if len(parts) == 3 and parts[1].isdigit():
+        return user_id, int(parts[1]), parts[2]
+    return user_id, None, "_".join(parts[1:])
+
+class CharacterStore:
+    """
+    In-memory index of every character sheet, keyed by (user, guild, name).
+
+    Reads never touch the disk once the index is built; saves write the file
+    first and then update the index. The directory listing is only re-read
+    when the folder itself changes (a file was added, removed or renamed
+    outside the bot). Records handed out are copies, so callers may change
+    them freely and call save() when done.
+    """
+
+    def __init__(self, directories=None):
+        if directories is None:
+            directories = [CHARACTERS_DIR, LEGACY_CHARACTERS_DIR]
+        self.directory = directories[0]  # new characters are written here
+        self.directories = []
+        for directory in directories:
+            # Skip duplicates, e.g. Characters/ and characters/ on Windows
+            if any(os.path.exists(d) and os.path.exists(directory) and os.path.samefile(d, directory)
+                   for d in self.directories):
+                continue
+            self.directories.append(directory)
+        self._lock = threading.RLock()
+        self._records = {}   # (user id, guild id, name) -> character data
+        self._paths = {}     # (user id, guild id, name) -> file path
+        self._by_user = {}   # user id -> sorted list of keys
+        self._dir_stamps = None
+
+    def _stamps(self):
+        stamps = []
+        for directory in self.directories:
+            try:
+                stamps.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return stamps
+
+    def _ensure_loaded(self):
+        stamps = self._stamps()
+        if stamps != self._dir_stamps:
+            self._reload(stamps)
+
+    def _reload(self, stamps):
+        records, paths = {}, {}
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                parsed = parse_character_filename(filename)
+                if parsed is None or parsed in records:
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    with open(path, "r") as file:
+                        records[parsed] = json.load(file)
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"[Characters] Skipping unreadable character file {path}: {e}")
+                    continue
+                paths[parsed] = path
+        self._records = records
+        self._paths = paths
+        self._by_user = {}
+        for key in sorted(records, key=_sort_key):
+            self._by_user.setdefault(key[0], []).append(key)
+        self._dir_stamps = stamps
+        print(f"[Characters] Indexed {len(records)} character(s)")
+
+    def get(self, user_id: int, guild_id: int, name: str):
+        """The character `name` of a user in a guild, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            record = self._records.get((user_id, guild_id, name.lower()))
+            return copy.deepcopy(record) if record is not None else None
+
+    def exists(self, user_id: int, guild_id: int, name: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return (user_id, guild_id, name.lower()) in self._records
+
+    def for_user(self, user_id: int, guild_id: int = None):
+        """
+        The character a user rolls with. With several characters the one in
+        `guild_id` wins, then the lowest guild id, then the name in
+        alphabetical order, so the pick no longer depends on listing order.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            keys = self._by_user.get(user_id)
+            if not keys:
+                return None
+            if guild_id is not None:
+                keys = [k for k in keys if k[1] == guild_id] or keys
+            return copy.deepcopy(self._records[keys[0]])
+
+    def keys(self, user_id: int = None):
+        """(user id, guild id, name) of every character, or of one user's characters."""
+        with self._lock:
+            self._ensure_loaded()
+            if user_id is not None:
+                return list(self._by_user.get(user_id, []))
+            return sorted(self._records, key=_sort_key)
+
+    def save(self, user_id: int, guild_id: int, name: str, data: dict):
+        """Write a character to disk, then update the index."""
+        key = (user_id, guild_id, name.lower())
+        with self._lock:
+            self._ensure_loaded()
+            path = self._paths.get(key) or os.path.join(self.directory, character_filename(user_id, guild_id, name))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(data, file, indent=4)
+            os.replace(tmp_path, path)
+
+            is_new = key not in self._records
+            self._records[key] = copy.deepcopy(data)
+            self._paths[key] = path
+            if is_new:
+                keys = self._by_user.setdefault(user_id, [])
+                keys.append(key)
+                keys.sort(key=_sort_key)
+            # Our own write changed the folder; don't rescan because of it
+            self._dir_stamps = self._stamps()
+
+def _sort_key(key):
+    user_id, guild_id, name = key
+    return (user_id, guild_id is None, guild_id or 0, name)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_character_store() -> CharacterStore:
+    """Return the shared character store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CharacterStore()
+    return _store
+
+def load_user_stats(user_id: int, guild_id: int = None):
+    """Load the stats of a user's character, preferring one from `guild_id`."""
+    return get_character_store().for_user(user_id, guild_id)
@@ -3,6 +3,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from helpers import ParsedRollQuery, DEFAULT_CRIT_DIE_COUNT
+from dice import roll_batch
 
 # --- Commentary Lists (add more if you like) ---
 COMPLETE_MISS_COMMENTARY = [
@@ -272,21 +273,6 @@ ALL_HIT_COMMENTARY = [
 def append_random_mockery(message_lines, commentary_list):
     message_lines.append(f"*{random.choice(commentary_list)}*")
 
-def split_dice_and_successes(roll_result_string):
-    parts = roll_result_string.strip().split("\n", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    else:
-        return parts[0], ""
-
-def get_success_count(successes_line):
-    import re
-    m = re.search(r"\*\*(\d+)\*\*", successes_line)
-    return int(m.group(1)) if m else 0
-
-def is_crit(successes_line):
-    return "(CRIT" in successes_line or "CRIT" in successes_line
-
 def append_crit_stat_if_changed(message_lines, crit_6_count):
     if crit_6_count != DEFAULT_CRIT_DIE_COUNT:
         message_lines.append(f"-# **[Changed: Crit on {crit_6_count}x 6's]**")
@@ -377,23 +363,19 @@ class AllFoesAttackRollCog(commands.Cog):
         # Reroll view branches
         if reroll_view and reroll_type == 'accuracy':
             message_lines = ["### Reroll — Accuracy"]
-            accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-            accuracy_roll_result = accuracy_query.execute()
-            dice_line, successes_line = split_dice_and_successes(accuracy_roll_result)
-            success_count = get_success_count(successes_line)
-            message_lines.append(f"**Reroll Accuracy**: {dice_line} – {successes_line} ({required_accuracy} needed)")
+            accuracy_roll = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count).roll()
+            success_count = accuracy_roll.successes
+            message_lines.append(f"**Reroll Accuracy**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
             if success_count < required_accuracy:
                 append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             prev_acc_success = None
             if previous_results and 'accuracy' in previous_results:
-                prev_acc_success = get_success_count(split_dice_and_successes(previous_results.get('accuracy',''))[1])
+                prev_acc_success = previous_results['accuracy'].successes
             # Only roll damage if original was miss and reroll is a hit
             if prev_acc_success is not None and prev_acc_success < required_accuracy and success_count >= required_accuracy and damage_dice > 0:
-                damage_query = ParsedRollQuery(damage_dice)
-                damage_roll_result = damage_query.execute()
-                d_dice_line, d_successes_line = split_dice_and_successes(damage_roll_result)
-                message_lines.append(f"**Damage roll**: {d_dice_line} – {d_successes_line}")
-                damage_success = get_success_count(d_successes_line)
+                damage_roll = ParsedRollQuery(damage_dice).roll()
+                message_lines.append(f"**Damage roll**: {damage_roll.summary_line()}")
+                damage_success = damage_roll.successes
                 if damage_success == 0:
                     append_random_mockery(message_lines, OUT_OF_DAMAGE_DICE_COMMENTARY)
                 elif damage_success == damage_dice:
@@ -412,11 +394,9 @@ class AllFoesAttackRollCog(commands.Cog):
                 message_lines.append(f"**Reroll Damage**: 0d6 — 0 Successes")
                 append_random_mockery(message_lines, OUT_OF_DAMAGE_DICE_COMMENTARY)
                 return message_lines, None
-            damage_query = ParsedRollQuery(dice_for_target)
-            damage_roll_result = damage_query.execute()
-            d_dice_line, d_successes_line = split_dice_and_successes(damage_roll_result)
-            message_lines.append(f"**Reroll Damage** for **{targets[idx]}**: {d_dice_line} – {d_successes_line}")
-            damage_success = get_success_count(d_successes_line)
+            damage_roll = ParsedRollQuery(dice_for_target).roll()
+            message_lines.append(f"**Reroll Damage** for **{targets[idx]}**: {damage_roll.summary_line()}")
+            damage_success = damage_roll.successes
             if damage_success == 0:
                 append_random_mockery(message_lines, OUT_OF_DAMAGE_DICE_COMMENTARY)
             elif damage_success == dice_for_target:
@@ -433,10 +413,8 @@ class AllFoesAttackRollCog(commands.Cog):
             if not dice_for_status or dice_for_status <= 0:
                 message_lines.append(f"**Reroll Status Effect**: 0d6 — 0 Successes")
                 return message_lines, None
-            status_query = ParsedRollQuery(dice_for_status)
-            status_roll_result = status_query.execute()
-            s_dice_line, s_successes_line = split_dice_and_successes(status_roll_result)
-            message_lines.append(f"**Reroll Status Effect** for **{targets[idx]}**: {s_dice_line} – {s_successes_line}")
+            status_roll = ParsedRollQuery(dice_for_status).roll()
+            message_lines.append(f"**Reroll Status Effect** for **{targets[idx]}**: {status_roll.summary_line()}")
             return message_lines, None
 
         # Per-target status2 reroll: reroll_type can be ('status2', index)
@@ -449,18 +427,14 @@ class AllFoesAttackRollCog(commands.Cog):
             if not dice_for_status or dice_for_status <= 0:
                 message_lines.append(f"**Reroll Status Effect #2**: 0d6 — 0 Successes")
                 return message_lines, None
-            status_query = ParsedRollQuery(dice_for_status)
-            status_roll_result = status_query.execute()
-            s_dice_line, s_successes_line = split_dice_and_successes(status_roll_result)
-            message_lines.append(f"**Reroll Status Effect #2** for **{targets[idx]}**: {s_dice_line} – {s_successes_line}")
+            status_roll = ParsedRollQuery(dice_for_status).roll()
+            message_lines.append(f"**Reroll Status Effect #2** for **{targets[idx]}**: {status_roll.summary_line()}")
             return message_lines, None
 
         elif reroll_view and reroll_type == 'damage':
-            damage_query = ParsedRollQuery(damage_dice)
-            damage_roll_result = damage_query.execute()
-            d_dice_line, d_successes_line = split_dice_and_successes(damage_roll_result)
-            message_lines = ["### Reroll — Damage", f"**Reroll Damage**: {d_dice_line} – {d_successes_line}"]
-            damage_success = get_success_count(d_successes_line)
+            damage_roll = ParsedRollQuery(damage_dice).roll()
+            message_lines = ["### Reroll — Damage", f"**Reroll Damage**: {damage_roll.summary_line()}"]
+            damage_success = damage_roll.successes
             if damage_success == 0:
                 append_random_mockery(message_lines, OUT_OF_DAMAGE_DICE_COMMENTARY)
             elif damage_success == damage_dice:
@@ -468,17 +442,13 @@ class AllFoesAttackRollCog(commands.Cog):
             return message_lines, None
         elif reroll_view and reroll_type == 'status1':
             if status_effect_dice:
-                status_query = ParsedRollQuery(status_effect_dice)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = ["### Reroll — Status Effect", f"**Reroll Status Effect**: {dice_line} – {successes_line}"]
+                status_roll = ParsedRollQuery(status_effect_dice).roll()
+                message_lines = ["### Reroll — Status Effect", f"**Reroll Status Effect**: {status_roll.summary_line()}"]
                 return message_lines, None
         elif reroll_view and reroll_type == 'status2':
             if status_effect_dice_2:
-                status_query = ParsedRollQuery(status_effect_dice_2)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = ["### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {dice_line} – {successes_line}"]
+                status_roll = ParsedRollQuery(status_effect_dice_2).roll()
+                message_lines = ["### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {status_roll.summary_line()}"]
                 return message_lines, None
 
         # Normal full composition
@@ -500,15 +470,22 @@ class AllFoesAttackRollCog(commands.Cog):
             message_lines.append("### That'd be an instant-miss! Did you typo your accuracy dice?")
             return message_lines, None
 
+        # Roll every pool of the action at once: accuracy, then damage and
+        # status dice for each target that still has damage dice left
+        queries = {'accuracy': ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)}
+        for i in range(min(len(targets), damage_dice)):
+            queries[f'damage_{i}'] = ParsedRollQuery(damage_dice - i)
+            if status_effect_dice and status_effect_dice > 0:
+                queries[f'status1_{i}'] = ParsedRollQuery(status_effect_dice)
+            if status_effect_dice_2 and status_effect_dice_2 > 0:
+                queries[f'status2_{i}'] = ParsedRollQuery(status_effect_dice_2)
+        # Kept on the view so rerolls can work with the exact previous results
+        results = roll_batch(queries)
+
         # Accuracy roll
-        accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-        accuracy_roll_result = accuracy_query.execute()
-        acc_dice_line, acc_successes_line = split_dice_and_successes(accuracy_roll_result)
-        acc_success_count = get_success_count(acc_successes_line)
-        if acc_successes_line:
-            message_lines.append(f"**Accuracy roll**: {acc_dice_line} – {acc_successes_line} ({required_accuracy} needed)")
-        else:
-            message_lines.append(f"**Accuracy roll**: {acc_dice_line} ({required_accuracy} needed)")
+        accuracy_roll = results['accuracy']
+        acc_success_count = accuracy_roll.successes
+        message_lines.append(f"**Accuracy roll**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
 
         if randomize_order:
             append_random_mockery(message_lines, ALL_HIT_COMMENTARY)
@@ -517,7 +494,7 @@ class AllFoesAttackRollCog(commands.Cog):
             append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             return message_lines, None
 
-        if is_crit(acc_successes_line):
+        if accuracy_roll.crit:
             message_lines.append(f"**{targets[0]} got a critical hit!**")
 
         message_lines.append("")
@@ -531,43 +508,30 @@ class AllFoesAttackRollCog(commands.Cog):
                 break
 
             message_lines.append(f"**Targeting {target}!**")
-            dmg_query = ParsedRollQuery(remaining_damage_dice)
-            dmg_roll_result = dmg_query.execute()
-            dmg_dice_line, dmg_successes_line = split_dice_and_successes(dmg_roll_result)
-            damage_success = get_success_count(dmg_successes_line)
-            if dmg_successes_line:
-                message_lines.append(f"> **Damage roll**: {dmg_dice_line} – {dmg_successes_line}")
-            else:
-                message_lines.append(f"> **Damage roll**: {dmg_dice_line}")
+            dmg_roll = results[f'damage_{i}']
+            damage_success = dmg_roll.successes
+            message_lines.append(f"> **Damage roll**: {dmg_roll.summary_line()}")
 
             if status_effect_dice and status_effect_dice > 0:
-                status_query = ParsedRollQuery(status_effect_dice)
-                status_roll_result = status_query.execute()
-                s_dice_line, s_successes_line = split_dice_and_successes(status_roll_result)
-                if s_successes_line:
-                    message_lines.append(f"> **Status Effect roll**: {s_dice_line} – {s_successes_line}")
-                else:
-                    message_lines.append(f"> **Status Effect roll**: {s_dice_line}")
+                status_roll = results[f'status1_{i}']
+                message_lines.append(f"> **Status Effect roll**: {status_roll.summary_line()}")
             if status_effect_dice_2 and status_effect_dice_2 > 0:
-                status_query2 = ParsedRollQuery(status_effect_dice_2)
-                status_roll_result2 = status_query2.execute()
-                s2_dice_line, s2_successes_line = split_dice_and_successes(status_roll_result2)
-                if s2_successes_line:
-                    message_lines.append(f"> **Status Effect #2 roll**: {s2_dice_line} – {s2_successes_line}")
-                else:
-                    message_lines.append(f"> **Status Effect #2 roll**: {s2_dice_line}")
+                status_roll2 = results[f'status2_{i}']
+                message_lines.append(f"> **Status Effect #2 roll**: {status_roll2.summary_line()}")
 
             remaining_damage_dice -= 1
 
-        view = AllFoesRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2)
+        view = AllFoesRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2, results=results)
         return message_lines, view
 
 
 class AllFoesRerollView(discord.ui.View):
-    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None):
+    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None, results=None):
         # Increased timeout to match other command
         super().__init__(timeout=300)
         self.roll_params = roll_params
+        # roll name -> RollResult shown in the message ('accuracy', 'damage_0', 'status1_0', ...)
+        self.results = results or {}
         if show_accuracy:
             self.add_item(AllFoesRerollButton('accuracy', label='Reroll Accuracy', style=discord.ButtonStyle.primary))
         if show_damage:
@@ -616,75 +580,6 @@ class AllFoesRerollButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         cog = interaction.client.get_cog('AllFoesAttackRollCog')
         params = dict(self.view.roll_params)
-        previous_message = interaction.message.content or ''
-        previous_results = {}
-        import re
-        # Enhanced parsing: track which target we're on so damage rolls per-target can be captured
-        current_target_idx = None
-        target_pointer = 0
-        for raw_line in previous_message.split('\n'):
-            line = raw_line.strip()
-            if not line:
-                continue
-            # Detect target header lines like "**Targeting X!**"
-            m_target = re.match(r"^\*\*Targeting\s+.+?!\*\*", line)
-            if m_target:
-                # advance pointer — we assume target order in message matches params['targets'] order
-                current_target_idx = target_pointer
-                target_pointer += 1
-                continue
-
-            m = re.match(r"^\*\*(?:Reroll\s+)?Accuracy(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results['accuracy'] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results['accuracy'] = content
-                continue
-
-            m = re.match(r"^\*\*(?:Reroll\s+)?Damage(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                # If we are inside a Targeting block, store as per-target damage
-                key = 'damage'
-                if current_target_idx is not None:
-                    key = f'damage_{current_target_idx}'
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results[key] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results[key] = content
-                continue
-
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect\s+#2\s*roll\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                # store per-target if within a Targeting block
-                key = 'status2'
-                if current_target_idx is not None:
-                    key = f'status2_{current_target_idx}'
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results[key] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results[key] = content
-                continue
-
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                key = 'status1'
-                if current_target_idx is not None:
-                    key = f'status1_{current_target_idx}'
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results[key] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results[key] = content
-                continue
-
         # If this button corresponds to a specific target, send that index along with reroll_type
         reroll_type_to_send = self.reroll_type
         if getattr(self, 'target_index', None) is not None:
@@ -692,7 +587,7 @@ class AllFoesRerollButton(discord.ui.Button):
 
         message_lines, _ = cog._compose_all_foes_message_and_view(
             params,
-            previous_results=previous_results,
+            previous_results=self.view.results,
             reroll_type=reroll_type_to_send,
             reroll_view=True
         )
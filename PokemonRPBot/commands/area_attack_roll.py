@@ -5,6 +5,7 @@ from discord.ext import commands
 from discord import app_commands
 
 from helpers import ParsedRollQuery, DEFAULT_CRIT_DIE_COUNT
+from dice import roll_batch
 
 COMPLETE_MISS_COMMENTARY = [
     "Congratulations! You've just created a minor natural disaster — for fun!",
@@ -64,32 +65,12 @@ COMPLETE_MISS_COMMENTARY = [
 def append_random_mockery(message_lines, commentary_list):
     message_lines.append(f"*{random.choice(commentary_list)}*")
 
-def split_dice_and_successes(roll_result_string):
-    parts = roll_result_string.strip().split("\n", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    else:
-        return parts[0], ""
-
-def get_success_count(successes_line):
-    import re
-    m = re.search(r"\*\*(\d+)\*\*", successes_line)
-    return int(m.group(1)) if m else 0
-
-def is_crit(successes_line):
-    # Detects "**(CRIT)**" (or similar) in the line
-    return "(CRIT" in successes_line or "CRIT" in successes_line
-
-def append_status_effect_roll(status_effect_dice, prefix, roll_number_string, message_lines):
+def append_status_effect_roll(status_effect_dice, prefix, roll_number_string, message_lines, status_roll=None):
     if status_effect_dice is None or status_effect_dice == 0:
         return
-    query = ParsedRollQuery(status_effect_dice)
-    status_roll_result = query.execute()
-    dice_line, successes_line = split_dice_and_successes(status_roll_result)
-    if successes_line:
-        message_lines.append(f"{prefix}**Status Effect {roll_number_string}roll**: {dice_line} – {successes_line}")
-    else:
-        message_lines.append(f"{prefix}**Status Effect {roll_number_string}roll**: {dice_line}")
+    if status_roll is None:
+        status_roll = ParsedRollQuery(status_effect_dice).roll()
+    message_lines.append(f"{prefix}**Status Effect {roll_number_string}roll**: {status_roll.summary_line()}")
 
 def append_crit_stat_if_changed(message_lines, crit_6_count):
     if crit_6_count != DEFAULT_CRIT_DIE_COUNT:
@@ -113,23 +94,19 @@ class AreaAttackRollCog(commands.Cog):
         # Reroll branches
         if reroll_view and reroll_type == 'accuracy':
             message_lines = ["### Reroll — Accuracy"]
-            accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-            accuracy_roll_result = accuracy_query.execute()
-            dice_line, successes_line = split_dice_and_successes(accuracy_roll_result)
-            success_count = get_success_count(successes_line)
-            message_lines.append(f"**Reroll Accuracy**: {dice_line} – {successes_line} ({required_accuracy} needed)")
+            accuracy_roll = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count).roll()
+            success_count = accuracy_roll.successes
+            message_lines.append(f"**Reroll Accuracy**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
             if success_count < required_accuracy:
                 append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             # Check previous accuracy to determine if we should also roll damage
             prev_acc_success = None
             if previous_results and 'accuracy' in previous_results:
-                prev_acc_success = get_success_count(split_dice_and_successes(previous_results.get('accuracy',''))[1])
+                prev_acc_success = previous_results['accuracy'].successes
             if prev_acc_success is not None and prev_acc_success < required_accuracy and success_count >= required_accuracy and damage_dice > 0:
-                damage_query = ParsedRollQuery(damage_dice)
-                damage_roll_result = damage_query.execute()
-                d_dice_line, d_successes_line = split_dice_and_successes(damage_roll_result)
-                message_lines.append(f"**Damage roll**: {d_dice_line} – {d_successes_line}")
-                damage_success = get_success_count(d_successes_line)
+                damage_roll = ParsedRollQuery(damage_dice).roll()
+                message_lines.append(f"**Damage roll**: {damage_roll.summary_line()}")
+                damage_success = damage_roll.successes
                 if damage_success == 0:
                     append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
                 else:
@@ -140,11 +117,9 @@ class AreaAttackRollCog(commands.Cog):
             return message_lines, None
 
         if reroll_view and reroll_type == 'damage':
-            damage_query = ParsedRollQuery(damage_dice)
-            damage_roll_result = damage_query.execute()
-            d_dice_line, d_successes_line = split_dice_and_successes(damage_roll_result)
-            message_lines = ["### Reroll — Damage", f"**Reroll Damage**: {d_dice_line} – {d_successes_line}"]
-            damage_success = get_success_count(d_successes_line)
+            damage_roll = ParsedRollQuery(damage_dice).roll()
+            message_lines = ["### Reroll — Damage", f"**Reroll Damage**: {damage_roll.summary_line()}"]
+            damage_success = damage_roll.successes
             if damage_success == 0:
                 append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             else:
@@ -156,18 +131,14 @@ class AreaAttackRollCog(commands.Cog):
 
         if reroll_view and reroll_type == 'status1':
             if status_effect_dice:
-                status_query = ParsedRollQuery(status_effect_dice)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = ["### Reroll — Status Effect", f"**Reroll Status Effect**: {dice_line} – {successes_line}"]
+                status_roll = ParsedRollQuery(status_effect_dice).roll()
+                message_lines = ["### Reroll — Status Effect", f"**Reroll Status Effect**: {status_roll.summary_line()}"]
                 return message_lines, None
 
         if reroll_view and reroll_type == 'status2':
             if status_effect_dice_2:
-                status_query = ParsedRollQuery(status_effect_dice_2)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = ["### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {dice_line} – {successes_line}"]
+                status_roll = ParsedRollQuery(status_effect_dice_2).roll()
+                message_lines = ["### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {status_roll.summary_line()}"]
                 return message_lines, None
 
         # Normal full composition
@@ -183,31 +154,36 @@ class AreaAttackRollCog(commands.Cog):
             message_lines.append("### That'd be an instant-miss! Did you typo your accuracy dice?")
             return message_lines, None
 
+        # Roll accuracy, damage and status dice in one batch; the results are
+        # kept on the view so rerolls can work with the exact previous results
+        queries = {
+            'accuracy': ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count),
+            'damage': ParsedRollQuery(damage_dice),
+        }
+        if status_effect_dice and status_effect_dice > 0:
+            queries['status1'] = ParsedRollQuery(status_effect_dice)
+        if status_effect_dice_2 and status_effect_dice_2 > 0:
+            queries['status2'] = ParsedRollQuery(status_effect_dice_2)
+        results = roll_batch(queries)
+
         # Accuracy
-        accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-        accuracy_roll_result = accuracy_query.execute()
-        acc_dice_line, acc_successes_line = split_dice_and_successes(accuracy_roll_result)
-        acc_success_count = get_success_count(acc_successes_line)
-        if acc_successes_line:
-            message_lines.append(f"**Accuracy roll**: {acc_dice_line} – {acc_successes_line} ({required_accuracy} needed)")
-        else:
-            message_lines.append(f"**Accuracy roll**: {acc_dice_line} ({required_accuracy} needed)")
+        accuracy_roll = results['accuracy']
+        acc_success_count = accuracy_roll.successes
+        message_lines.append(f"**Accuracy roll**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
 
         if required_accuracy > acc_success_count:
             append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             return message_lines, None
 
-        if is_crit(acc_successes_line):
+        if accuracy_roll.crit:
             message_lines.append(f"**{main_target} got a critical hit!**")
 
         message_lines.append("")
 
         # Damage
-        damage_query = ParsedRollQuery(damage_dice)
-        damage_roll_result = damage_query.execute()
-        dmg_dice_line, dmg_successes_line = split_dice_and_successes(damage_roll_result)
-        damage_success = get_success_count(dmg_successes_line)
-        message_lines.append(f"**Damage roll**: {dmg_dice_line} – {dmg_successes_line}")
+        damage_roll = results['damage']
+        damage_success = damage_roll.successes
+        message_lines.append(f"**Damage roll**: {damage_roll.summary_line()}")
 
         message_lines.append("")
         message_lines.append(f"**Enemies hit for {damage_success} damage each.**")
@@ -216,11 +192,11 @@ class AreaAttackRollCog(commands.Cog):
 
         # Status effects
         if status_effect_dice and status_effect_dice > 0:
-            append_status_effect_roll(status_effect_dice, "", "", message_lines)
+            append_status_effect_roll(status_effect_dice, "", "", message_lines, results['status1'])
         if status_effect_dice_2 and status_effect_dice_2 > 0:
-            append_status_effect_roll(status_effect_dice_2, "", "#2 ", message_lines)
+            append_status_effect_roll(status_effect_dice_2, "", "#2 ", message_lines, results['status2'])
 
-        view = AreaRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2)
+        view = AreaRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2, results=results)
         return message_lines, view
 
     @app_commands.command(
@@ -290,9 +266,10 @@ async def setup(bot):
 
 
 class AreaRerollView(discord.ui.View):
-    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None):
+    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None, results=None):
         super().__init__(timeout=300)
         self.roll_params = roll_params
+        self.results = results or {}  # roll name -> RollResult shown in the message
         if show_accuracy:
             self.add_item(AreaRerollButton('accuracy', label='Reroll Accuracy', style=discord.ButtonStyle.primary))
         if show_damage:
@@ -311,53 +288,9 @@ class AreaRerollButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         cog = interaction.client.get_cog('AreaAttackRollCog')
         params = dict(self.view.roll_params)
-        previous_message = interaction.message.content or ''
-        previous_results = {}
-        import re
-        for raw_line in previous_message.split('\n'):
-            line = raw_line.strip()
-            if not line:
-                continue
-            m = re.match(r"^\*\*(?:Reroll\s+)?Accuracy(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results['accuracy'] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results['accuracy'] = content
-                continue
-            m = re.match(r"^\*\*(?:Reroll\s+)?Damage(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results['damage'] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results['damage'] = content
-                continue
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect\s+#2\s*roll\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results['status2'] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results['status2'] = content
-                continue
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results['status1'] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results['status1'] = content
-                continue
-
         message_lines, _ = cog._compose_area_attack_message_and_view(
             params,
-            previous_results=previous_results,
+            previous_results=self.view.results,
             reroll_type=self.reroll_type,
             reroll_view=True
         )
@@ -4,6 +4,8 @@ from discord.ext import commands
 from discord import app_commands
 
 from helpers import ParsedRollQuery
+from dice import roll_batch
+from probability import odds_footer
 
 DEFAULT_CRIT_DIE_COUNT = 3
 
@@ -170,38 +172,21 @@ def append_random_mockery(message: list, commentary: list):
     mockery = random.choice(commentary)
     message.append(f"*{mockery}*")
 
-def append_status_effect_roll(status_effect_dice, prefix, roll_number_string, message: list):
+def append_status_effect_roll(status_effect_dice, prefix, roll_number_string, message: list, results: dict = None, key: str = None, status_roll=None):
     if status_effect_dice is None or status_effect_dice == 0:
         return
-    query = ParsedRollQuery(status_effect_dice)
-    status_roll_result = query.execute()
-    dice_line, successes_line = split_dice_and_successes(status_roll_result)
-    if successes_line:
-        message.append(
-            f"{prefix}**Status Effect {roll_number_string}roll**: {dice_line} – {successes_line}"
-        )
-    else:
-        message.append(
-            f"{prefix}**Status Effect {roll_number_string}roll**: {dice_line}"
-        )
+    if status_roll is None:
+        status_roll = ParsedRollQuery(status_effect_dice).roll()
+    if results is not None and key:
+        results[key] = status_roll
+    message.append(
+        f"{prefix}**Status Effect {roll_number_string}roll**: {status_roll.summary_line()}"
+    )
 
 def append_crit_stat_if_changed(message: list, crit_6_count):
     if crit_6_count != DEFAULT_CRIT_DIE_COUNT:
         message.append(f"-# **[Changed: Crit on {crit_6_count}x 6's]**")
 
-def split_dice_and_successes(roll_result_string):
-    # Split classic helpers.py result into (dice_line, successes_line)
-    parts = roll_result_string.strip().split("\n", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    else:
-        return parts[0], ""
-
-def get_success_count(successes_line):
-    import re
-    m = re.search(r"\*\*(\d+)\*\*", successes_line)
-    return int(m.group(1)) if m else 0
-
 class AttackRollCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -217,6 +202,7 @@ class AttackRollCog(commands.Cog):
         status_effect_dice="How many status effect dice should be rolled?",
         status_effect_dice_2="How many status effect dice should be rolled for a second status effect?",
         accuracy_reduction="Add an accuracy reduction (defaults to 0).",
+        show_odds="Add the exact chance to hit and crit below the results.",
     )
     async def attack_roll(
         self,
@@ -227,6 +213,7 @@ class AttackRollCog(commands.Cog):
         status_effect_dice: app_commands.Range[int, 0, 5] = None,
         status_effect_dice_2: app_commands.Range[int, 0, 5] = None,
         accuracy_reduction: app_commands.Range[int, 0, 10] = 0,
+        show_odds: bool = False,
     ):
         await interaction.response.defer(thinking=True)
 
@@ -245,6 +232,8 @@ class AttackRollCog(commands.Cog):
 
         # Compose the message and buttons
         message_lines, view = self._compose_attack_roll_message_and_view(roll_params)
+        if show_odds:
+            message_lines.append(odds_footer(accuracy_dice, accuracy_reduction, crit_6_count))
         await interaction.followup.send('\n'.join(message_lines), view=view)
 
 
@@ -259,35 +248,29 @@ class AttackRollCog(commands.Cog):
 
         if reroll_view and reroll_type == "accuracy":
             message_lines = ["### Reroll — Accuracy"]
-            accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-            accuracy_roll_result = accuracy_query.execute()
-            dice_line, successes_line = split_dice_and_successes(accuracy_roll_result)
-            success_count = get_success_count(successes_line)
-            message_lines.append(f"**Reroll Accuracy**: {dice_line} – {successes_line} ({required_accuracy} needed)")
+            accuracy_roll = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count).roll()
+            success_count = accuracy_roll.successes
+            message_lines.append(f"**Reroll Accuracy**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
             # Append accuracy commentary based on the new result
             if success_count < required_accuracy:
                 append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
             prev_acc_success = None
             if previous_results is not None and "accuracy" in previous_results:
-                prev_acc_success = get_success_count(split_dice_and_successes(previous_results.get("accuracy", ""))[1])
+                prev_acc_success = previous_results["accuracy"].successes
             # Only roll damage if original was miss (prev_acc_success < required_accuracy) and reroll is a hit (success_count >= required_accuracy)
             if prev_acc_success is not None and prev_acc_success < required_accuracy and success_count >= required_accuracy and damage_dice > 0:
-                damage_query = ParsedRollQuery(damage_dice)
-                damage_roll_result = damage_query.execute()
-                dmg_dice_line, dmg_successes_line = split_dice_and_successes(damage_roll_result)
-                message_lines.append(f"**Damage roll**: {dmg_dice_line} – {dmg_successes_line}")
-                damage_success = get_success_count(dmg_successes_line)
+                damage_roll = ParsedRollQuery(damage_dice).roll()
+                message_lines.append(f"**Damage roll**: {damage_roll.summary_line()}")
+                damage_success = damage_roll.successes
                 if damage_success == 0:
                     append_random_mockery(message_lines, ZERO_DAMAGE_COMMENTARY)
                 elif damage_success == damage_dice:
                     append_random_mockery(message_lines, ALL_HIT_COMMENTARY)
             return message_lines, None
         elif reroll_view and reroll_type == "damage":
-            damage_query = ParsedRollQuery(damage_dice)
-            damage_roll_result = damage_query.execute()
-            dmg_dice_line, dmg_successes_line = split_dice_and_successes(damage_roll_result)
-            message_lines = [f"### Reroll — Damage", f"**Reroll Damage**: {dmg_dice_line} – {dmg_successes_line}"]
-            damage_success = get_success_count(dmg_successes_line)
+            damage_roll = ParsedRollQuery(damage_dice).roll()
+            message_lines = [f"### Reroll — Damage", f"**Reroll Damage**: {damage_roll.summary_line()}"]
+            damage_success = damage_roll.successes
             if damage_success == 0:
                 append_random_mockery(message_lines, ZERO_DAMAGE_COMMENTARY)
             elif damage_success == damage_dice:
@@ -295,108 +278,73 @@ class AttackRollCog(commands.Cog):
             return message_lines, None
         elif reroll_view and reroll_type == "status1":
             if status_effect_dice:
-                status_query = ParsedRollQuery(status_effect_dice)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = [f"### Reroll — Status Effect", f"**Reroll Status Effect**: {dice_line} – {successes_line}"]
+                status_roll = ParsedRollQuery(status_effect_dice).roll()
+                message_lines = [f"### Reroll — Status Effect", f"**Reroll Status Effect**: {status_roll.summary_line()}"]
                 return message_lines, None
         elif reroll_view and reroll_type == "status2":
             if status_effect_dice_2:
-                status_query = ParsedRollQuery(status_effect_dice_2)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = [f"### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {dice_line} – {successes_line}"]
-                return message_lines, None
-        elif reroll_view and reroll_type == "status1":
-            if status_effect_dice:
-                status_query = ParsedRollQuery(status_effect_dice)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = [f"### Reroll", f"**Reroll Status Effect**: {dice_line} – {successes_line}"]
-        elif reroll_view and reroll_type == "status2":
-            if status_effect_dice_2:
-                status_query = ParsedRollQuery(status_effect_dice_2)
-                status_roll_result = status_query.execute()
-                dice_line, successes_line = split_dice_and_successes(status_roll_result)
-                message_lines = [f"### Reroll", f"**Reroll Status Effect #2**: {dice_line} – {successes_line}"]
-        else:
-            message_lines = []
-            # ...existing code for normal roll...
-            # --- Accuracy roll ---
-            if previous_results and reroll_type != "accuracy":
-                accuracy_roll_result = previous_results.get("accuracy")
-            else:
-                accuracy_query = ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)
-                accuracy_roll_result = accuracy_query.execute()
-            dice_line, successes_line = split_dice_and_successes(accuracy_roll_result)
-            success_count = get_success_count(successes_line)
-            if required_accuracy > accuracy_dice:
-                message_lines.append("### That'd be an instant-miss! Did you typo your accuracy dice?")
+                status_roll = ParsedRollQuery(status_effect_dice_2).roll()
+                message_lines = [f"### Reroll — Status Effect #2", f"**Reroll Status Effect #2**: {status_roll.summary_line()}"]
                 return message_lines, None
-            if successes_line:
-                message_lines.append(f"**Accuracy roll**: {dice_line} – {successes_line} ({required_accuracy} needed)")
-            else:
-                message_lines.append(f"**Accuracy roll**: {dice_line} ({required_accuracy} needed)")
-            if required_accuracy > success_count:
-                append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
-                view = AttackRollRerollView(roll_params, show_accuracy=True)
-                return message_lines, view
+
+        # Reuse the previous rolls that aren't being rerolled and draw
+        # everything else in one batch
+        kept = {
+            name: roll for name, roll in (previous_results or {}).items()
+            if name != reroll_type
+        }
+        queries = {"accuracy": ParsedRollQuery(accuracy_dice, crit_6_count=crit_6_count)}
+        if damage_dice > 0:
+            queries["damage"] = ParsedRollQuery(damage_dice)
+        if status_effect_dice:
+            queries["status1"] = ParsedRollQuery(status_effect_dice)
+        if status_effect_dice_2:
+            queries["status2"] = ParsedRollQuery(status_effect_dice_2)
+        rolled = roll_batch({name: query for name, query in queries.items() if name not in kept})
+        rolled.update(kept)
+
+        # Keep every roll so rerolls can work with the exact previous results
+        results = {}
+        message_lines = []
+        # --- Accuracy roll ---
+        accuracy_roll = rolled["accuracy"]
+        results["accuracy"] = accuracy_roll
+        success_count = accuracy_roll.successes
+        if required_accuracy > accuracy_dice:
+            message_lines.append("### That'd be an instant-miss! Did you typo your accuracy dice?")
+            return message_lines, None
+        message_lines.append(f"**Accuracy roll**: {accuracy_roll.summary_line()} ({required_accuracy} needed)")
+        if required_accuracy > success_count:
+            append_random_mockery(message_lines, COMPLETE_MISS_COMMENTARY)
+            view = AttackRollRerollView(roll_params, show_accuracy=True, results=results)
+            return message_lines, view
 
         # --- Damage roll ---
         if damage_dice > 0:
-            if previous_results and reroll_type != "damage":
-                damage_roll_result = previous_results.get("damage")
-            else:
-                damage_query = ParsedRollQuery(damage_dice)
-                damage_roll_result = damage_query.execute()
-            dmg_dice_line, dmg_successes_line = split_dice_and_successes(damage_roll_result)
-            damage_success = get_success_count(dmg_successes_line)
-            maybe_crit = " (+CRIT)" if "(CRIT!)" in successes_line else ""
-            if dmg_successes_line:
-                message_lines.append(f"**Damage roll**: {dmg_dice_line} – {dmg_successes_line}{maybe_crit}")
-            else:
-                message_lines.append(f"**Damage roll**: {dmg_dice_line}{maybe_crit}")
+            damage_roll = rolled["damage"]
+            results["damage"] = damage_roll
+            damage_success = damage_roll.successes
+            maybe_crit = " (+CRIT)" if accuracy_roll.crit else ""
+            message_lines.append(f"**Damage roll**: {damage_roll.summary_line()}{maybe_crit}")
             if damage_success == 0:
                 append_random_mockery(message_lines, ZERO_DAMAGE_COMMENTARY)
             elif damage_dice > 0 and damage_success == damage_dice:
                 append_random_mockery(message_lines, ALL_HIT_COMMENTARY)
-        if previous_results and reroll_type != "status1":
-            status1_result = previous_results.get("status1")
-        else:
-            status1_result = None
-        if previous_results and reroll_type != "status2":
-            status2_result = previous_results.get("status2")
-        else:
-            status2_result = None
-
         if status_effect_dice:
-            if status1_result:
-                dice_line, successes_line = split_dice_and_successes(status1_result)
-                if successes_line:
-                    message_lines.append(f"**Status Effect roll**: {dice_line} – {successes_line}")
-                else:
-                    message_lines.append(f"**Status Effect roll**: {dice_line}")
-            else:
-                append_status_effect_roll(status_effect_dice, "", "", message_lines)
+            append_status_effect_roll(status_effect_dice, "", "", message_lines, results, "status1", rolled["status1"])
         if status_effect_dice_2:
-            if status2_result:
-                dice_line, successes_line = split_dice_and_successes(status2_result)
-                if successes_line:
-                    message_lines.append(f"**Status Effect #2 roll**: {dice_line} – {successes_line}")
-                else:
-                    message_lines.append(f"**Status Effect #2 roll**: {dice_line}")
-            else:
-                append_status_effect_roll(status_effect_dice_2, "", "#2 ", message_lines)
+            append_status_effect_roll(status_effect_dice_2, "", "#2 ", message_lines, results, "status2", rolled["status2"])
 
-        view = AttackRollRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2)
+        view = AttackRollRerollView(roll_params, show_accuracy=True, show_damage=damage_dice > 0, show_status1=status_effect_dice, show_status2=status_effect_dice_2, results=results)
         return message_lines, view
 
 
 class AttackRollRerollView(discord.ui.View):
-    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None):
+    def __init__(self, roll_params, show_accuracy=True, show_damage=False, show_status1=None, show_status2=None, results=None):
         # Increase timeout to 5 minutes to allow more time for rerolls
         super().__init__(timeout=300)
         self.roll_params = roll_params
+        self.results = results or {}  # roll name -> RollResult shown in the message
         if show_accuracy:
             self.add_item(AttackRollRerollButton("accuracy", label="Reroll Accuracy", style=discord.ButtonStyle.primary))
         if show_damage:
@@ -414,59 +362,9 @@ class AttackRollRerollButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         cog = interaction.client.get_cog("AttackRollCog")
         params = dict(self.view.roll_params)
-        previous_message = interaction.message.content or ""
-        previous_results = {}
-        import re
-
-        # Parse visible lines and reconstruct a multiline raw-roll style string
-        # that matches what ParsedRollQuery.execute() returns (dice_line\nsuccesses_line)
-        for raw_line in previous_message.split('\n'):
-            line = raw_line.strip()
-            if not line:
-                continue
-            # Accuracy (matches both "**Accuracy roll**:" and "**Reroll Accuracy**:")
-            m = re.match(r"^\*\*(?:Reroll\s+)?Accuracy(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results["accuracy"] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results["accuracy"] = content
-                continue
-            # Damage (matches both "**Damage roll**:" and "**Reroll Damage**:")
-            m = re.match(r"^\*\*(?:Reroll\s+)?Damage(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results["damage"] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results["damage"] = content
-                continue
-            # Status Effect #2
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect\s+#2\s*roll\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results["status2"] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results["status2"] = content
-                continue
-            # Status Effect (first)
-            m = re.match(r"^\*\*(?:Reroll\s+)?Status Effect(?:\s+roll)?\*\*:\s*(.+)$", line)
-            if m:
-                content = m.group(1).strip()
-                if '–' in content:
-                    left, right = content.split('–', 1)
-                    previous_results["status1"] = f"{left.strip()}\n{right.strip()}"
-                else:
-                    previous_results["status1"] = content
-                continue
         message_lines, _ = cog._compose_attack_roll_message_and_view(
             params,
-            previous_results=previous_results,
+            previous_results=self.view.results,
             reroll_type=self.reroll_type,
             reroll_view=True
         )
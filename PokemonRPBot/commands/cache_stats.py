@@ -0,0 +1,56 @@
+import asyncio
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from game_data import get_catalog, reload_catalog
+from response_cache import get_response_cache
+
+class CacheStatsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="cache_stats",
+        description="Show how often lookup commands were answered from the response cache."
+    )
+    @app_commands.default_permissions(manage_guild=True)
+    async def cache_stats(self, interaction: discord.Interaction):
+        cache = get_response_cache()
+        stats = cache.stats()
+        lines = [
+            "### Response cache",
+            f"{len(cache)}/{cache.max_entries} entries for data version `{get_catalog().version}`",
+        ]
+        if not stats:
+            lines.append("No lookups yet.")
+        for command, counts in stats.items():
+            lines.append(
+                f"**/{command}**: {counts['hits']} hits, {counts['misses']} misses "
+                f"({counts['hit_rate']:.0%})"
+            )
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @app_commands.command(
+        name="reload_data",
+        description="Reload the game data if any file in Data/ changed since it was loaded."
+    )
+    @app_commands.default_permissions(manage_guild=True)
+    async def reload_data(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        old_version = get_catalog().version
+        try:
+            reloaded = await asyncio.to_thread(reload_catalog)
+        except Exception as e:
+            print(f"[GameData] Reload failed: {e!r}")
+            await interaction.followup.send(f"Reloading the game data failed: {e}", ephemeral=True)
+            return
+        if not reloaded:
+            message = f"No files in Data/ changed; still on data version `{old_version[:12]}`."
+        else:
+            new_version = get_catalog().version
+            message = f"Reloaded the game data: version `{old_version[:12]}` → `{new_version[:12]}`."
+        await interaction.followup.send(message, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(CacheStatsCog(bot))
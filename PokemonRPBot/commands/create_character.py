@@ -8,6 +8,8 @@ from data_loader import load_pokemon_data
 from emojis import get_type_emoji
 from ranks import get_rank  # Import the ranks
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from characters import get_character_store
 
 # Resolve the absolute path to the current script's directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,12 +18,6 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 POKEMON_NEW_DIRECTORY = os.path.join(BASE_DIR, "../Data/pokemon_new")
 POKEMON_OLD_DIRECTORY = os.path.join(BASE_DIR, "../Data/pokemon_old")
 
-# Character storage directory
-CHARACTERS_DIR = os.path.join(BASE_DIR, "../characters/")
-
-if not os.path.exists(CHARACTERS_DIR):
-    os.makedirs(CHARACTERS_DIR)
-
 
 # Helper function to load Pokémon data with priority to new format
 def load_pokemon_data_with_priority(pokemon_species):
@@ -48,12 +44,7 @@ def load_pokemon_data_with_priority(pokemon_species):
 
 # Helper function to load character data
 def load_character_data(user_id: int, guild_id: int, character_name: str):
-    character_file = os.path.join(CHARACTERS_DIR, f"{user_id}_{guild_id}_{character_name.lower()}.json")
-    if os.path.exists(character_file):
-        with open(character_file, 'r') as file:
-            return json.load(file)
-    else:
-        return None
+    return get_character_store().get(user_id, guild_id, character_name)
 
 
 class PermanentSheetView(discord.ui.View):
@@ -113,8 +104,8 @@ class PermanentSheetView(discord.ui.View):
             await interaction.response.send_message("Character data not found.", ephemeral=True)
             return
 
-        filepath = os.path.join(CHARACTERS_DIR, f"{self.user_id}_{self.guild_id}_{self.character_name.lower()}.json")
-        view = StatDistributionView(character_data, filepath, interaction.message, category)
+        character_key = (self.user_id, self.guild_id, self.character_name)
+        view = StatDistributionView(character_data, character_key, interaction.message, category)
         content = view.get_message_content()
         await interaction.response.send_message(
             content=content,
@@ -125,10 +116,10 @@ class PermanentSheetView(discord.ui.View):
 
 class StatDistributionView(discord.ui.View):
     """Interactive view for stat distribution."""
-    def __init__(self, character_data, filepath, main_message, category):
+    def __init__(self, character_data, character_key, main_message, category):
         super().__init__(timeout=None)
         self.character_data = character_data
-        self.filepath = filepath
+        self.character_key = character_key  # (user id, guild id, name) in the character store
         self.main_message = main_message  # Reference to the main message for updating
         self.category = category  # 'battle' or 'social'
         self.unallocated_points = character_data.get(f'unallocated_{category}_points', 0)
@@ -363,9 +354,8 @@ class AcceptStatButton(discord.ui.Button):
         character_data['limit_breaks'][view.category] = view.limit_break_level
         character_data[f'unallocated_{view.category}_points'] = view.unallocated_points
 
-        # Save changes to the JSON file
-        with open(view.filepath, "w") as file:
-            json.dump(character_data, file, indent=4)
+        # Save changes to the character file
+        get_character_store().save(*view.character_key, character_data)
 
         # Update the main message to reflect the finalized state
         await view.update_main_sheet()
@@ -486,20 +476,8 @@ class CreateCharacterCommand(commands.Cog):
     async def autocomplete_pokemon(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached Pokémon names from both new and old directories"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.pokemon_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.pokemon_cache, self.pokemon_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached Pokémon names from both new and old directories"""
+        return autocomplete_choices(self.pokemon_cache, current)
 
     async def autocomplete_gender(
         self, interaction: discord.Interaction, current: str
@@ -534,9 +512,7 @@ class CreateCharacterCommand(commands.Cog):
         user_id = player.id
         guild_id = interaction.guild.id
 
-        character_file = os.path.join(CHARACTERS_DIR, f"{user_id}_{guild_id}_{name.lower()}.json")
-
-        if os.path.exists(character_file):
+        if get_character_store().exists(user_id, guild_id, name):
             await interaction.response.send_message(content=f"A character named **{name}** already exists for {player.mention} in this server.", ephemeral=True)
             return
 
@@ -654,8 +630,7 @@ class CreateCharacterCommand(commands.Cog):
             "limit_breaks": {"battle": 0, "social": 0}
         }
 
-        with open(character_file, "w") as file:
-            json.dump(character_data, file, indent=4)
+        get_character_store().save(user_id, guild_id, name, character_data)
 
         # Prepare the character sheet content
         response = create_character_sheet_content(character_data)
@@ -673,12 +648,7 @@ async def setup(bot):
     await bot.add_cog(CreateCharacterCommand(bot))
 
     # Register persistent views for all existing characters
-    for filename in os.listdir(CHARACTERS_DIR):
-        if filename.endswith('.json'):
-            user_id_str, guild_id_str, character_name = filename[:-5].split('_', 2)
-            user_id = int(user_id_str)
-            guild_id = int(guild_id_str)
-            character_data = load_character_data(user_id, guild_id, character_name)
-            if character_data is not None:
-                view = PermanentSheetView(user_id, guild_id, character_name)
-                bot.add_view(view)
+    for user_id, guild_id, character_name in get_character_store().keys():
+        if guild_id is not None:
+            view = PermanentSheetView(user_id, guild_id, character_name)
+            bot.add_view(view)
@@ -7,6 +7,7 @@ from typing import List
 from helpers import load_move
 from emojis import get_type_emoji, get_category_emoji
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
 
 # Directories for move files
 MOVES_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/moves")
@@ -66,20 +67,8 @@ class CreateMoveCardCommand(commands.Cog):
     async def move_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached move names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.move_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.move_cache, self.move_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached move names"""
+        return autocomplete_choices(self.move_cache, current)
 
     async def bool_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         options = ["True", "False"]
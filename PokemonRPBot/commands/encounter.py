@@ -1,4 +1,6 @@
 import random
+import asyncio
+import io
 import discord
 from discord import app_commands
 from discord.app_commands import Choice
@@ -6,13 +8,18 @@ from discord import ui
 import os
 import json
 import math
+import multiprocessing
 from typing import List
+from concurrent.futures import ProcessPoolExecutor
 
-from .pokemon import normalize_name, find_movelist_filename
+from species import normalize_name, load_species, eligible_species, get_rank_index
 from emojis import get_type_emoji, get_badge_emoji
-from helpers import normalize_keys, load_move, load_ability
+from helpers import load_ability
+from game_data import get_catalog
+from move_features import move_features
 from ranks import get_rank
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
 
 rank_values = {"bronze": 1, "silver": 2, "gold": 3, "platinum": 4, "diamond": 5, "master": 5}
 
@@ -32,19 +39,23 @@ def _load_pokemon_cache():
 
 # Load cache at module import
 _load_pokemon_cache()
+# Build the rank -> species index up front so random encounters never scan Data/pokemon
+get_rank_index()
 
 
 async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type="standard", include_extra=False, evil=False):
+    return build_encounter(level, pokelist, boss, format_type, include_extra, evil)
+
+def build_encounter(level, pokelist, boss, format_type="standard", include_extra=False, evil=False):
+    """Generate the encounter text for each Pokémon in pokelist. Pure CPU work, safe to run in a worker process."""
     smart_stats = boss
     output = ''
     for pokemon_name in pokelist:
         norm = normalize_name(pokemon_name)
-        movelist_file = find_movelist_filename(norm, "Data/pokemon")
-        if not movelist_file:
+        data = load_species(norm)
+        if not data:
             output += f"No data for {pokemon_name}\n"
             continue
-        with open(movelist_file, "r", encoding="utf-8") as f:
-            data = normalize_keys(json.load(f))
         rank = get_rank(level).lower()
         ranks_order = ["bronze", "silver", "gold", "platinum", "diamond", "master"]
         current_index = ranks_order.index(rank) if rank in ranks_order else 0
@@ -73,37 +84,17 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             return random.sample(eligible, needed)
         # Reusable STAB key used in several places
         def compute_stab_key(m):
-            move_data = load_move(m)
-            if not move_data:
+            mf = move_features(m)
+            if not mf:
                 return (-1, -1, -1, -1)
-            move_data = normalize_keys(move_data)
-            try:
-                power = int(move_data.get('power', 0))
-            except (TypeError, ValueError):
-                power = 0
-                damage_str = move_data.get('damage', '')
-                if isinstance(damage_str, str) and '+' in damage_str:
-                    parts = damage_str.split('+')
-                    if parts[1].strip().isdigit():
-                        power = int(parts[1].strip())
-            target = move_data.get('target', '')
-            target_score = 2 if 'All Foes' in target or 'Area' in target else 1
-            effect = move_data.get('effect', '').lower()
-            successive_score = 3 if any(kw in effect for kw in ['successive', 'double', 'triple']) else 0
-            try:
-                crit_score = int(move_data.get('crit', '0'))
-            except ValueError:
-                crit_score = 0
-            if power <= 2 and successive_score == 0 and crit_score == 0:
+            successive_score = 3 if mf.successive else 0
+            if mf.power <= 2 and successive_score == 0 and mf.crit == 0:
                 return (-1, -1, -1, -1)
-            return (power, target_score, successive_score, crit_score)
+            return (mf.power, mf.target_score, successive_score, mf.crit)
         # Safe helper to get a move's category even if the move file is missing
         def move_category(move_name):
-            mv = load_move(move_name)
-            if not mv:
-                return ''
-            mv = normalize_keys(mv)
-            return mv.get('category', '')
+            mf = move_features(move_name)
+            return mf.category if mf else ''
         for i in range(current_index + 1):
             moves_list.extend(data.get("moves", {}).get(ranks_order[i], []))
 
@@ -122,17 +113,13 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             dex_max = 0
         dex_is_offense_cap = dex_max > 6
         for m in moves_list:
-            mv = load_move(m)
-            if not mv:
+            mf = move_features(m)
+            if not mf:
                 continue
-            mv = normalize_keys(mv)
-            cat = mv.get('category', '')
+            cat = mf.category
             if cat in ['Physical', 'Special']:
                 attack_count += 1
-                try:
-                    p = int(mv.get('power', 0))
-                except Exception:
-                    p = 0
+                p = mf.base_power
                 if cat == 'Special':
                     special_count += 1
                     offense_score += p * 1.25
@@ -1006,41 +993,19 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             for m in moves_list:
                 if m in ['Explosion', 'Self Destruct']:
                     continue
-                move_data = load_move(m)
-                if move_data:
-                    move_data = normalize_keys(move_data)
-                    effect = move_data.get('effect', '').lower()
-                    if 'charge' in effect or 'recharge' in effect:
-                        continue
+                mf = move_features(m)
+                if mf and mf.charges:
+                    continue
                 filtered_moves.append(m)
             # Filter out low power moves without keywords
             def is_good_move(m):
-                move_data = load_move(m)
-                if not move_data:
+                mf = move_features(m)
+                if not mf:
                     return False
-                move_data = normalize_keys(move_data)
-                category = move_data.get('category', '')
-                if category not in ['Physical', 'Special']:
+                if mf.category not in ['Physical', 'Special']:
                     return True  # support ok
-                # Prefer numeric 'power' field when available
-                try:
-                    power = int(move_data.get('power', 0))
-                except (TypeError, ValueError):
-                    power = 0
-                    # Fallback: parse damage string for a "+ N" suffix (eg. 'Rank + 3')
-                    damage_str = move_data.get('damage', '')
-                    if isinstance(damage_str, str) and '+' in damage_str:
-                        parts = damage_str.split('+')
-                        if parts[1].strip().isdigit():
-                            power = int(parts[1].strip())
                 # allow multi-hit or high-crit moves to bypass the low-power cutoff
-                effect = move_data.get('effect', '').lower()
-                multi_hit = any(kw in effect for kw in ['successive', 'double', 'triple', 'multi-hit', 'hits'])
-                try:
-                    crit_val = int(move_data.get('crit', '0'))
-                except Exception:
-                    crit_val = 0
-                if power <= 2 and not multi_hit and crit_val == 0:
+                if mf.power <= 2 and not mf.multi_hit and mf.crit == 0:
                     return False
                 return True
             filtered_moves = [m for m in filtered_moves if is_good_move(m)]
@@ -1057,38 +1022,22 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             # Aggressive attack selection: prefer All Foes / Area moves with high power,
             # slightly favour multi-hit (successive) moves and STAB.
             def move_power_and_score(m):
-                mv = load_move(m)
-                if not mv:
+                mf = move_features(m)
+                if not mf:
                     return (-1, -1, -1)
-                mv = normalize_keys(mv)
-                category = mv.get('category', '')
-                if category not in ['Physical', 'Special']:
+                if mf.category not in ['Physical', 'Special']:
                     return (-1, -1, -1)
-                # get numeric power preference
-                try:
-                    p = int(mv.get('power', 0))
-                except (TypeError, ValueError):
-                    p = 0
-                    damage_str = mv.get('damage', '')
-                    if isinstance(damage_str, str) and '+' in damage_str:
-                        parts = damage_str.split('+')
-                        if parts[1].strip().isdigit():
-                            p = int(parts[1].strip())
+                p = mf.power
                 # effect-based bonuses
-                effect = mv.get('effect', '').lower()
-                multi_hit = any(kw in effect for kw in ['successive', 'double', 'triple', 'multi-hit', 'hits'])
+                multi_hit = mf.multi_hit
                 successive_bonus = 150 if multi_hit else 0
-                # detect explicit recoil flag or textual mention
-                recoil_flag = bool(mv.get('recoil', False)) or ('recoil' in effect)
+                # explicit recoil flag or textual mention
+                recoil_flag = mf.recoil
                 # target preference: All Foes/Area gets a boost (we favor multi-target damage)
-                target = mv.get('target', '')
-                target_bonus = 50 if ('All Foes' in target or 'Area' in target) else 0
+                target_bonus = 50 if mf.target_score == 2 else 0
                 # STAB preference
-                stab_bonus = 20 if mv.get('type', '') in data.get('types', []) else 0
-                try:
-                    crit_bonus = int(mv.get('crit', '0')) * 10
-                except Exception:
-                    crit_bonus = 0
+                stab_bonus = 20 if mf.type in data.get('types', []) else 0
+                crit_bonus = mf.crit * 10
                 # If the move causes recoil/self-damage, avoid it unless it meets
                 # a reasonable exception (STAB, very high power, multi-hit, or high crit).
                 if recoil_flag:
@@ -1146,27 +1095,24 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             support_moves = []
             stab_moves = []
             for m in moves_list:
-                move_data = load_move(m)
-                if move_data:
-                    move_data = normalize_keys(move_data)
-                    category = move_data.get('category', '')
-                    if category == 'Support':
+                mf = move_features(m)
+                if mf:
+                    if mf.category == 'Support':
                         support_moves.append(m)
-                    elif category in ['Physical', 'Special']:
+                    elif mf.category in ['Physical', 'Special']:
                         attacking_moves.append(m)
-                        move_type = move_data.get('type', '')
-                        if move_type in data.get('types', []):
+                        if mf.type in data.get('types', []):
                             stab_moves.append(m)
             # Enforce absolute exclusion: if one offensive stat is preferred,
             # drop attacking moves that use the non-preferred offensive stat.
             if highest_stat == 'special':
                 # keep only Special moves
-                attacking_moves = [m for m in attacking_moves if normalize_keys(load_move(m)).get('category','') == 'Special']
-                stab_moves = [m for m in stab_moves if normalize_keys(load_move(m)).get('category','') == 'Special']
+                attacking_moves = [m for m in attacking_moves if move_category(m) == 'Special']
+                stab_moves = [m for m in stab_moves if move_category(m) == 'Special']
             elif highest_stat == 'strength':
                 # keep only Physical moves
-                attacking_moves = [m for m in attacking_moves if normalize_keys(load_move(m)).get('category','') == 'Physical']
-                stab_moves = [m for m in stab_moves if normalize_keys(load_move(m)).get('category','') == 'Physical']
+                attacking_moves = [m for m in attacking_moves if move_category(m) == 'Physical']
+                stab_moves = [m for m in stab_moves if move_category(m) == 'Physical']
             # Use Special Defense (ceil(insight/2)) to determine counts for both
             spdef_count = math.ceil(new_vals.get('insight', 0) / 2)
             num_attacking = spdef_count
@@ -1182,10 +1128,9 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
                 if tup[0] < 0:
                     return tup
                 # Heavily penalize moves that use the non-preferred offensive stat
-                mv = load_move(m)
-                if mv:
-                    mv = normalize_keys(mv)
-                    cat = mv.get('category', '')
+                mf = move_features(m)
+                if mf:
+                    cat = mf.category
                     if (cat == 'Physical' and non_preferred_stat == 'strength') or (cat == 'Special' and non_preferred_stat == 'special'):
                         # return a very low tuple to push this move to the bottom
                         return (-99999, -99999, -99999, -99999)
@@ -1195,27 +1140,14 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             remaining_attacking = num_attacking - len(chosen_stab)
             candidate = [m for m in attacking_moves if m not in selected_moves]
             def candidate_key(m):
-                move_data = load_move(m)
-                if not move_data:
+                mf = move_features(m)
+                if not mf:
                     return -1
-                move_data = normalize_keys(move_data)
-                category = move_data.get('category', '')
+                category = mf.category
                 if category in ['Physical', 'Special']:
-                    try:
-                        damage_str = move_data.get('damage', '0')
-                        if '+' in damage_str:
-                            parts = damage_str.split('+')
-                            power = int(parts[1].strip()) if parts[1].strip().isdigit() else 0
-                        else:
-                            power = int(damage_str)
-                    except ValueError:
-                        power = 0
-                    effect = move_data.get('effect', '').lower()
-                    successive_bonus = 100 if any(kw in effect for kw in ['successive', 'double', 'triple']) else 0
-                    try:
-                        crit_bonus = int(move_data.get('crit', '0')) * 10
-                    except ValueError:
-                        crit_bonus = 0
+                    power = mf.damage_power
+                    successive_bonus = 100 if mf.successive else 0
+                    crit_bonus = mf.crit * 10
                     # If this move uses the non-preferred offensive stat, heavily penalize it
                     if (category == 'Physical' and non_preferred_stat == 'strength') or (category == 'Special' and non_preferred_stat == 'special'):
                         return -999999
@@ -1227,21 +1159,18 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             # If we couldn't find enough attacking moves in the filtered pool
             # and we have an original pool (pre-evil filters), try to pull
             # attacking moves from there to meet the minimum requirement.
-            if len([m for m in selected_moves if load_move(m) and move_category(m) in ['Physical','Special']]) < num_attacking and original_moves_list is not None:
-                needed = num_attacking - len([m for m in selected_moves if load_move(m) and move_category(m) in ['Physical','Special']])
+            if len([m for m in selected_moves if move_category(m) in ['Physical','Special']]) < num_attacking and original_moves_list is not None:
+                needed = num_attacking - len([m for m in selected_moves if move_category(m) in ['Physical','Special']])
                 fallback_candidates = []
                 for m in original_moves_list:
                     if m in selected_moves:
                         continue
-                    mv = load_move(m)
-                    if not mv:
-                        continue
-                    mv = normalize_keys(mv)
-                    if mv.get('category','') in ['Physical','Special']:
+                    category = move_category(m)
+                    if category in ['Physical','Special']:
                         # respect preferred offensive stat when selecting fallbacks
-                        if highest_stat == 'special' and mv.get('category','') != 'Special':
+                        if highest_stat == 'special' and category != 'Special':
                             continue
-                        if highest_stat == 'strength' and mv.get('category','') != 'Physical':
+                        if highest_stat == 'strength' and category != 'Physical':
                             continue
                         fallback_candidates.append(m)
                 # rank fallback candidates by same candidate_key
@@ -1251,12 +1180,8 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
             # Choose support moves equal to Special Defense
             num_support = min(spdef_count, len(support_moves))
             def support_key(m):
-                move_data = load_move(m)
-                if not move_data:
-                    return False
-                move_data = normalize_keys(move_data)
-                acc = move_data.get('accuracy', '').lower()
-                return 'insight' in acc
+                mf = move_features(m)
+                return bool(mf and mf.insight_accuracy)
             # choose support moves with some randomness among top candidates
             support_candidates = [m for m in support_moves if m not in selected_moves]
             chosen_support = pick_from_top(support_candidates, lambda m: 1 if support_key(m) else 0, num_support)
@@ -1341,9 +1266,8 @@ async def pkmn_encounter(ctx, number, level, pokelist, boss, guild, format_type=
                 except Exception:
                     pass
             for move_name in selected_moves:
-                move_data = load_move(move_name)
+                move_data = get_catalog().get('moves', move_name, normalized=True)
                 if move_data:
-                    move_data = normalize_keys(move_data)
                     move_type = move_data.get('type', 'Normal')
                     category = move_data.get('category', 'Physical')
                     target = move_data.get('target', 'Foe')
@@ -1611,20 +1535,8 @@ async def send_big_msg(ctx, arg, wrap_in_code_block, view):
 
 SLASH_COMMANDS = []
 async def pokemon_autocomplete(interaction, current: str):
-    """Fast autocomplete using cached Pokémon names"""
-    if not current:
-        return [app_commands.Choice(name=name, value=name) for name in _pokemon_cache[:25]]
-    
-    current_lower = current.lower()
-    matches = []
-    
-    for name, name_lower in zip(_pokemon_cache, _pokemon_cache_lower):
-        if current_lower in name_lower:
-            matches.append(app_commands.Choice(name=name, value=name))
-            if len(matches) >= 25:
-                break
-    
-    return matches
+    """Ranked autocomplete over cached Pokémon names"""
+    return autocomplete_choices(_pokemon_cache, current)
 
 @app_commands.command(
     name = 'encounter',
@@ -1675,29 +1587,9 @@ async def encounter_slash(
 
     # If no pokemon specified, pick random ones for the given level
     if pokemon == '':
-        # Get list of all pokemon names from Data/pokemon that have moves for the selected rank
-        folder = "Data/pokemon"
-        if os.path.exists(folder):
-            all_pokemon = []
-            rank_lower = rank.lower()
-            ranks_order = ["bronze", "silver", "gold", "platinum", "diamond", "master"]
-            current_index = ranks_order.index(rank_lower) if rank_lower in ranks_order else 0
-            for filename in os.listdir(folder):
-                if filename.endswith(".json"):
-                    name = filename[:-5]
-                    filepath = os.path.join(folder, filename)
-                    try:
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            data = normalize_keys(json.load(f))
-                            moves = data.get("moves", {})
-                            has_moves = any(moves.get(r, []) for r in ranks_order[:current_index + 1])
-                            if has_moves:
-                                all_pokemon.append(name)
-                    except Exception:
-                        pass
-            pokelist = random.sample(all_pokemon, number) if all_pokemon else []
-        else:
-            pokelist = []
+        # Pick from the species that have moves for the selected rank
+        all_pokemon = eligible_species(rank)
+        pokelist = random.sample(all_pokemon, number) if all_pokemon else []
     else:
         pokelist = pokemon.split(', ')
 
@@ -1727,5 +1619,176 @@ async def encounter_slash(
         except Exception as e:
             msg += f'Error generating encounter for {pokemon_name}: {e}\n'
     await send_big_msg(ctx=inter, arg=msg, wrap_in_code_block=wrap_in_code_block, view=None)
+# ---- Bulk encounters ----
+
+BULK_MAX_ENCOUNTERS = 100
+BULK_MAX_WORKERS = 4
+BULK_PROGRESS_EVERY = 10  # edit the progress message after this many finished encounters
+
+_bulk_pool = None
+_bulk_pool_version = None
+
+def _get_bulk_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by every bulk request, started on first use and
+    replaced when the game data changes, since workers keep the catalog
+    they started with.
+    """
+    global _bulk_pool, _bulk_pool_version
+    version = get_catalog().version
+    if _bulk_pool is not None and _bulk_pool_version != version:
+        # Requests already queued on the old pool still finish there
+        _bulk_pool.shutdown(wait=False)
+        _bulk_pool = None
+        print("[Encounter] Game data changed, restarting bulk pool")
+    if _bulk_pool is None:
+        workers = max(1, min(BULK_MAX_WORKERS, (os.cpu_count() or 2) - 1))
+        # Fork where the platform has it, so workers never re-import bot.py
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = None
+        _bulk_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        _bulk_pool_version = version
+        print(f"[Encounter] Started bulk pool with {workers} worker(s)")
+    return _bulk_pool
+
+def _bulk_worker(pokemon_name, level, smart_stats, format_type, include_extra, evil):
+    """Runs in a worker process: one encounter, returned as plain text."""
+    return build_encounter(level, [pokemon_name], smart_stats, format_type, include_extra, evil)
+
+def _bulk_markdown(results, level) -> str:
+    parts = [f"# Encounters (Level {level})\n"]
+    for number, (pokemon_name, text) in enumerate(results, start=1):
+        parts.append(f"<!-- {number}. {pokemon_name} -->\n{text.strip()}\n")
+    return "\n".join(parts)
+
+def _bulk_json(results, level) -> str:
+    return json.dumps({
+        "level": level,
+        "encounters": [
+            {"number": number, "pokemon": pokemon_name, "text": text.strip()}
+            for number, (pokemon_name, text) in enumerate(results, start=1)
+        ],
+    }, ensure_ascii=False, indent=2)
+
+@app_commands.command(
+    name = 'encounter_bulk',
+    description = f'Generate up to {BULK_MAX_ENCOUNTERS} encounters at once, delivered as a file'
+)
+@app_commands.describe(
+    number = f"How many encounters? (up to {BULK_MAX_ENCOUNTERS})",
+    pokemon = "Which pokemon? Comma separated, cycled through (leave blank for random)",
+    level = "What level? (Default: 1)",
+    include_extra = "Include TM, Egg, or Tutor moves? (Default: No)",
+    format_type = "How to format the encounter info",
+    smart_stats = "Use the improved stat distribution? (Default: False)",
+    evil_mode = "Use evil mode for move selection? (Default: False)",
+    file_format = "Attachment format (Default: Markdown)"
+)
+@app_commands.choices(
+    include_extra = [
+        Choice(name = 'Yes', value = 1),
+        Choice(name = 'No', value = 0),
+    ],
+    format_type = [
+        Choice(name = 'Standard', value = 'standard'),
+        Choice(name = 'Detailed', value = 'detailed'),
+    ],
+    smart_stats = [
+        Choice(name = 'Yes', value = 1),
+        Choice(name = 'No', value = 0),
+    ],
+    evil_mode = [
+        Choice(name = 'Yes', value = 1),
+        Choice(name = 'No', value = 0),
+    ],
+    file_format = [
+        Choice(name = 'Markdown', value = 'md'),
+        Choice(name = 'JSON', value = 'json'),
+    ]
+)
+@app_commands.autocomplete(pokemon = pokemon_autocomplete)
+async def encounter_bulk_slash(
+    inter: discord.Interaction,
+    number: app_commands.Range[int, 1, BULK_MAX_ENCOUNTERS] = 20,
+    pokemon: str = '',
+    level: app_commands.Range[int, 1, 999999] = 1,
+    include_extra: int = 0,
+    format_type: str = 'standard',
+    smart_stats: int = 0,
+    evil_mode: int = 0,
+    file_format: str = 'md'
+):
+    if pokemon == '':
+        all_pokemon = eligible_species(get_rank(level))
+        if not all_pokemon:
+            await inter.response.send_message(f'No Pokémon available for level {level}.', ephemeral=True)
+            return
+        pokelist = random.sample(all_pokemon, min(number, len(all_pokemon)))
+    else:
+        names = [name.strip() for name in pokemon.split(',') if name.strip()]
+        if not names:
+            await inter.response.send_message('No valid Pokémon found for the specified names.', ephemeral=True)
+            return
+        pokelist = [names[i % len(names)] for i in range(number)]
+
+    await inter.response.defer(thinking=True)
+
+    # Every encounter is generated in the process pool; the event loop only
+    # awaits the futures and reports progress as they complete.
+    loop = asyncio.get_running_loop()
+    pool = _get_bulk_pool()
+    futures = {
+        loop.run_in_executor(
+            pool, _bulk_worker, pokemon_name, level, bool(smart_stats),
+            format_type, bool(include_extra), bool(evil_mode)
+        ): idx
+        for idx, pokemon_name in enumerate(pokelist)
+    }
+    results = [None] * len(pokelist)
+    progress = None
+    done_count = 0
+    pending = set(futures)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            idx = futures[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                text = f'Error generating encounter for {pokelist[idx]}: {e}\n'
+            results[idx] = (pokelist[idx], text)
+            done_count += 1
+            if done_count % BULK_PROGRESS_EVERY == 0 and pending:
+                content = f'Generating encounters... {done_count}/{len(pokelist)}'
+                try:
+                    if progress is None:
+                        progress = await inter.followup.send(content, wait=True)
+                    else:
+                        await progress.edit(content=content)
+                except discord.HTTPException:
+                    pass
+
+    if file_format == 'json':
+        payload = _bulk_json(results, level)
+    else:
+        payload = _bulk_markdown(results, level)
+    filename = f"encounters_lv{level}.{file_format}"
+    attachment = discord.File(io.BytesIO(payload.encode('utf-8')), filename=filename)
+    await inter.followup.send(f'Generated {len(results)} encounter(s) at level {level}.', file=attachment)
+    if progress is not None:
+        try:
+            await progress.delete()
+        except discord.HTTPException:
+            pass
+
 async def setup(bot):
-    bot.tree.add_command(encounter_slash)
\ No newline at end of file
+    bot.tree.add_command(encounter_slash)
+    bot.tree.add_command(encounter_bulk_slash)
+
+async def teardown(bot):
+    global _bulk_pool
+    if _bulk_pool is not None:
+        _bulk_pool.shutdown(wait=False, cancel_futures=True)
+        _bulk_pool = None
\ No newline at end of file
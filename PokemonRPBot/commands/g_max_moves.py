@@ -2,53 +2,24 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
 from typing import List
 from helpers import load_move
 from emojis import get_type_emoji, get_category_emoji
 from .max_moves import get_move_field, load_max_guard
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from max_move_index import get_max_move_index
 
 # Directories
 BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
-G_MAX_MOVES_DIRECTORY = os.path.join(BASE_DIR, "Data", "g_max_moves")
 MOVES_DIRECTORY = os.path.join(BASE_DIR, "Data", "moves")
 
 
 def load_g_max_move_for_type(type_name: str):
+    """Return the G-Max Move for type_name (case-insensitive) from the prebuilt type map, or None."""
     if not type_name:
         return None
-    wanted = type_name.lower()
-    for fname in os.listdir(G_MAX_MOVES_DIRECTORY):
-        if not fname.lower().endswith('.json'):
-            continue
-        path = os.path.join(G_MAX_MOVES_DIRECTORY, fname)
-        try:
-            with open(path, 'r', encoding='utf-8') as fh:
-                data = json.load(fh)
-        except Exception:
-            continue
-
-        candidates = data if isinstance(data, list) else [data]
-        for mv in candidates:
-            mv_type = get_move_field(mv, 'type')
-            if not mv_type:
-                continue
-            if isinstance(mv_type, str):
-                if wanted == mv_type.lower() or wanted in mv_type.lower():
-                    return mv
-            elif isinstance(mv_type, list):
-                if any(wanted == t.lower() or wanted in t.lower() for t in mv_type if isinstance(t, str)):
-                    return mv
-
-        # fallback: filename contains the type name
-        if wanted in fname.lower():
-            if isinstance(data, dict):
-                return data
-            elif isinstance(data, list) and data:
-                return data[0]
-    return None
-
+    return get_max_move_index().g_max_by_type.get(type_name.lower())
 
 class GMaxCommand(commands.Cog):
     def __init__(self, bot):
@@ -67,20 +38,8 @@ class GMaxCommand(commands.Cog):
         )
 
     async def _gmax_move_autocomplete(self, interaction: discord.Interaction, current: str):
-        """Fast autocomplete using cached move names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.move_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.move_cache, self.move_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached move names"""
+        return autocomplete_choices(self.move_cache, current)
 
     @app_commands.command(name='gmax_move', description='Display G-Max move for a move (by type).')
     @app_commands.autocomplete(move=_gmax_move_autocomplete)
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import math
 import re
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
+from state_store import get_state_store
+
 
 class GMTime(commands.Cog):
     """Cog providing GM time-tracking and currency-management slash commands."""
@@ -20,15 +20,11 @@ class GMTime(commands.Cog):
     POKE_PER_HOUR:   int = 225
     CREDITS_PER_HOUR = 100
 
-    DATA_DIR  = Path("Data")
-    DATA_FILE = DATA_DIR / "gm_time.json"
-
     # ────────────────────────────── init / setup ──────────────────────────────
     def __init__(self, bot: commands.Bot):
         self.bot  = bot
         self.lock = asyncio.Lock()
         self.data: Dict[str, Dict[str, Any]] = {}
-        self._ensure_data_file()
         self._load_data()
 
     # ───────────────────────────── helper view ────────────────────────────────
@@ -79,7 +75,7 @@ class GMTime(commands.Cog):
             profile["exp"]     += exp_gain
             profile["poke"]    += poke_gain
             profile["credits"] += credits_gain
-            await self.cog._save_data()
+            await self.cog._save_profile(self.author_id)
 
             # acknowledge
             await interaction.response.defer()  # instant ack
@@ -133,22 +129,13 @@ class GMTime(commands.Cog):
         minutes = float(m.group("minutes") or 0)
         return hours + minutes / 60
 
-    def _ensure_data_file(self) -> None:
-        self.DATA_DIR.mkdir(exist_ok=True)
-        if not self.DATA_FILE.exists():
-            self.DATA_FILE.write_text("{}", encoding="utf-8")
-
     def _load_data(self) -> None:
-        try:
-            with self.DATA_FILE.open("r", encoding="utf-8") as fp:
-                self.data = json.load(fp)
-        except (IOError, json.JSONDecodeError):
-            self.data = {}
+        self.data = get_state_store().load_gm_profiles()
 
-    async def _save_data(self) -> None:
+    async def _save_profile(self, user_id: int) -> None:
+        """Write one GM's row to the state database."""
         async with self.lock:
-            with self.DATA_FILE.open("w", encoding="utf-8") as fp:
-                json.dump(self.data, fp, ensure_ascii=False, indent=4)
+            get_state_store().save_gm_profile(user_id, self._get_or_create_profile(user_id))
 
     def _get_or_create_profile(self, user_id: int) -> Dict[str, Any]:
         uid = str(user_id)
@@ -202,7 +189,7 @@ class GMTime(commands.Cog):
         profile["exp"]     += exp_gain
         profile["poke"]    += poke_gain
         profile["credits"] += credits_gain
-        await self._save_data()
+        await self._save_profile(interaction.user.id)
 
         # 4. final acknowledgement
         await interaction.response.send_message(
@@ -275,7 +262,7 @@ class GMTime(commands.Cog):
             return
 
         profile["credits"] -= amount
-        await self._save_data()
+        await self._save_profile(interaction.user.id)
         await interaction.response.send_message(
             f"Spent **{amount}** GM Credits. You have **{profile['credits']}** left."
         )
@@ -294,7 +281,7 @@ class GMTime(commands.Cog):
             return
 
         profile["poke"] -= amount
-        await self._save_data()
+        await self._save_profile(interaction.user.id)
         await interaction.response.send_message(
             f"Spent **{amount}** GM Poke. You have **{profile['poke']}** left."
         )
@@ -0,0 +1,56 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from autocomplete import autocomplete_choices
+from learner_index import get_learner_index, SOURCE_LABELS
+from pagination import PageView, paginate_lines
+from species import RANK_ORDER
+
+class LearnedByCog(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def move_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Ranked autocomplete over every move some species can learn"""
+        return autocomplete_choices(get_learner_index().move_names, current)
+
+    @app_commands.command(name="learned_by", description="List the Pokémon that can learn a move.")
+    @app_commands.describe(
+        move="The move to look up.",
+        rank="Only count rank-up moves learned at this rank or earlier.",
+        source="Only count one way of learning the move."
+    )
+    @app_commands.autocomplete(move=move_autocomplete)
+    @app_commands.choices(
+        rank=[app_commands.Choice(name=rank.title(), value=rank) for rank in RANK_ORDER],
+        source=[app_commands.Choice(name=label, value=source) for source, label in SOURCE_LABELS.items()]
+    )
+    async def learned_by(
+        self,
+        interaction: discord.Interaction,
+        move: str,
+        rank: str = None,
+        source: str = None
+    ):
+        move_name, learners = get_learner_index().learners(move, rank=rank, source=source)
+        if not learners:
+            await interaction.response.send_message(
+                f"No Pokémon learn **{move_name}** with those filters.", ephemeral=True
+            )
+            return
+
+        # One line per species, listing every way it learns the move
+        by_species = {}
+        for learner in learners:
+            by_species.setdefault(learner.species, []).append(learner.label)
+        lines = [f"**{species}** — {', '.join(labels)}" for species, labels in by_species.items()]
+
+        header = f"### {move_name} is learned by {len(by_species)} Pokémon"
+        pages = paginate_lines(lines, header)
+        if len(pages) == 1:
+            await interaction.response.send_message(pages[0])
+        else:
+            await interaction.response.send_message(pages[0], view=PageView(pages, interaction.user.id))
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(LearnedByCog(bot))
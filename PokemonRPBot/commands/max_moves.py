@@ -2,30 +2,17 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
 from typing import List
 from helpers import load_move, ParsedRollQuery
 from emojis import get_type_emoji, get_category_emoji
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from characters import load_user_stats
+from max_move_index import get_max_move_index
 
-# Directories for move files and character files
+# Directories for move files
 BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
-MAX_MOVES_DIRECTORY = os.path.join(BASE_DIR, "Data", "max_moves")
 MOVES_DIRECTORY = os.path.join(BASE_DIR, "Data", "moves")
-CHARACTERS_DIRECTORY = os.path.join(BASE_DIR, "Characters")
-
-def load_user_stats(user_id: int):
-    """Load user stats from a JSON file in the Characters directory."""
-    files = os.listdir(CHARACTERS_DIRECTORY)
-    matching_file = next(
-        (f for f in files if f.startswith(f"{user_id}_") and f.endswith(".json")),
-        None
-    )
-    if not matching_file:
-        return None
-    stats_file = os.path.join(CHARACTERS_DIRECTORY, matching_file)
-    with open(stats_file, "r") as file:
-        return json.load(file)
 
 def build_dice_query(dice_count: int):
     """Build a query string for ParsedRollQuery based on the number of dice."""
@@ -78,73 +65,18 @@ def get_move_field(move: dict, field: str, alt_field: str = None):
 
     return None
 
-# New helper: find a max move that matches a given type
 def load_max_move_for_type(type_name: str):
-    """Scan MAX_MOVES_DIRECTORY for a max move that matches type_name.
+    """Return the Max Move for type_name (case-insensitive), or None.
 
-    The max-move JSON files in this project use lowercase keys such as
-    "type", "name", "description", "damage", "accuracy", "effect",
-    and "category". This function looks up the "type" field (or variants)
-    and performs a case-insensitive match. As a final fallback it also
-    checks whether the filename contains the type name.
+    Looked up in the prebuilt type map, which never contains Max Guard.
     """
     if not type_name:
         return None
-    wanted = type_name.lower()
-    for fname in os.listdir(MAX_MOVES_DIRECTORY):
-        if not fname.lower().endswith(".json"):
-            continue
-        # Exclude explicit Max Guard files from type-based selection by filename
-        if "max guard" in fname.lower():
-            continue
-        path = os.path.join(MAX_MOVES_DIRECTORY, fname)
-        try:
-            with open(path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except Exception:
-            continue
-
-        candidates = data if isinstance(data, list) else [data]
-
-        for mv in candidates:
-            mv_type = get_move_field(mv, "type")
-            if not mv_type:
-                continue
-            # (Do not exclude by category; Max Guard files should be excluded by filename only.)
-            # mv_type may be like "Electric" or a list - normalize to string
-            if isinstance(mv_type, str):
-                if wanted == mv_type.lower() or wanted in mv_type.lower():
-                    return mv
-            elif isinstance(mv_type, list):
-                if any(wanted == t.lower() or wanted in t.lower() for t in mv_type if isinstance(t, str)):
-                    return mv
-
-        # fallback: filename contains the type name
-        if wanted in fname.lower():
-            if isinstance(data, dict):
-                return data
-            elif isinstance(data, list) and data:
-                return data[0]
-    return None
-
+    return get_max_move_index().max_by_type.get(type_name.lower())
 
 def load_max_guard():
-    """Load the special 'Max Guard' max-move file directly.
-
-    Return the JSON dict for Max Guard if present, else None.
-    """
-    fname = os.path.join(MAX_MOVES_DIRECTORY, "Max Guard.json")
-    if not os.path.exists(fname):
-        # try case-insensitive search
-        for f in os.listdir(MAX_MOVES_DIRECTORY):
-            if f.lower().startswith("max guard") and f.lower().endswith(".json"):
-                fname = os.path.join(MAX_MOVES_DIRECTORY, f)
-                break
-    try:
-        with open(fname, "r", encoding="utf-8") as fh:
-            return json.load(fh)
-    except Exception:
-        return None
+    """Return the JSON dict for the special 'Max Guard' max move, or None."""
+    return get_max_move_index().max_guard
 
 class MaxMoveCommand(commands.Cog):
     def __init__(self, bot):
@@ -165,20 +97,8 @@ class MaxMoveCommand(commands.Cog):
     async def move_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached move names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.move_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.move_cache, self.move_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached move names"""
+        return autocomplete_choices(self.move_cache, current)
 
     @app_commands.command(
         name="max_move", 
@@ -193,7 +113,7 @@ class MaxMoveCommand(commands.Cog):
             )
             return
 
-        user_stats = load_user_stats(interaction.user.id)
+        user_stats = load_user_stats(interaction.user.id, interaction.guild_id)
 
         # Retrieve move fields using the helper to support both key formats.
         move_name_field = get_move_field(move_obj, "Name")
@@ -1,18 +1,12 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import os
-import json
 import random
+from state_store import get_state_store
 
 class Moody(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_folder = "Data"
-
-        # Ensure the folder exists
-        if not os.path.exists(self.data_folder):
-            os.makedirs(self.data_folder)
 
     def simulate_moody(self, stats):
         """Simulate Moody's effect on a Pokémon's stats."""
@@ -41,16 +35,8 @@ class Moody(commands.Cog):
 
     async def autocomplete_pokemon_name(self, interaction: discord.Interaction, current: str):
         """Autocomplete Pokémon names based on the user's saved Pokémon."""
-        user_id = str(interaction.user.id)
-        file_path = os.path.join(self.data_folder, f"{user_id}_stats.json")
-
-        # Check if the file exists
-        if not os.path.exists(file_path):
-            return []
-
         # Load Pokémon names
-        with open(file_path, "r") as file:
-            data = json.load(file)
+        data = get_state_store().get_moody_stats(interaction.user.id)
 
         # Filter Pokémon names based on user input
         return [
@@ -62,21 +48,18 @@ class Moody(commands.Cog):
     @app_commands.command(name="moody", description="Simulate Moody for your Pokémon or reset its stats.")
     @app_commands.autocomplete(pokemon_name=autocomplete_pokemon_name)
     async def moody(self, interaction: discord.Interaction, pokemon_name: str, reset: bool = False):
-        user_id = str(interaction.user.id)
-        file_path = os.path.join(self.data_folder, f"{user_id}_stats.json")
+        user_id = interaction.user.id
+        store = get_state_store()
+
+        # Load Pokémon stats
+        data = store.get_moody_stats(user_id)
 
-        # If the file doesn't exist, create it with a sample Pokémon's stats
-        if not os.path.exists(file_path):
+        # If the user has no Pokémon yet, create this one with zeroed stats
+        if not data:
             stats = {"Strength": 0, "Dexterity": 0, "Special": 0, "Defense": 0, "Special Defense": 0}
+            store.save_moody_stats(user_id, pokemon_name, stats)
             data = {pokemon_name: stats}
 
-            with open(file_path, "w") as file:
-                json.dump(data, file, indent=4)
-
-        # Load Pokémon stats
-        with open(file_path, "r") as file:
-            data = json.load(file)
-
         # Get stats for the specified Pokémon
         if pokemon_name not in data:
             await interaction.response.send_message(
@@ -90,8 +73,7 @@ class Moody(commands.Cog):
         if reset:
             # Reset stats to zero
             data[pokemon_name] = {"Strength": 0, "Dexterity": 0, "Special": 0, "Defense": 0, "Special Defense": 0}
-            with open(file_path, "w") as file:
-                json.dump(data, file, indent=4)
+            store.save_moody_stats(user_id, pokemon_name, data[pokemon_name])
 
             non_zero_stats = {}  # Initialize as empty since stats are reset
             await interaction.response.send_message(
@@ -105,8 +87,7 @@ class Moody(commands.Cog):
 
         # Save the updated stats
         data[pokemon_name] = stats
-        with open(file_path, "w") as file:
-            json.dump(data, file, indent=4)
+        store.save_moody_stats(user_id, pokemon_name, stats)
 
         # Filter stats to only show non-zero values
         non_zero_stats = {key: value for key, value in stats.items() if value != 0}
@@ -2,28 +2,16 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
 from helpers import load_move, ParsedRollQuery
 from emojis import get_type_emoji, get_category_emoji
 from typing import List
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from response_cache import get_response_cache
+from characters import load_user_stats
 
-# Directories for move files and character files
+# Directories for move files
 MOVES_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/moves")
-CHARACTERS_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Characters")
-
-def load_user_stats(user_id: int):
-    """Load user stats from a JSON file in the Characters directory."""
-    files = os.listdir(CHARACTERS_DIRECTORY)
-    matching_file = next(
-        (f for f in files if f.startswith(f"{user_id}_") and f.endswith(".json")),
-        None
-    )
-    if not matching_file:
-        return None
-    stats_file = os.path.join(CHARACTERS_DIRECTORY, matching_file)
-    with open(stats_file, "r") as file:
-        return json.load(file)
 
 def build_dice_query(dice_count: int):
     """Build a query string for ParsedRollQuery based on the number of dice."""
@@ -38,6 +26,41 @@ def get_move_field(move: dict, field: str, alt_field: str = None):
         alt_field = field.lower()
     return move.get(field) or move.get(alt_field)
 
+def render_move(name: str):
+    """The /move response for `name`, or None if there is no such move."""
+    move = load_move(name)
+    if move is None:
+        return None
+
+    # Retrieve move fields using the helper to support both key formats.
+    move_name_field = get_move_field(move, "Name")
+    type_field = get_move_field(move, "Type")
+    category_field = get_move_field(move, "Category")
+    description_field = get_move_field(move, "Description")
+    target_field = get_move_field(move, "Target")
+    effect_field = get_move_field(move, "Effect")
+    damage_field = get_move_field(move, "Damage1", "damage")
+    power_field = get_move_field(move, "Power", "power")
+    accuracy_field = get_move_field(move, "Accuracy1", "accuracy")
+
+    # Get emojis for the move's type and category
+    type_icon = get_type_emoji(type_field)
+    category_icon = get_category_emoji(category_field)
+
+    # Build the move description text
+    move_description = f"""
+### {move_name_field}
+*{description_field}*
+**Type**: {type_icon} {type_field} — **{category_icon} {category_field}**
+**Target**: {target_field}
+"""
+    if damage_field:
+        move_description += f"**Damage Dice**: {damage_field} + {power_field}\n"
+    move_description += f"""**Accuracy Dice**: {accuracy_field} + Rank
+**Effect**: {effect_field}
+"""
+    return move_description
+
 class MoveCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -57,22 +80,8 @@ class MoveCommand(commands.Cog):
     async def move_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached move names"""
-        if not current:
-            # Return first 25 if no input
-            return [app_commands.Choice(name=name, value=name) for name in self.move_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        # Use zip with pre-computed lowercase list for faster comparison
-        for name, name_lower in zip(self.move_cache, self.move_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:  # Stop as soon as we have 25
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached move names"""
+        return autocomplete_choices(self.move_cache, current)
 
     @app_commands.command(
         name="move", 
@@ -80,42 +89,14 @@ class MoveCommand(commands.Cog):
     )
     @app_commands.autocomplete(move=move_name_autocomplete)
     async def move(self, interaction: discord.Interaction, move: str):
-        move = load_move(move)
-        if move is None:
+        move_description = get_response_cache().get_or_render("move", move, lambda: render_move(move))
+        if move_description is None:
             await interaction.response.send_message(
                 f"Move '{move}' not found.", ephemeral=True
             )
             return
 
-        user_stats = load_user_stats(interaction.user.id)
-
-        # Retrieve move fields using the helper to support both key formats.
-        move_name_field = get_move_field(move, "Name")
-        type_field = get_move_field(move, "Type")
-        category_field = get_move_field(move, "Category")
-        description_field = get_move_field(move, "Description")
-        target_field = get_move_field(move, "Target")
-        effect_field = get_move_field(move, "Effect")
-        damage_field = get_move_field(move, "Damage1", "damage")
-        power_field = get_move_field(move, "Power", "power")
-        accuracy_field = get_move_field(move, "Accuracy1", "accuracy")
-
-        # Get emojis for the move's type and category
-        type_icon = get_type_emoji(type_field)
-        category_icon = get_category_emoji(category_field)
-
-        # Build the move description text
-        move_description = f"""
-### {move_name_field}
-*{description_field}*
-**Type**: {type_icon} {type_field} — **{category_icon} {category_field}**
-**Target**: {target_field}
-"""
-        if damage_field:
-            move_description += f"**Damage Dice**: {damage_field} + {power_field}\n"
-        move_description += f"""**Accuracy Dice**: {accuracy_field} + Rank
-**Effect**: {effect_field}
-"""
+        user_stats = load_user_stats(interaction.user.id, interaction.guild_id)
 
         # For now, just send the move description without interactive buttons.
         await interaction.response.send_message(move_description)
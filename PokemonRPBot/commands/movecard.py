@@ -2,28 +2,15 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
 from typing import List
 from helpers import load_move, ParsedRollQuery
 from emojis import get_type_emoji, get_category_emoji
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from characters import load_user_stats
 
-# Directories for move files and character files
+# Directories for move files
 MOVECARD_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/movecards")
-CHARACTERS_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Characters")
-
-def load_user_stats(user_id: int):
-    """Load user stats from a JSON file in the Characters directory."""
-    files = os.listdir(CHARACTERS_DIRECTORY)
-    matching_file = next(
-        (f for f in files if f.startswith(f"{user_id}_") and f.endswith(".json")),
-        None
-    )
-    if not matching_file:
-        return None
-    stats_file = os.path.join(CHARACTERS_DIRECTORY, matching_file)
-    with open(stats_file, "r") as file:
-        return json.load(file)
 
 def build_dice_query(dice_count: int):
     """Build a query string for ParsedRollQuery based on the number of dice."""
@@ -57,20 +44,8 @@ class MoveCommand(commands.Cog):
     async def move_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached movecard names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.movecard_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.movecard_cache, self.movecard_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached movecard names"""
+        return autocomplete_choices(self.movecard_cache, current)
 
     @app_commands.command(
         name="move", 
@@ -85,7 +60,7 @@ class MoveCommand(commands.Cog):
             )
             return
 
-        user_stats = load_user_stats(interaction.user.id)
+        user_stats = load_user_stats(interaction.user.id, interaction.guild_id)
 
         # Retrieve move fields using the helper to support both key formats.
         move_name_field = get_move_field(move, "Name")
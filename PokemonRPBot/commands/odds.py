@@ -0,0 +1,54 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from helpers import DEFAULT_CRIT_DIE_COUNT
+from probability import attack_odds, at_least, percent
+
+# How many "at least N successes" rows to show for the damage pool
+MAX_DAMAGE_ROWS = 10
+
+class OddsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="odds",
+        description="Exact chances to hit and crit with a given accuracy pool."
+    )
+    @app_commands.describe(
+        accuracy_dice="How many accuracy dice are rolled?",
+        accuracy_reduction="Accuracy reduction (defaults to 0).",
+        crit_6_count="How many 6's are required to crit.",
+        damage_dice="Optionally, how many damage dice are rolled on a hit?",
+    )
+    async def odds(
+        self,
+        interaction: discord.Interaction,
+        accuracy_dice: app_commands.Range[int, 1, 40],
+        accuracy_reduction: app_commands.Range[int, 0, 10] = 0,
+        crit_6_count: app_commands.Range[int, 0, 5] = None,
+        damage_dice: app_commands.Range[int, 0, 40] = 0,
+    ):
+        crit_6_count = crit_6_count if crit_6_count is not None else DEFAULT_CRIT_DIE_COUNT
+        result = attack_odds(accuracy_dice, accuracy_reduction, crit_6_count)
+
+        lines = [
+            f"### Odds — {accuracy_dice} accuracy dice",
+            f"-# Required Accuracy: {result.required_accuracy} | Crit on {crit_6_count}x 6's",
+            f"**Hit:** {percent(result.hit)}",
+        ]
+        if crit_6_count > 0:
+            lines.append(f"**Crit:** {percent(result.crit)}")
+        lines.append(f"**Expected successes:** {result.expected_successes:g}")
+
+        if damage_dice:
+            lines.append("")
+            lines.append(f"**Damage ({damage_dice} dice, on a hit):**")
+            for successes in range(1, min(damage_dice, MAX_DAMAGE_ROWS) + 1):
+                lines.append(f"> {successes}+ successes: {percent(at_least(damage_dice, successes))}")
+
+        await interaction.response.send_message("\n".join(lines))
+
+async def setup(bot):
+    await bot.add_cog(OddsCog(bot))
@@ -2,6 +2,17 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from helpers import ParsedRollQuery
+from playtest import (
+    crit_chance as playtest_crit_chance,
+    is_no_damage,
+    simulate_playtest,
+    REROLL_NONE,
+    REROLL_ACCURACY_ON_MISS,
+    REROLL_LOW_DAMAGE,
+    REROLL_EITHER,
+)
+from typing import Literal
+import asyncio
 import random
 
 def count_successes_from_result(result_text):
@@ -186,21 +197,16 @@ class PlaytestRoll(commands.Cog):
         final_successes = max(0, raw_successes + accuracy_mod)
         
         acc_query_str = acc_query.as_button_callback_query_string()
-        damage_clean = damage.replace(" ", "").lower()
-        no_damage = (
-            damage_clean in ("0", "0d", "0d6", "0d8", "")
-            or damage_clean.startswith("0d")
-        )
+        no_damage = is_no_damage(damage)
 
         dmg_result = None
         final_damage = 0
 
         # Playtest Crit Calculation
         effective_crit_modifier = crit_modifier
-        base_crit_chance = 30 if crit_ability.lower() == "yes" else 15
-        excess_successes = max(0, final_successes - 1)
-        crit_chance = base_crit_chance + (excess_successes * effective_crit_modifier)
-        crit_chance = min(100, crit_chance)  # Cap at 100%
+        crit_chance, base_crit_chance, excess_successes = playtest_crit_chance(
+            final_successes, effective_crit_modifier, crit_ability.lower() == "yes"
+        )
 
         # Single d100 crit roll
         crit_roll_number, was_crit = crit_roll_d100(crit_chance)
@@ -248,5 +254,64 @@ class PlaytestRoll(commands.Cog):
         )
         await interaction.response.send_message(content=content.strip(), view=view)
 
+    @app_commands.command(
+        name="playtest_sim",
+        description="Simulate many /playtest_roll attacks and report hit, crit and damage rates."
+    )
+    @app_commands.describe(
+        accuracy="Dice roll for accuracy, a plain d6 pool such as '4d6'",
+        damage="Dice roll for damage, a plain d6 pool such as '5d6' (use 0 for status moves)",
+        accuracy_mod="Accuracy modifier (e.g. -1 or 2).",
+        crit_modifier="Crit modifier (default 2)",
+        crit_ability="Does the mon have a crit-enhancing ability?",
+        trials="How many attacks to simulate (100,000 to 1,000,000).",
+        reroll="When the single reroll is used."
+    )
+    @app_commands.autocomplete(
+        crit_ability=crit_ability_autocomplete,
+        crit_modifier=crit_modifier_autocomplete
+    )
+    async def playtest_sim(
+        self,
+        interaction: discord.Interaction,
+        accuracy: str,
+        damage: str,
+        accuracy_mod: int = 0,
+        crit_modifier: int = 2,
+        crit_ability: str = "No",
+        trials: app_commands.Range[int, 100_000, 1_000_000] = 200_000,
+        reroll: Literal[REROLL_NONE, REROLL_ACCURACY_ON_MISS, REROLL_LOW_DAMAGE, REROLL_EITHER] = REROLL_NONE
+    ):
+        await interaction.response.defer(thinking=True)
+        try:
+            # NumPy does the heavy lifting outside the GIL; keep it off the event loop
+            result = await asyncio.to_thread(
+                simulate_playtest,
+                accuracy,
+                damage,
+                accuracy_mod,
+                crit_modifier,
+                crit_ability.lower() == "yes",
+                trials,
+                reroll,
+            )
+        except (ValueError, RuntimeError) as e:
+            await interaction.followup.send(f"Could not run the simulation: {e}", ephemeral=True)
+            return
+
+        lines = [
+            f"### Playtest Simulation — {result.trials:,} attacks",
+            f"-# Accuracy: {accuracy} ({accuracy_mod:+d}) | Damage: {damage} | Crit modifier: {crit_modifier} | "
+            f"Crit ability: {crit_ability} | Reroll: {reroll}",
+            f"**Hit rate:** {result.hit_rate:.2%}",
+            f"**Crit rate:** {result.crit_rate:.2%}",
+        ]
+        if not is_no_damage(damage):
+            lines.append(f"**Average damage:** {result.mean_damage:.2f} per attack, {result.mean_damage_on_hit:.2f} per hit")
+            if result.damage_percentiles:
+                percentiles = " | ".join(f"p{p}: {value}" for p, value in result.damage_percentiles.items())
+                lines.append(f"**Damage on hit:** {percentiles}")
+        await interaction.followup.send("\n".join(lines))
+
 async def setup(bot):
     await bot.add_cog(PlaytestRoll(bot))
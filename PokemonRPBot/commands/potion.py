@@ -2,33 +2,49 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
 from typing import List
 from cache_helper import load_or_build_cache
-
-def normalize_keys(obj):
-    """Recursively convert all dictionary keys to lowercase."""
-    if isinstance(obj, dict):
-        return {k.lower(): normalize_keys(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [normalize_keys(i) for i in obj]
-    return obj
+from autocomplete import autocomplete_choices
+from game_data import get_catalog
+from response_cache import get_response_cache
 
 def load_potion(potion_name: str):
     """
-    Load a potion JSON file from the potions directory,
-    normalize all keys to lowercase,
-    and return the data as a dictionary.
+    Look up a potion in the shared game data catalog
+    and return it with all keys normalized to lowercase.
     """
-    POTION_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/potions")
-    file_path = os.path.join(POTION_DIRECTORY, f"{potion_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return normalize_keys(data)
-    except FileNotFoundError:
+    return get_catalog().get("potions", potion_name, normalized=True)
+
+def render_potion(potion_name: str):
+    """The /potion response for `potion_name`, or None if there is no such potion."""
+    potion = load_potion(potion_name)
+    if potion is None:
         return None
 
+    # Define fields and their formatting
+    fields = {
+        "name": ("### {}", "Unnamed Potion"),
+        "description": ("*{}*", "No description provided"),
+        "effect": ("{}", ""),
+        "recipes": ("**Recipes:**\n{}", ""),
+    }
+
+    response_lines = []
+    for key, (fmt, default) in fields.items():
+        value = potion.get(key, default)
+        if key == "recipes" and isinstance(value, list):
+            value = "\n".join(f"> {line}" for line in value)
+            # Insert an empty line before recipes if effect is present
+            if response_lines:
+                response_lines.append("")
+        if key == "effect":
+            value = value.strip()
+            if not value:
+                continue  # Skip empty effect
+        response_lines.append(fmt.format(value))
+
+    return "\n".join(response_lines)
+
 class PotionCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -49,57 +65,20 @@ class PotionCommand(commands.Cog):
     async def autocomplete_potion(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached potion names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.potion_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.potion_cache, self.potion_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached potion names"""
+        return autocomplete_choices(self.potion_cache, current)
 
     @app_commands.command(name="potion", description="Display details of a potion")
     @app_commands.autocomplete(name=autocomplete_potion)
     async def potion(self, interaction: discord.Interaction, name: str):
-        # Load the potion data (with normalized keys)
-        potion = load_potion(name)
-        if potion is None:
+        response = get_response_cache().get_or_render("potion", name, lambda: render_potion(name))
+        if response is None:
             await interaction.response.send_message(
                 content=f"Unable to find a potion named **{name}**, sorry!",
                 ephemeral=True,
             )
             return
 
-        # Define fields and their formatting
-        fields = {
-            "name": ("### {}", "Unnamed Potion"),
-            "description": ("*{}*", "No description provided"),
-            "effect": ("{}", ""),
-            "recipes": ("**Recipes:**\n{}", ""),
-        }
-
-        response_lines = []
-        for key, (fmt, default) in fields.items():
-            value = potion.get(key, default)
-            if key == "recipes" and isinstance(value, list):
-                value = "\n".join(f"> {line}" for line in value)
-                # Insert an empty line before recipes if effect is present
-                if response_lines:
-                    response_lines.append("")
-            if key == "effect":
-                value = value.strip()
-                if not value:
-                    continue  # Skip empty effect
-            response_lines.append(fmt.format(value))
-
-        response = "\n".join(response_lines)
-
         await interaction.response.send_message(response)
 
 async def setup(bot: commands.Bot):
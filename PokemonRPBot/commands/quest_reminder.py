@@ -1,54 +1,44 @@
 import re
-import json
-import os
+from functools import partial
 from time import time
 from typing import Optional, List, Dict
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-REMINDERS_FILE = "quest_reminders.json"
+from scheduler import get_scheduler
+from state_store import get_state_store
 
 class ReminderCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.reminders: List[Dict] = []
         self._load_reminders()
-        self.check_reminders.start()
 
     def _load_reminders(self):
-        if os.path.exists(REMINDERS_FILE):
-            try:
-                with open(REMINDERS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        self.reminders = data
-            except Exception:
-                self.reminders = []
-        else:
-            self.reminders = []
+        self.reminders = get_state_store().load_quest_reminders()
+        # Re-arm everything that was pending before the restart
+        for rem in self.reminders:
+            self._schedule(rem)
 
-    def _save_reminders(self):
-        os.makedirs(os.path.dirname(REMINDERS_FILE) or ".", exist_ok=True)
-        with open(REMINDERS_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.reminders, f, ensure_ascii=False, indent=2)
+    def _schedule(self, rem: Dict):
+        get_scheduler().schedule(("quest", rem["id"]), rem["remind_ts"], partial(self._send_reminder, rem))
 
-    @tasks.loop(seconds=30.0)
-    async def check_reminders(self):
-        now_ts = int(time())
-        to_fire = [r for r in self.reminders if r["remind_ts"] <= now_ts]
-        for rem in to_fire:
-            chan = self.bot.get_channel(rem["channel_id"])
-            if chan:
-                await chan.send(f"{rem['mentions']} {rem['reminder_name']} reminder!")
-            self.reminders.remove(rem)
-        if to_fire:
-            self._save_reminders()
+    def cog_unload(self):
+        for rem in self.reminders:
+            get_scheduler().cancel(("quest", rem["id"]))
 
-    @check_reminders.before_loop
-    async def before_check(self):
+    async def _send_reminder(self, rem: Dict):
+        """Called by the scheduler when a quest reminder is due."""
         await self.bot.wait_until_ready()
+        if rem not in self.reminders:
+            return
+        self.reminders.remove(rem)
+        get_state_store().delete_quest_reminders([rem["id"]])
+        chan = self.bot.get_channel(rem["channel_id"])
+        if chan:
+            await chan.send(f"{rem['mentions']} {rem['reminder_name']} reminder!")
 
     @app_commands.command(
         name="quest_reminder",
@@ -130,17 +120,18 @@ class ReminderCog(commands.Cog):
             rem_ts = event_ts - c.value
             if rem_ts <= now_ts:
                 continue
-            self.reminders.append({
+            rem = {
                 "remind_ts": rem_ts,
                 "channel_id": interaction.channel_id,
                 "mentions": mention_str,
                 "reminder_name": c.name
-            })
+            }
+            rem["id"] = get_state_store().add_quest_reminder(rem)
+            self.reminders.append(rem)
+            self._schedule(rem)
             ping_info.append((c.name, rem_ts))
 
-        if ping_info:
-            self._save_reminders()
-        else:
+        if not ping_info:
             return await interaction.followup.send(
                 "All chosen reminders are in the past; nothing scheduled.", ephemeral=True
             )
@@ -1,25 +1,25 @@
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
-import json
+from discord.ext import commands
 import re
-from datetime import datetime, timedelta
-
-REMINDERS_FILE = "reminders.json"
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from state_store import get_state_store
+from scheduler import get_scheduler
 
 # Functions to load and save reminders
 def load_reminders():
-    try:
-        with open(REMINDERS_FILE, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-    except json.JSONDecodeError:
-        return {}
-
-def save_reminders(reminders):
-    with open(REMINDERS_FILE, "w") as f:
-        json.dump(reminders, f)
+    return get_state_store().load_reminders()
+
+def save_reminder(reminder_id, reminder):
+    get_state_store().save_reminder(reminder_id, reminder)
+
+def delete_reminders(reminder_ids):
+    get_state_store().delete_reminders(reminder_ids)
+
+def reminder_timestamp(reminder) -> float:
+    """Unix time of a stored reminder (remind_time is naive UTC ISO format)."""
+    return datetime.fromisoformat(reminder["remind_time"]).replace(tzinfo=timezone.utc).timestamp()
 
 # Function to parse time strings
 def parse_time_string(time_str):
@@ -59,7 +59,20 @@ class ReminderCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.reminders = load_reminders()
-        self.check_reminders.start()
+        # Re-arm everything that was pending before the restart
+        for reminder_id, reminder in self.reminders.items():
+            self._schedule(reminder_id, reminder)
+
+    def _schedule(self, reminder_id, reminder):
+        get_scheduler().schedule(
+            ("remind", reminder_id),
+            reminder_timestamp(reminder),
+            partial(self.send_reminder, reminder_id)
+        )
+
+    def cog_unload(self):
+        for reminder_id in self.reminders:
+            get_scheduler().cancel(("remind", reminder_id))
 
     @app_commands.command(name="remind", description="Set a reminder to notify you after a specific time.")
     @app_commands.describe(
@@ -98,13 +111,14 @@ class ReminderCommand(commands.Cog):
                 "message": message,
                 "bot_message_id": None
             }
-            save_reminders(self.reminders)
+            save_reminder(reminder_id, self.reminders[reminder_id])
+            self._schedule(reminder_id, self.reminders[reminder_id])
 
             # Respond to the user and save bot message ID
             await interaction.response.send_message(f"Got it! I'll remind you in {time}.")
             bot_message = await interaction.original_response()
             self.reminders[reminder_id]["bot_message_id"] = bot_message.id
-            save_reminders(self.reminders)
+            save_reminder(reminder_id, self.reminders[reminder_id])
 
         except ValueError:
             await interaction.response.send_message(
@@ -112,45 +126,29 @@ class ReminderCommand(commands.Cog):
                 ephemeral=True
             )
 
-    @tasks.loop(seconds=30)
-    async def check_reminders(self):
-        """
-        Periodically checks reminders and sends notifications when due.
-        """
-        now = datetime.utcnow()
-        reminders_to_delete = []
-
-        for reminder_id, reminder in self.reminders.items():
-            remind_time = datetime.fromisoformat(reminder["remind_time"])
-            if now >= remind_time:
-                # Time to remind the user
-                channel = self.bot.get_channel(reminder["channel_id"])
-                if channel:
-                    try:
-                        user = await self.bot.fetch_user(reminder["user_id"])
-                        if user:
-                            bot_message_id = reminder.get("bot_message_id")
-                            if bot_message_id:
-                                bot_message = await channel.fetch_message(bot_message_id)
-                                await bot_message.reply(
-                                    content=f"⏰ Reminder for {user.mention}: {reminder['message']}"
-                                )
-                    except discord.NotFound:
-                        pass
-                reminders_to_delete.append(reminder_id)
-
-        # Clean up reminders
-        for reminder_id in reminders_to_delete:
-            del self.reminders[reminder_id]
-        if reminders_to_delete:
-            save_reminders(self.reminders)
-
-    @check_reminders.before_loop
-    async def before_check_reminders(self):
+    async def send_reminder(self, reminder_id):
         """
-        Waits until the bot is ready before starting the reminder loop.
+        Called by the scheduler when a reminder is due: notify the user and forget the reminder.
         """
         await self.bot.wait_until_ready()
+        reminder = self.reminders.pop(reminder_id, None)
+        if reminder is None:
+            return
+        delete_reminders([reminder_id])
+
+        channel = self.bot.get_channel(reminder["channel_id"])
+        if channel:
+            try:
+                user = await self.bot.fetch_user(reminder["user_id"])
+                if user:
+                    bot_message_id = reminder.get("bot_message_id")
+                    if bot_message_id:
+                        bot_message = await channel.fetch_message(bot_message_id)
+                        await bot_message.reply(
+                            content=f"⏰ Reminder for {user.mention}: {reminder['message']}"
+                        )
+            except discord.NotFound:
+                pass
 
 # Setup function to load the cog
 async def setup(bot):
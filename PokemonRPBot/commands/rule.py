@@ -6,6 +6,8 @@ import json
 from typing import List
 from helpers import load_rule  # Function to load rule data
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from response_cache import get_response_cache
 
 RULES_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/rules")
 MAX_DISCORD_MESSAGE_LENGTH = 2000
@@ -53,6 +55,27 @@ def chunk_message_preserve_formatting(text: str, limit: int = 2000) -> list[str]
 
     return chunks
 
+def render_rule(name: str):
+    """
+    The /rule response for `name`, already split into message-sized chunks,
+    or None if there is no such rule.
+    """
+    rule = load_rule(name)
+    if rule is None:
+        return None
+
+    # Construct a plain text message with Discord Markdown formatting
+    response = f"""
+### {rule['name']}
+*{rule['flavor']}*
+{rule['text']}
+"""
+    if rule.get("example"):
+        response += f"**Example**: {rule['example']}\n"
+
+    # Split the response in a way that preserves all formatting
+    return tuple(chunk_message_preserve_formatting(response, MAX_DISCORD_MESSAGE_LENGTH))
+
 class RulesCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -74,45 +97,21 @@ class RulesCommand(commands.Cog):
     async def autocomplete_rule(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached rule names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.rule_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.rule_cache, self.rule_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached rule names"""
+        return autocomplete_choices(self.rule_cache, current)
 
     @app_commands.command(name="rule", description="Display details of a game rule")
     @app_commands.autocomplete(name=autocomplete_rule)
     async def rules(self, interaction: discord.Interaction, name: str):
-        # Load the rule data from JSON file
-        rule = load_rule(name)
-        if rule is None:
+        # Rendered and chunked once per data version, then served from the response cache
+        chunks = get_response_cache().get_or_render("rule", name, lambda: render_rule(name))
+        if chunks is None:
             await interaction.response.send_message(
                 content=f"Unable to find a rule named **{name}**, sorry! If that wasn't a typo, maybe it isn't implemented yet?",
                 ephemeral=True
             )
             return
 
-        # Construct a plain text message with Discord Markdown formatting
-        response = f"""
-### {rule['name']}
-*{rule['flavor']}*
-{rule['text']}
-"""
-        if rule.get("example"):
-            response += f"**Example**: {rule['example']}\n"
-
-        # Split the response in a way that preserves all formatting
-        chunks = chunk_message_preserve_formatting(response, MAX_DISCORD_MESSAGE_LENGTH)
-
         # Send the first chunk with interaction.response
         await interaction.response.send_message(chunks[0])
 
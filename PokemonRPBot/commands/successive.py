@@ -1,8 +1,7 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from helpers import ParsedRollQuery
-import re
+from helpers import ParsedRollQuery, CRIT, FAIL_THRESHOLD, DEFAULT_CRIT_DIE_COUNT
 import logging
 
 # Configure logging
@@ -12,6 +11,23 @@ handler = logging.FileHandler(filename='successive_debug.log', encoding='utf-8',
 handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(name)s: %(message)s'))
 logger.addHandler(handler)
 
+def successive_roll(query: str, accuracy: int):
+    """
+    Roll the query once and return (adjusted successes, dice text, crit text).
+    Every die is scored, even for queries with a flat bonus.
+    """
+    result = ParsedRollQuery.from_query(query).roll()
+    logger.debug(f"Rolled {query}: {result.dice}")
+
+    successes = sum(1 for die in result.dice if die > FAIL_THRESHOLD)
+    crits = result.dice.count(CRIT)
+    roll_text = ", ".join(
+        f"**__{die}__**" if die == CRIT else f"**{die}**" if die > FAIL_THRESHOLD else f"{die}"
+        for die in result.dice
+    )
+    crit_text = " **(CRIT!)**" if crits >= DEFAULT_CRIT_DIE_COUNT else ""
+    return successes + accuracy, roll_text, crit_text
+
 class SuccessiveRollView(discord.ui.View):
     def __init__(self, bot, query, required_successes, total_successes, total_rolls, accuracy=0, has_rerolled=False):
         super().__init__(timeout=None)
@@ -34,41 +50,7 @@ class SuccessiveRollView(discord.ui.View):
         self.has_rerolled = True
 
         # Perform the reroll
-        parsed_query = ParsedRollQuery.from_query(self.query)
-        roll_result_text = parsed_query.execute()
-
-        # Log the reroll result for debugging
-        logger.debug(f"Reroll Roll Result Text: {roll_result_text}")
-
-        # Extract rolls from the reroll result
-        match = re.search(r'[—–-]\s*([^\n\r]*)', roll_result_text)
-        if match:
-            rolls_text = match.group(1)
-            rolls_text_clean = re.sub(r'[^0-9,]', '', rolls_text)
-            rolls = [int(num.strip()) for num in rolls_text_clean.split(',') if num.strip().isdigit()]
-        else:
-            rolls = []
-
-        # Log extracted rolls
-        logger.debug(f"Extracted Rolls: {rolls}")
-
-        successes = sum(1 for die in rolls if die >= 4)
-        crits = sum(1 for die in rolls if die == 6)
-        adjusted_successes = successes + self.accuracy
-
-        # Format the roll results with critical marking
-        formatted_rolls = []
-        for die in rolls:
-            if die == 6:
-                formatted_rolls.append("**__6__**")
-            elif die >= 4:
-                formatted_rolls.append(f"**{die}**")
-            else:
-                formatted_rolls.append(f"{die}")
-        roll_text = ", ".join(formatted_rolls)
-
-        # Check for "CRIT!" condition
-        crit_text = " **(CRIT!)**" if crits >= 3 else ""
+        adjusted_successes, roll_text, crit_text = successive_roll(self.query, self.accuracy)
 
         # Prepare the reroll output
         reroll_output = f"**Reroll of Last Failed Roll:**\n"
@@ -79,37 +61,8 @@ class SuccessiveRollView(discord.ui.View):
             reroll_output += "✅ **Success after reroll!**\n\n"
             self.total_successes += 1
             self.required_successes += 2
-            roll_number = 1
             while True:
-                parsed_query = ParsedRollQuery.from_query(self.query)
-                roll_result_text = parsed_query.execute()
-
-                logger.debug(f"Continuing Roll {roll_number} Result Text: {roll_result_text}")
-
-                match = re.search(r'[—–-]\s*([^\n\r]*)', roll_result_text)
-                if match:
-                    rolls_text = match.group(1)
-                    rolls_text_clean = re.sub(r'[^0-9,]', '', rolls_text)
-                    rolls = [int(num.strip()) for num in rolls_text_clean.split(',') if num.strip().isdigit()]
-                else:
-                    rolls = []
-
-                logger.debug(f"Extracted Rolls for Roll {roll_number}: {rolls}")
-
-                successes = sum(1 for die in rolls if die >= 4)
-                crits = sum(1 for die in rolls if die == 6)
-                adjusted_successes = successes + self.accuracy
-
-                formatted_rolls = []
-                for die in rolls:
-                    if die == 6:
-                        formatted_rolls.append("**__6__**")
-                    elif die >= 4:
-                        formatted_rolls.append(f"**{die}**")
-                    else:
-                        formatted_rolls.append(f"{die}")
-                roll_text = ", ".join(formatted_rolls)
-                crit_text = " **(CRIT!)**" if crits >= 3 else ""
+                adjusted_successes, roll_text, crit_text = successive_roll(self.query, self.accuracy)
 
                 reroll_output += f"**Roll:** {self.query} — {roll_text}\n"
                 reroll_output += f"**Successes:** {adjusted_successes} / **Required:** {self.required_successes}{crit_text}\n\n"
@@ -121,7 +74,6 @@ class SuccessiveRollView(discord.ui.View):
                 else:
                     reroll_output += "❌ **Failed!**\n\n"
                     break
-                roll_number += 1
         else:
             reroll_output += "❌ **Failed after reroll!**\n\n"
 
@@ -147,35 +99,7 @@ class SuccessiveCommand(commands.Cog):
         roll_number = 1
 
         while True:
-            parsed_query = ParsedRollQuery.from_query(query)
-            roll_result_text = parsed_query.execute()
-
-            logger.debug(f"Roll {roll_number} Result Text: {roll_result_text}")
-
-            match = re.search(r'[—–-]\s*([^\n\r]*)', roll_result_text)
-            if match:
-                rolls_text = match.group(1)
-                rolls_text_clean = re.sub(r'[^0-9,]', '', rolls_text)
-                rolls = [int(num.strip()) for num in rolls_text_clean.split(',') if num.strip().isdigit()]
-            else:
-                rolls = []
-
-            logger.debug(f"Extracted Rolls for Roll {roll_number}: {rolls}")
-
-            successes = sum(1 for die in rolls if die >= 4)
-            crits = sum(1 for die in rolls if die == 6)
-            adjusted_successes = successes + accuracy
-
-            formatted_rolls = []
-            for die in rolls:
-                if die == 6:
-                    formatted_rolls.append("**__6__**")
-                elif die >= 4:
-                    formatted_rolls.append(f"**{die}**")
-                else:
-                    formatted_rolls.append(f"{die}")
-            roll_text = ", ".join(formatted_rolls)
-            crit_text = " **(CRIT!)**" if crits >= 3 else ""
+            adjusted_successes, roll_text, crit_text = successive_roll(query, accuracy)
 
             output += f"**Roll {roll_number}:** {query} — {roll_text}\n"
             output += f"**Successes:** {adjusted_successes} / **Required:** {required_successes}{crit_text}\n\n"
@@ -3,9 +3,12 @@ from discord import app_commands
 from discord.ext import commands
 import os
 import json
+import asyncio
 from typing import List
 from helpers import load_move, load_legend_move, load_ability, load_item, load_potion, load_rule, load_status, load_weather, load_z_move
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from response_cache import get_response_cache
 
 # Directories for each JSON category.
 ABILITIES_DIRECTORY     = os.path.join(os.path.dirname(__file__), "../Data/abilities")
@@ -32,8 +35,10 @@ def get_field_value(item: dict, keys: list, default):
 class TemplateCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        # Load all caches at startup
-        self.load_all_caches()
+
+    async def cog_load(self):
+        # Load all caches at startup, in a worker thread so the event loop stays free
+        await asyncio.to_thread(self.load_all_caches)
     
     def load_all_caches(self):
         """Load all template caches at startup"""
@@ -49,20 +54,8 @@ class TemplateCommands(commands.Cog):
         self.zmoves_cache, self.zmoves_cache_lower = load_or_build_cache("z_moves.json", ZMOVES_DIRECTORY, "[Templates] z-moves")
     
     def _fast_autocomplete(self, cache: List[str], cache_lower: List[str], current: str):
-        """Generic fast autocomplete using pre-computed lowercase cache"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(cache, cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Generic ranked autocomplete over a cached name list"""
+        return autocomplete_choices(cache, current)
 
     # --- Autocomplete functions for each category ---
 
@@ -101,24 +94,30 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(move=move_autocomplete)
     async def mtemplate(self, interaction: discord.Interaction, move: str):
-        loaded_move = load_move(move)
-        if loaded_move is None:
+        def render():
+            loaded_move = load_move(move)
+            if loaded_move is None:
+                return None
+
+            standardized_move = {
+                "name": get_field_value(loaded_move, ["name", "Name"], "Template"),
+                "type": get_field_value(loaded_move, ["type", "Type"], "Typeless/any Type"),
+                "power": get_field_value(loaded_move, ["power", "Power"], 0),
+                "damage": get_field_value(loaded_move, ["damage", "damage1", "Damage1"], "Strength/Special etc."),
+                "accuracy": get_field_value(loaded_move, ["accuracy", "accuracy1", "Accuracy1"], "Dexterity/Insight etc."),
+                "target": get_field_value(loaded_move, ["target", "Target"], "Foe/User/etc"),
+                "effect": get_field_value(loaded_move, ["effect", "Effect"], "Effect Description"),
+                "description": get_field_value(loaded_move, ["description", "Description"], "Some roleplay description"),
+                "category": get_field_value(loaded_move, ["category", "Category"], "Physical/Special/Support")
+            }
+            formatted_json = json.dumps(standardized_move, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("mtemplate", move, render)
+        if response is None:
             await interaction.response.send_message(f"Move '{move}' not found.", ephemeral=True)
             return
-
-        standardized_move = {
-            "name": get_field_value(loaded_move, ["name", "Name"], "Template"),
-            "type": get_field_value(loaded_move, ["type", "Type"], "Typeless/any Type"),
-            "power": get_field_value(loaded_move, ["power", "Power"], 0),
-            "damage": get_field_value(loaded_move, ["damage", "damage1", "Damage1"], "Strength/Special etc."),
-            "accuracy": get_field_value(loaded_move, ["accuracy", "accuracy1", "Accuracy1"], "Dexterity/Insight etc."),
-            "target": get_field_value(loaded_move, ["target", "Target"], "Foe/User/etc"),
-            "effect": get_field_value(loaded_move, ["effect", "Effect"], "Effect Description"),
-            "description": get_field_value(loaded_move, ["description", "Description"], "Some roleplay description"),
-            "category": get_field_value(loaded_move, ["category", "Category"], "Physical/Special/Support")
-        }
-        formatted_json = json.dumps(standardized_move, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
             name="ltemplate",
@@ -126,24 +125,30 @@ class TemplateCommands(commands.Cog):
         )
     @app_commands.autocomplete(legend_move=legend_move_autocomplete)
     async def ltemplate(self, interaction: discord.Interaction, legend_move: str):
-        loaded_legend_move = load_legend_move(legend_move)
-        if loaded_legend_move is None:
+        def render():
+            loaded_legend_move = load_legend_move(legend_move)
+            if loaded_legend_move is None:
+                return None
+
+            standardized_legend_move = {
+                "name": get_field_value(loaded_legend_move, ["name", "Name"], "Template"),
+                "type": get_field_value(loaded_legend_move, ["type", "Type"], "Typeless/any Type"),
+                "power": get_field_value(loaded_legend_move, ["power", "Power"], 0),
+                "damage": get_field_value(loaded_legend_move, ["damage", "damage1", "Damage1"], "Strength/Special etc."),
+                "accuracy": get_field_value(loaded_legend_move, ["accuracy", "accuracy1", "Accuracy1"], "Dexterity/Insight etc."),
+                "target": get_field_value(loaded_legend_move, ["target", "Target"], "Foe/User/etc"),
+                "effect": get_field_value(loaded_legend_move, ["effect", "Effect"], "Effect Description"),
+                "description": get_field_value(loaded_legend_move, ["description", "Description"], "Some roleplay description"),
+                "category": get_field_value(loaded_legend_move, ["category", "Category"], "Physical/Special/Support")
+            }
+            formatted_json = json.dumps(standardized_legend_move, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("ltemplate", legend_move, render)
+        if response is None:
             await interaction.response.send_message(f"Legendary Move '{legend_move}' not found.", ephemeral=True)
             return
-
-        standardized_legend_move = {
-            "name": get_field_value(loaded_legend_move, ["name", "Name"], "Template"),
-            "type": get_field_value(loaded_legend_move, ["type", "Type"], "Typeless/any Type"),
-            "power": get_field_value(loaded_legend_move, ["power", "Power"], 0),
-            "damage": get_field_value(loaded_legend_move, ["damage", "damage1", "Damage1"], "Strength/Special etc."),
-            "accuracy": get_field_value(loaded_legend_move, ["accuracy", "accuracy1", "Accuracy1"], "Dexterity/Insight etc."),
-            "target": get_field_value(loaded_legend_move, ["target", "Target"], "Foe/User/etc"),
-            "effect": get_field_value(loaded_legend_move, ["effect", "Effect"], "Effect Description"),
-            "description": get_field_value(loaded_legend_move, ["description", "Description"], "Some roleplay description"),
-            "category": get_field_value(loaded_legend_move, ["category", "Category"], "Physical/Special/Support")
-        }
-        formatted_json = json.dumps(standardized_legend_move, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="atemplate",
@@ -151,18 +156,24 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(ability=ability_autocomplete)
     async def atemplate(self, interaction: discord.Interaction, ability: str):
-        loaded_ability = load_ability(ability)
-        if loaded_ability is None:
+        def render():
+            loaded_ability = load_ability(ability)
+            if loaded_ability is None:
+                return None
+
+            standardized_ability = {
+                "name": get_field_value(loaded_ability, ["name", "Name"], "Template Ability"),
+                "description": get_field_value(loaded_ability, ["description", "Description"], "No description provided"),
+                "effect": get_field_value(loaded_ability, ["effect", "Effect"], "No effect defined")
+            }
+            formatted_json = json.dumps(standardized_ability, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("atemplate", ability, render)
+        if response is None:
             await interaction.response.send_message(f"Ability '{ability}' not found.", ephemeral=True)
             return
-
-        standardized_ability = {
-            "name": get_field_value(loaded_ability, ["name", "Name"], "Template Ability"),
-            "description": get_field_value(loaded_ability, ["description", "Description"], "No description provided"),
-            "effect": get_field_value(loaded_ability, ["effect", "Effect"], "No effect defined")
-        }
-        formatted_json = json.dumps(standardized_ability, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="itemplate",
@@ -170,19 +181,25 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(item=item_autocomplete)
     async def itemplate(self, interaction: discord.Interaction, item: str):
-        loaded_item = load_item(item)
-        if loaded_item is None:
+        def render():
+            loaded_item = load_item(item)
+            if loaded_item is None:
+                return None
+
+            standardized_item = {
+                "name": get_field_value(loaded_item, ["name", "Name"], "Template Item"),
+                "description": get_field_value(loaded_item, ["description", "Description"], "No description provided"),
+                "category": get_field_value(loaded_item, ["category", "Category"], "unknown"),
+                "rarity": get_field_value(loaded_item, ["rarity", "Rarity"], "unknown")
+            }
+            formatted_json = json.dumps(standardized_item, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("itemplate", item, render)
+        if response is None:
             await interaction.response.send_message(f"Item '{item}' not found.", ephemeral=True)
             return
-
-        standardized_item = {
-            "name": get_field_value(loaded_item, ["name", "Name"], "Template Item"),
-            "description": get_field_value(loaded_item, ["description", "Description"], "No description provided"),
-            "category": get_field_value(loaded_item, ["category", "Category"], "unknown"),
-            "rarity": get_field_value(loaded_item, ["rarity", "Rarity"], "unknown")
-        }
-        formatted_json = json.dumps(standardized_item, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="ptemplate",
@@ -190,19 +207,25 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(potion=potion_autocomplete)
     async def ptemplate(self, interaction: discord.Interaction, potion: str):
-        loaded_potion = load_potion(potion)
-        if loaded_potion is None:
+        def render():
+            loaded_potion = load_potion(potion)
+            if loaded_potion is None:
+                return None
+
+            standardized_potion = {
+                "name": get_field_value(loaded_potion, ["name", "Name"], "Template Potion"),
+                "description": get_field_value(loaded_potion, ["description", "Description"], "No description provided"),
+                "effect": get_field_value(loaded_potion, ["effect", "Effect"], "No effect defined"),
+                "recipes": get_field_value(loaded_potion, ["recipes", "Recipes"], [])
+            }
+            formatted_json = json.dumps(standardized_potion, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("ptemplate", potion, render)
+        if response is None:
             await interaction.response.send_message(f"Potion '{potion}' not found.", ephemeral=True)
             return
-
-        standardized_potion = {
-            "name": get_field_value(loaded_potion, ["name", "Name"], "Template Potion"),
-            "description": get_field_value(loaded_potion, ["description", "Description"], "No description provided"),
-            "effect": get_field_value(loaded_potion, ["effect", "Effect"], "No effect defined"),
-            "recipes": get_field_value(loaded_potion, ["recipes", "Recipes"], [])
-        }
-        formatted_json = json.dumps(standardized_potion, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="rtemplate",
@@ -210,19 +233,25 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(rule=rule_autocomplete)
     async def rtemplate(self, interaction: discord.Interaction, rule: str):
-        loaded_rule = load_rule(rule)
-        if loaded_rule is None:
+        def render():
+            loaded_rule = load_rule(rule)
+            if loaded_rule is None:
+                return None
+
+            standardized_rule = {
+                "name": get_field_value(loaded_rule, ["name", "Name"], "Template Rule"),
+                "flavor": get_field_value(loaded_rule, ["flavor", "Flavor"], "No flavor text provided"),
+                "text": get_field_value(loaded_rule, ["text", "Text"], "No rule text provided"),
+                "example": get_field_value(loaded_rule, ["example", "Example"], "")
+            }
+            formatted_json = json.dumps(standardized_rule, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("rtemplate", rule, render)
+        if response is None:
             await interaction.response.send_message(f"Rule '{rule}' not found.", ephemeral=True)
             return
-
-        standardized_rule = {
-            "name": get_field_value(loaded_rule, ["name", "Name"], "Template Rule"),
-            "flavor": get_field_value(loaded_rule, ["flavor", "Flavor"], "No flavor text provided"),
-            "text": get_field_value(loaded_rule, ["text", "Text"], "No rule text provided"),
-            "example": get_field_value(loaded_rule, ["example", "Example"], "")
-        }
-        formatted_json = json.dumps(standardized_rule, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="stemplate",
@@ -230,20 +259,26 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(status=status_autocomplete)
     async def stemplate(self, interaction: discord.Interaction, status: str):
-        loaded_status = load_status(status)
-        if loaded_status is None:
+        def render():
+            loaded_status = load_status(status)
+            if loaded_status is None:
+                return None
+
+            standardized_status = {
+                "name": get_field_value(loaded_status, ["name", "Name"], "Template Status"),
+                "description": get_field_value(loaded_status, ["description", "Description"], "No description provided"),
+                "resist": get_field_value(loaded_status, ["resist", "Resist"], "No resist information"),
+                "effect": get_field_value(loaded_status, ["effect", "Effect"], "No effect defined"),
+                "duration": get_field_value(loaded_status, ["duration", "Duration"], "Duration not specified")
+            }
+            formatted_json = json.dumps(standardized_status, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("stemplate", status, render)
+        if response is None:
             await interaction.response.send_message(f"Status '{status}' not found.", ephemeral=True)
             return
-
-        standardized_status = {
-            "name": get_field_value(loaded_status, ["name", "Name"], "Template Status"),
-            "description": get_field_value(loaded_status, ["description", "Description"], "No description provided"),
-            "resist": get_field_value(loaded_status, ["resist", "Resist"], "No resist information"),
-            "effect": get_field_value(loaded_status, ["effect", "Effect"], "No effect defined"),
-            "duration": get_field_value(loaded_status, ["duration", "Duration"], "Duration not specified")
-        }
-        formatted_json = json.dumps(standardized_status, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="wtemplate",
@@ -251,18 +286,24 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(weather=weather_autocomplete)
     async def wtemplate(self, interaction: discord.Interaction, weather: str):
-        loaded_weather = load_weather(weather)
-        if loaded_weather is None:
+        def render():
+            loaded_weather = load_weather(weather)
+            if loaded_weather is None:
+                return None
+
+            standardized_weather = {
+                "name": get_field_value(loaded_weather, ["name", "Name"], "Template Weather"),
+                "description": get_field_value(loaded_weather, ["description", "Description"], "No description provided"),
+                "effect": get_field_value(loaded_weather, ["effect", "Effect"], "No effect defined")
+            }
+            formatted_json = json.dumps(standardized_weather, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("wtemplate", weather, render)
+        if response is None:
             await interaction.response.send_message(f"Weather '{weather}' not found.", ephemeral=True)
             return
-
-        standardized_weather = {
-            "name": get_field_value(loaded_weather, ["name", "Name"], "Template Weather"),
-            "description": get_field_value(loaded_weather, ["description", "Description"], "No description provided"),
-            "effect": get_field_value(loaded_weather, ["effect", "Effect"], "No effect defined")
-        }
-        formatted_json = json.dumps(standardized_weather, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
     @app_commands.command(
         name="ztemplate",
@@ -270,25 +311,31 @@ class TemplateCommands(commands.Cog):
     )
     @app_commands.autocomplete(zmove=zmove_autocomplete)
     async def ztemplate(self, interaction: discord.Interaction, zmove: str):
-        loaded_zmove = load_z_move(zmove)
-        if loaded_zmove is None:
+        def render():
+            loaded_zmove = load_z_move(zmove)
+            if loaded_zmove is None:
+                return None
+
+            standardized_zmove = {
+                "name": get_field_value(loaded_zmove, ["name", "Name"], "Template Z‑Move"),
+                "type": get_field_value(loaded_zmove, ["type", "Type"], "Typeless"),
+                "power": get_field_value(loaded_zmove, ["power", "Power"], 0),
+                "damage": get_field_value(loaded_zmove, ["damage", "damage2", "Damage2"], ""),
+                "accuracy": get_field_value(loaded_zmove, ["accuracy", "Accuracy1", "accuracy1"], ""),
+                "target": get_field_value(loaded_zmove, ["target", "Target"], "Battlefield"),
+                "effect": get_field_value(loaded_zmove, ["effect", "Effect"], "No effect defined"),
+                "description": get_field_value(loaded_zmove, ["description", "Description"], "No description provided"),
+                "og_move": get_field_value(loaded_zmove, ["og_move", "_id"], "Original Move?"),
+                "category": get_field_value(loaded_zmove, ["category", "Category"], "Support")
+            }
+            formatted_json = json.dumps(standardized_zmove, indent=4)
+            return f"```json\n{formatted_json}\n```"
+
+        response = get_response_cache().get_or_render("ztemplate", zmove, render)
+        if response is None:
             await interaction.response.send_message(f"Z‑Move '{zmove}' not found.", ephemeral=True)
             return
-
-        standardized_zmove = {
-            "name": get_field_value(loaded_zmove, ["name", "Name"], "Template Z‑Move"),
-            "type": get_field_value(loaded_zmove, ["type", "Type"], "Typeless"),
-            "power": get_field_value(loaded_zmove, ["power", "Power"], 0),
-            "damage": get_field_value(loaded_zmove, ["damage", "damage2", "Damage2"], ""),
-            "accuracy": get_field_value(loaded_zmove, ["accuracy", "Accuracy1", "accuracy1"], ""),
-            "target": get_field_value(loaded_zmove, ["target", "Target"], "Battlefield"),
-            "effect": get_field_value(loaded_zmove, ["effect", "Effect"], "No effect defined"),
-            "description": get_field_value(loaded_zmove, ["description", "Description"], "No description provided"),
-            "og_move": get_field_value(loaded_zmove, ["og_move", "_id"], "Original Move?"),
-            "category": get_field_value(loaded_zmove, ["category", "Category"], "Support")
-        }
-        formatted_json = json.dumps(standardized_zmove, indent=4)
-        await interaction.response.send_message(f"```json\n{formatted_json}\n```")
+        await interaction.response.send_message(response)
 
 async def setup(bot):
     await bot.add_cog(TemplateCommands(bot))
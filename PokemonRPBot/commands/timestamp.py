@@ -1,39 +1,13 @@
 from __future__ import annotations  # Postpone evaluation of annotations
 
-import json
-import os
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Tuple
+from user_offsets import get_user_offset, set_user_offset  # in-memory, shared with timestamp_tracker
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-# --------------------------------------------------------------------------------
-# JSON FILE-BASED OFFSET STORAGE
-# --------------------------------------------------------------------------------
-OFFSET_FILE = "user_offsets.json"
-
-def load_offsets() -> Dict[str, List[int]]:
-    """
-    Load a JSON dict from user_offsets.json, format: { "user_id": [hours, minutes], ... }.
-    """
-    if not os.path.exists(OFFSET_FILE):
-        return {}
-    try:
-        with open(OFFSET_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, IOError):
-        return {}
-
-def save_offsets(offsets: Dict[str, List[int]]):
-    """
-    Save the offsets dict to user_offsets.json.
-    """
-    with open(OFFSET_FILE, "w", encoding="utf-8") as f:
-        json.dump(offsets, f)
-
 def is_central_european_summer_time(dt: datetime) -> bool:
     year = dt.year
     march = datetime(year, 3, 31)
@@ -42,24 +16,6 @@ def is_central_european_summer_time(dt: datetime) -> bool:
     last_sunday_october = october - timedelta(days=october.weekday() + 1)
     return last_sunday_march < dt < last_sunday_october
 
-async def get_user_offset(user_id: int) -> Optional[Tuple[int, int]]:
-    """
-    Return (hours, minutes) if found for the user, else None.
-    """
-    offsets = load_offsets()
-    data = offsets.get(str(user_id))
-    if data and len(data) == 2:
-        return (data[0], data[1])
-    return None
-
-async def set_user_offset(user_id: int, hours: int, minutes: int):
-    """
-    Save the user's offset as [hours, minutes] in user_offsets.json.
-    """
-    offsets = load_offsets()
-    offsets[str(user_id)] = [hours, minutes]
-    save_offsets(offsets)
-
 def get_corrected_offset_simple(hours: int, minutes: int) -> Tuple[int, int]:
     """
     EINFACHE LÖSUNG OHNE JSON-ÄNDERUNG:
@@ -1,35 +1,11 @@
 from __future__ import annotations
 import re
-import json
-import os
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from user_offsets import get_user_offset  # in-memory, shared with the timestamp commands
 
 import discord
 from discord.ext import commands
 
-# --------------------------------------------------------------------------------
-# OFFSET STORAGE FUNCTIONS (reuse these from your other module)
-# --------------------------------------------------------------------------------
-OFFSET_FILE = "user_offsets.json"
-
-def load_offsets() -> Dict[str, List[int]]:
-    if not os.path.exists(OFFSET_FILE):
-        return {}
-    try:
-        with open(OFFSET_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, IOError):
-        return {}
-
-async def get_user_offset(user_id: int) -> Optional[Tuple[int, int]]:
-    offsets = load_offsets()
-    data = offsets.get(str(user_id))
-    if data and len(data) == 2:
-        return (data[0], data[1])
-    return None
-
 # --------------------------------------------------------------------------------
 # HELPER FUNCTION: Build "local now" from stored offset
 # --------------------------------------------------------------------------------
@@ -2,28 +2,18 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import os
-import json
+import random
 from typing import List
 from helpers import load_z_move, ParsedRollQuery
 from emojis import get_type_emoji, get_category_emoji
 from cache_helper import load_or_build_cache
+from autocomplete import autocomplete_choices
+from game_data import get_catalog
+from response_cache import get_response_cache
+from characters import load_user_stats
 
 # Directories for z_move files and character files
 MOVES_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Data/z_moves")
-CHARACTERS_DIRECTORY = os.path.join(os.path.dirname(__file__), "../Characters")
-
-def load_user_stats(user_id: int):
-    """Load user stats from a JSON file in the Characters directory."""
-    files = os.listdir(CHARACTERS_DIRECTORY)
-    matching_file = next(
-        (f for f in files if f.startswith(f"{user_id}_") and f.endswith(".json")),
-        None
-    )
-    if not matching_file:
-        return None
-    stats_file = os.path.join(CHARACTERS_DIRECTORY, matching_file)
-    with open(stats_file, "r") as file:
-        return json.load(file)
 
 def build_dice_query(dice_count: int):
     """Build a query string for ParsedRollQuery based on the number of dice."""
@@ -38,6 +28,46 @@ def get_z_move_field(z_move: dict, field: str, alt_field: str = None):
         alt_field = field.lower()
     return z_move.get(field) or z_move.get(alt_field)
 
+def render_z_move(name: str):
+    """
+    The /z_move response for `name` as (text, is_z_metronome),
+    or None if there is no such Z-move.
+    """
+    z_move = load_z_move(name)
+    if z_move is None:
+        return None
+
+    # Retrieve z_move fields using the helper to support both key formats.
+    z_move_name_field = get_z_move_field(z_move, "name")
+    type_field = get_z_move_field(z_move, "type")
+    category_field = get_z_move_field(z_move, "category")
+    description_field = get_z_move_field(z_move, "description")
+    target_field = get_z_move_field(z_move, "target")
+    effect_field = get_z_move_field(z_move, "effect")
+    damage_field = get_z_move_field(z_move, "damage")
+    power_field = get_z_move_field(z_move, "power")
+    accuracy_field = get_z_move_field(z_move, "accuracy")
+    original_move_field = get_z_move_field(z_move, "og_move")
+
+    # Get emojis for the z_move's type and category
+    type_icon = get_type_emoji(type_field)
+    category_icon = get_category_emoji(category_field)
+
+    # Build the z_move description text
+    z_move_description = f"""
+### {z_move_name_field}
+-# Original Move: {original_move_field}
+*{description_field}*
+**Type**: {type_icon} {type_field} — **{category_icon} {category_field}**
+**Target**: {target_field}
+"""
+    if damage_field:
+        z_move_description += f"**Damage Dice**: {damage_field} + {power_field}\n"
+    z_move_description += f"""**Accuracy Dice**: {accuracy_field} + Rank
+**Effect**: {effect_field}
+"""
+    return z_move_description, z_move_name_field == "Z-Metronome"
+
 class ZMoveCommand(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -58,20 +88,8 @@ class ZMoveCommand(commands.Cog):
     async def z_move_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        """Fast autocomplete using cached Z-move names"""
-        if not current:
-            return [app_commands.Choice(name=name, value=name) for name in self.z_move_cache[:25]]
-        
-        current_lower = current.lower()
-        matches = []
-        
-        for name, name_lower in zip(self.z_move_cache, self.z_move_cache_lower):
-            if current_lower in name_lower:
-                matches.append(app_commands.Choice(name=name, value=name))
-                if len(matches) >= 25:
-                    break
-        
-        return matches
+        """Ranked autocomplete over cached Z-move names"""
+        return autocomplete_choices(self.z_move_cache, current)
 
     @app_commands.command(
         name="z_move", 
@@ -79,85 +97,34 @@ class ZMoveCommand(commands.Cog):
     )
     @app_commands.autocomplete(z_move=z_move_name_autocomplete)
     async def z_move(self, interaction: discord.Interaction, z_move: str):
-        z_move = load_z_move(z_move)
-        if z_move is None:
+        rendered = get_response_cache().get_or_render("z_move", z_move, lambda: render_z_move(z_move))
+        if rendered is None:
             await interaction.response.send_message(
                 f"Move '{z_move}' not found.", ephemeral=True
             )
             return
+        z_move_description, is_z_metronome = rendered
 
-        user_stats = load_user_stats(interaction.user.id)
-
-        # Retrieve z_move fields using the helper to support both key formats.
-        z_move_name_field = get_z_move_field(z_move, "name")
-        type_field = get_z_move_field(z_move, "type")
-        category_field = get_z_move_field(z_move, "category")
-        description_field = get_z_move_field(z_move, "description")
-        target_field = get_z_move_field(z_move, "target")
-        effect_field = get_z_move_field(z_move, "effect")
-        damage_field = get_z_move_field(z_move, "damage")
-        power_field = get_z_move_field(z_move, "power")
-        accuracy_field = get_z_move_field(z_move, "accuracy")
-        original_move_field = get_z_move_field(z_move, "og_move")
-
-        # Get emojis for the z_move's type and category
-        type_icon = get_type_emoji(type_field)
-        category_icon = get_category_emoji(category_field)
-
-        # Build the z_move description text
-        z_move_description = f"""
-### {z_move_name_field}
--# Original Move: {original_move_field}
-*{description_field}*
-**Type**: {type_icon} {type_field} — **{category_icon} {category_field}**
-**Target**: {target_field}
-"""
-        if damage_field:
-            z_move_description += f"**Damage Dice**: {damage_field} + {power_field}\n"
-        z_move_description += f"""**Accuracy Dice**: {accuracy_field} + Rank
-**Effect**: {effect_field}
-"""
-
+        user_stats = load_user_stats(interaction.user.id, interaction.guild_id)
 
         # If Z-Metronome, show a blue Metronome button that pulls a random Z-Move
-        if z_move_name_field == "Z-Metronome":
+        if is_z_metronome:
             class MetronomeView(discord.ui.View):
                 @discord.ui.button(label="Metronome", style=discord.ButtonStyle.primary)
                 async def metronome(self, interaction: discord.Interaction, button: discord.ui.Button):
-                    # Get all Z-Move names
-                    z_move_files = [f for f in os.listdir(MOVES_DIRECTORY) if f.endswith(".json")]
-                    import random
-                    random_file = random.choice(z_move_files)
-                    random_z_move = load_z_move(random_file[:-5])
-                    if random_z_move is None:
+                    # Pick from the Z-Move names already held by the catalog
+                    z_move_names = get_catalog().names("z_moves")
+                    random_rendered = None
+                    if z_move_names:
+                        random_name = random.choice(z_move_names)
+                        # Shares cache entries with /z_move for the same move
+                        random_rendered = get_response_cache().get_or_render(
+                            "z_move", random_name, lambda: render_z_move(random_name)
+                        )
+                    if random_rendered is None:
                         await interaction.response.send_message("Failed to load a random Z-Move.", ephemeral=True)
                         return
-                    # Build description for the random Z-Move
-                    random_name = get_z_move_field(random_z_move, "name")
-                    random_type = get_z_move_field(random_z_move, "type")
-                    random_category = get_z_move_field(random_z_move, "category")
-                    random_description = get_z_move_field(random_z_move, "description")
-                    random_target = get_z_move_field(random_z_move, "target")
-                    random_effect = get_z_move_field(random_z_move, "effect")
-                    random_damage = get_z_move_field(random_z_move, "damage")
-                    random_power = get_z_move_field(random_z_move, "power")
-                    random_accuracy = get_z_move_field(random_z_move, "accuracy")
-                    random_og_move = get_z_move_field(random_z_move, "og_move")
-                    random_type_icon = get_type_emoji(random_type)
-                    random_category_icon = get_category_emoji(random_category)
-                    random_desc = f"""
-### {random_name}
--# Original Move: {random_og_move}
-*{random_description}*
-**Type**: {random_type_icon} {random_type} — **{random_category_icon} {random_category}**
-**Target**: {random_target}
-"""
-                    if random_damage:
-                        random_desc += f"**Damage Dice**: {random_damage} + {random_power}\n"
-                    random_desc += f"""**Accuracy Dice**: {random_accuracy} + Rank
-**Effect**: {random_effect}
-"""
-                    await interaction.response.send_message(random_desc)
+                    await interaction.response.send_message(random_rendered[0])
             await interaction.response.send_message(z_move_description, view=MetronomeView())
             return
 
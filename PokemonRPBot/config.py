@@ -15,6 +15,7 @@ COMMANDS = [
     "commands.timestamp_tracker",
     "commands.minesweeper",
     "commands.learns",
+    "commands.learned_by",
     "commands.modmail",
     "commands.pokemon",
     "commands.ability",
@@ -32,11 +33,13 @@ COMMANDS = [
     "commands.attack_roll",
     "commands.area_attack_roll",
     "commands.all_foes_attack_roll",
+    "commands.odds",
     "commands.potion",
     "commands.filter",
     "commands.br",
     "commands.max_moves",
-    "commands.g_max_moves"
+    "commands.g_max_moves",
+    "commands.cache_stats"
     ]
 
 COMMANDS_NOT_LOADED = [
@@ -0,0 +1,84 @@
+import random
+import threading
+from typing import Dict, Mapping
+
+from helpers import ParsedRollQuery, RollResult, CRIT, FAIL_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it dice come from the random module
+    np = None
+
+class DiceEngine:
+    """
+    Rolls every dice pool of an action in one go. All dice with the same
+    number of sides are drawn with a single call to NumPy's Generator, and
+    successes and sixes are counted per pool with array reductions instead
+    of a Python loop per die. Without NumPy the draw falls back to one
+    random.choices call per die size.
+    """
+
+    def __init__(self, seed=None):
+        self._lock = threading.Lock()
+        if np is not None:
+            self._rng = np.random.default_rng(seed)
+        else:
+            self._rng = random.Random(seed)
+
+    def roll_batch(self, queries: Mapping[str, ParsedRollQuery]) -> Dict[str, RollResult]:
+        """Roll each named query and return name -> RollResult, in the same order."""
+        names = list(queries)
+        pools_by_sides = {}
+        for name in names:
+            pools_by_sides.setdefault(queries[name].sides, []).append(name)
+
+        results = {}
+        for sides, pool_names in pools_by_sides.items():
+            counts = [queries[name].amount for name in pool_names]
+            for name, dice, successes, six_count in zip(pool_names, *self._draw(sides, counts)):
+                query = queries[name]
+                counts_successes = sides == 6 and query.flat_addition == 0
+                results[name] = RollResult(
+                    amount=query.amount,
+                    sides=query.sides,
+                    flat_addition=query.flat_addition,
+                    crit_6_count=query.crit_6_count,
+                    dice=dice,
+                    total=sum(dice) + query.flat_addition,
+                    successes=successes if counts_successes else 0,
+                    six_count=six_count if counts_successes else 0,
+                    counts_successes=counts_successes,
+                )
+        return {name: results[name] for name in names}
+
+    def _draw(self, sides: int, counts):
+        """Per pool: (dice lists, success counts, six counts) for pools of `counts` dice."""
+        total = sum(counts)
+        if np is not None:
+            with self._lock:
+                flat = self._rng.integers(1, sides + 1, size=total)
+            starts = np.cumsum([0] + counts[:-1])
+            successes = np.add.reduceat(flat > FAIL_THRESHOLD, starts, dtype=np.int64)
+            sixes = np.add.reduceat(flat == CRIT, starts, dtype=np.int64)
+            dice = [chunk.tolist() for chunk in np.split(flat, starts[1:])]
+            return dice, successes.tolist(), sixes.tolist()
+
+        with self._lock:
+            flat = self._rng.choices(range(1, sides + 1), k=total)
+        dice, start = [], 0
+        for count in counts:
+            dice.append(flat[start:start + count])
+            start += count
+        successes = [sum(1 for value in pool if value > FAIL_THRESHOLD) for pool in dice]
+        sixes = [pool.count(CRIT) for pool in dice]
+        return dice, successes, sixes
+
+_engine = DiceEngine()
+
+def get_dice_engine() -> DiceEngine:
+    """Return the dice engine shared by the roll cogs."""
+    return _engine
+
+def roll_batch(queries: Mapping[str, ParsedRollQuery]) -> Dict[str, RollResult]:
+    """Roll several named dice pools at once with the shared engine."""
+    return _engine.roll_batch(queries)
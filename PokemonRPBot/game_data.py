@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+# Root of the static game data shipped with the bot
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data")
+
+# Pre-parsed copy of Data/ that is loaded instead of the JSON files while it
+# is up to date. Build it ahead of time with `python game_data.py`.
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "game_data.pickle")
+
+# Bump when the snapshot layout changes so old files are rebuilt
+SNAPSHOT_FORMAT = 1
+
+# Sub-folders of Data/ that hold one JSON file per entry, keyed by file name
+CATEGORIES = [
+    "abilities",
+    "g_max_moves",
+    "items",
+    "legend_moves",
+    "lock_boxes",
+    "max_moves",
+    "movecards",
+    "moves",
+    "pokemon",
+    "potions",
+    "rules",
+    "status",
+    "weather",
+    "z_moves",
+]
+
+# Stand-alone JSON documents that live directly in Data/
+DOCUMENTS = {
+    "evolutions": "pokemon_evolutions.json",
+    "typechart": "typechart.json",
+}
+
+def normalize_keys(obj):
+    """Recursively convert all dictionary keys to lowercase."""
+    if isinstance(obj, dict):
+        return {k.lower(): normalize_keys(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [normalize_keys(i) for i in obj]
+    return obj
+
+class GameData:
+    """
+    Every JSON file under Data/, parsed once and indexed by category and name.
+
+    Records are shared between callers, so treat them as read-only and copy
+    before changing anything.
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR, snapshot_path: str = SNAPSHOT_PATH):
+        self.data_dir = data_dir
+        self.snapshot_path = snapshot_path  # None disables the snapshot entirely
+        self.version = None    # content hash of the JSON files the tables came from
+        self.fingerprint = None  # stat-based hash of the same files, see _fingerprint()
+        self.tables = {}       # category -> {file name without .json: record}
+        self.documents = {}    # document key -> parsed JSON
+        self._folded = {}      # category -> {lowercase name: file name}
+        self._normalized = {}  # (category, name) -> record with lowercase keys
+        self.load()
+
+    def load(self):
+        """
+        Fill the catalog from the snapshot when it still matches the files in
+        Data/, otherwise parse the JSON files and write a fresh snapshot.
+        """
+        fingerprint = self._fingerprint()
+        snapshot = self._read_snapshot(fingerprint)
+        if snapshot is not None:
+            source = "snapshot"
+        else:
+            snapshot = self._build_from_json()
+            snapshot["fingerprint"] = fingerprint
+            self._write_snapshot(snapshot)
+            source = "JSON files"
+
+        self.fingerprint = fingerprint
+        self.version = snapshot["version"]
+        self.tables = snapshot["tables"]
+        self.documents = snapshot["documents"]
+        self._folded = {
+            category: {name.lower(): name for name in table}
+            for category, table in self.tables.items()
+        }
+        self._normalized = {}
+        print(f"[GameData] Loaded {sum(len(t) for t in self.tables.values())} entries from {source} (version {self.version[:12]})")
+
+    def _source_files(self):
+        """Yield (relative path, absolute path) for every JSON file the catalog reads, in a stable order."""
+        for category in CATEGORIES:
+            folder = os.path.join(self.data_dir, category)
+            if not os.path.isdir(folder):
+                continue
+            for filename in sorted(os.listdir(folder)):
+                if filename.endswith(".json"):
+                    yield f"{category}/{filename}", os.path.join(folder, filename)
+        for filename in sorted(DOCUMENTS.values()):
+            path = os.path.join(self.data_dir, filename)
+            if os.path.isfile(path):
+                yield filename, path
+
+    def _fingerprint(self) -> str:
+        """
+        Cheap change detector: a hash of every source file's path, size and
+        modification time. Only stats the files, never reads them.
+        """
+        h = hashlib.sha256()
+        for rel_path, path in self._source_files():
+            st = os.stat(path)
+            h.update(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def _build_from_json(self) -> dict:
+        """Parse every source file and hash their contents into the data version."""
+        h = hashlib.sha256()
+        tables = {category: {} for category in CATEGORIES}
+        documents = {key: {} for key in DOCUMENTS}
+        document_keys = {filename: key for key, filename in DOCUMENTS.items()}
+
+        for rel_path, path in self._source_files():
+            with open(path, "rb") as f:
+                raw = f.read()
+            h.update(rel_path.encode("utf-8") + b"\0" + raw)
+            try:
+                data = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                print(f"[GameData] Skipping unreadable file {path}: {e}")
+                continue
+            if rel_path in document_keys:
+                documents[document_keys[rel_path]] = data
+            else:
+                category, filename = rel_path.split("/", 1)
+                tables[category][filename[:-5]] = data
+
+        return {
+            "format": SNAPSHOT_FORMAT,
+            "version": h.hexdigest(),
+            "tables": tables,
+            "documents": documents,
+        }
+
+    def _read_snapshot(self, fingerprint: str):
+        """Return the stored snapshot if it was built from the current files, else None."""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"[GameData] Ignoring unreadable snapshot {self.snapshot_path}: {e}")
+            return None
+        if not isinstance(snapshot, dict):
+            return None
+        if snapshot.get("format") != SNAPSHOT_FORMAT or snapshot.get("fingerprint") != fingerprint:
+            print("[GameData] Snapshot is out of date, rebuilding from JSON files")
+            return None
+        return snapshot
+
+    def _write_snapshot(self, snapshot: dict):
+        """Atomically replace the snapshot file; failures only cost the next cold start."""
+        if not self.snapshot_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            tmp_path = f"{self.snapshot_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"[GameData] Could not write snapshot {self.snapshot_path}: {e}")
+
+    def resolve(self, category: str, name: str):
+        """Return the stored file name for `name`, trying an exact then a case-insensitive match."""
+        table = self.tables.get(category, {})
+        if name in table:
+            return name
+        return self._folded.get(category, {}).get(name.lower())
+
+    def get(self, category: str, name: str, normalized: bool = False):
+        """
+        Return the record for `name` in `category`, or None if it doesn't exist.
+        With normalized=True, all keys are lowercased (computed once per record).
+        """
+        if not isinstance(name, str):
+            return None
+        key = self.resolve(category, name)
+        if key is None:
+            return None
+        record = self.tables[category][key]
+        if not normalized:
+            return record
+        cache_key = (category, key)
+        if cache_key not in self._normalized:
+            self._normalized[cache_key] = normalize_keys(record)
+        return self._normalized[cache_key]
+
+    def names(self, category: str) -> list:
+        """All entry names in a category, sorted by file name."""
+        return list(self.tables.get(category, {}))
+
+    def records(self, category: str) -> dict:
+        """The full name -> record mapping of a category."""
+        return self.tables.get(category, {})
+
+    def document(self, key: str):
+        """One of the stand-alone documents listed in DOCUMENTS."""
+        return self.documents.get(key, {})
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> GameData:
+    """Return the shared catalog, loading Data/ on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = GameData()
+    return _catalog
+
+def reload_catalog() -> bool:
+    """
+    Re-check Data/ and, if any file changed since the catalog was loaded,
+    load a new catalog and swap it in. Indexes and caches keyed on the data
+    version rebuild on their next use. Returns True if a new catalog was
+    loaded. Blocking; run it in a worker thread.
+    """
+    global _catalog
+    current = get_catalog()
+    with _catalog_lock:
+        if _catalog is not current or current._fingerprint() == current.fingerprint:
+            return False
+        _catalog = GameData(current.data_dir, current.snapshot_path)
+    return True
+
+if __name__ == "__main__":
+    # Build step: refresh the snapshot so the next start skips the JSON files
+    catalog = GameData()
+    print(f"[GameData] Snapshot at {catalog.snapshot_path} is version {catalog.version}")
@@ -1,21 +1,14 @@
 import random
-import json
-import os
+from dataclasses import dataclass
+from typing import List
 from database import Database
+from game_data import get_catalog
 
 CHARACTERS_DIR = "Characters"
 CRIT = 6
 FAIL_THRESHOLD = 3
 DEFAULT_CRIT_DIE_COUNT = 3  # Change this if your game's default is something else
 
-def normalize_keys(obj):
-    """Recursively convert all dictionary keys to lowercase."""
-    if isinstance(obj, dict):
-        return {k.lower(): normalize_keys(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [normalize_keys(i) for i in obj]
-    return obj
-
 class ParsedRollQuery:
     def __init__(self, amount: int = 1, sides: int = 6, flat_addition: int = 0, crit_6_count: int = DEFAULT_CRIT_DIE_COUNT):
         self.amount = max(1, min(amount, 100))  # Clamp between 1 and 100
@@ -45,65 +38,106 @@ class ParsedRollQuery:
         """Returns a query string that can be reused for the button callback."""
         return f"{self.amount}d{self.sides}+{self.flat_addition}" if self.flat_addition > 0 else f"{self.amount}d{self.sides}"
 
+    def roll(self) -> "RollResult":
+        """Roll the dice and return the structured result."""
+        # Successes are only counted for pure `d6` rolls
+        counts_successes = self.sides == 6 and self.flat_addition == 0
+
+        dice = [random.randint(1, self.sides) for _ in range(self.amount)]
+        return RollResult.from_dice(self, dice, counts_successes)
+
     def execute(self) -> str:
-        # Determine if we should display successes based on pure `d6` rolls
-        is_pure_d6 = self.sides == 6 and self.flat_addition == 0
-        display_successes = is_pure_d6
-
-        results = []
-        total = self.flat_addition
-        six_count = 0
-        successes = 0
-
-        for _ in range(self.amount):
-            value = random.randint(1, self.sides)
-            total += value
-            results.append(value)
-            if display_successes and value > FAIL_THRESHOLD:
-                successes += 1
-                if value == CRIT:
-                    six_count += 1
-
-        # Format results to apply bold for 4, 5, and bold + underscore for 6
+        """Roll the dice and return the result as Markdown."""
+        return self.roll().to_markdown()
+
+@dataclass
+class RollResult:
+    """The outcome of one ParsedRollQuery roll; Markdown is only built when rendering."""
+    amount: int
+    sides: int
+    flat_addition: int
+    crit_6_count: int
+    dice: List[int]
+    total: int
+    successes: int
+    six_count: int
+    counts_successes: bool  # False for non-d6 or flat-modified rolls, which show no successes
+
+    @classmethod
+    def from_dice(cls, query: ParsedRollQuery, dice: List[int], counts_successes: bool) -> "RollResult":
+        successes = six_count = 0
+        if counts_successes:
+            successes = sum(1 for value in dice if value > FAIL_THRESHOLD)
+            six_count = dice.count(CRIT)
+        return cls(
+            amount=query.amount,
+            sides=query.sides,
+            flat_addition=query.flat_addition,
+            crit_6_count=query.crit_6_count,
+            dice=dice,
+            total=sum(dice) + query.flat_addition,
+            successes=successes,
+            six_count=six_count,
+            counts_successes=counts_successes,
+        )
+
+    @property
+    def crit(self) -> bool:
+        return self.counts_successes and self.crit_6_count > 0 and self.six_count >= self.crit_6_count
+
+    def dice_line(self) -> str:
+        """e.g. "3d6 — 2, **4**, **__6__**" (bold for successes, underlined crits)."""
         result_list = ", ".join(
             f"**__{x}__**" if x == CRIT else f"**{x}**" if x > FAIL_THRESHOLD else str(x)
-            for x in results
+            for x in self.dice
         )
-
-        # Display basic roll result
         text = f"{self.amount}d{self.sides}"
         if self.flat_addition > 0:
-            text += f"+{self.flat_addition} — {result_list} + {self.flat_addition} = {total}"
+            text += f"+{self.flat_addition} — {result_list} + {self.flat_addition} = {self.total}"
         else:
             text += f" — {result_list}"
-
-        # Append success and critical information only if display_successes is True
-        if display_successes:
-            success_string = "Success!" if successes == 1 else "Successes!"
-            crit_string = " **(CRIT!)**" if (self.crit_6_count > 0 and six_count >= self.crit_6_count) else ""
-            text += f"\n**{successes}** {success_string}{crit_string}"
-
         return text
 
-# Load a specific legendary move from a JSON file
+    def successes_line(self) -> str:
+        """e.g. "**2** Successes! **(CRIT!)**", or "" when successes aren't counted."""
+        if not self.counts_successes:
+            return ""
+        success_string = "Success!" if self.successes == 1 else "Successes!"
+        crit_string = " **(CRIT!)**" if self.crit else ""
+        return f"**{self.successes}** {success_string}{crit_string}"
+
+    def summary_line(self) -> str:
+        """"<dice> – <successes>" on one line, or just the dice when successes aren't counted."""
+        successes_line = self.successes_line()
+        return f"{self.dice_line()} – {successes_line}" if successes_line else self.dice_line()
+
+    def to_markdown(self) -> str:
+        successes_line = self.successes_line()
+        return f"{self.dice_line()}\n{successes_line}" if successes_line else self.dice_line()
+
+    def __str__(self) -> str:
+        return self.to_markdown()
+
+def _lookup(category: str, name, normalized: bool = False):
+    """
+    A shallow copy of a catalog record, so callers can change the top-level
+    fields freely like they could with the old per-call JSON loads. Nested
+    lists and dicts are still shared with the catalog; don't modify them.
+    """
+    record = get_catalog().get(category, name, normalized=normalized)
+    if isinstance(record, (dict, list)):
+        return type(record)(record)
+    return record
+
+# Load a specific legendary move from the game data catalog
 def load_legend_move(move_name):
-    """Load a move from a JSON file based on the move name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "legend_moves", f"{move_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
-
-# Load a specific move from a JSON file
+    """Look up a legendary move by name; returns None if it doesn't exist."""
+    return _lookup("legend_moves", move_name)
+
+# Load a specific move from the game data catalog
 def load_move(move_name):
-    """Load a move from a JSON file based on the move name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "moves", f"{move_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a move by name; returns None if it doesn't exist."""
+    return _lookup("moves", move_name)
 
 # Retrieve a move by name (if loading multiple moves at once)
 def get_move(move_name):
@@ -114,64 +148,29 @@ def get_move(move_name):
     return None
 
 def load_ability(ability_name):
-    """Load an ability from a JSON file based on the ability name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "abilities", f"{ability_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return normalize_keys(json.load(f))  # Normalize the keys!
-    except FileNotFoundError:
-        return None
+    """Look up an ability by name, with all keys lowercased."""
+    return _lookup("abilities", ability_name, normalized=True)
 
 def load_rule(rule_name):
-    """Load a rule from a JSON file based on the rule name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "rules", f"{rule_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a rule by name; returns None if it doesn't exist."""
+    return _lookup("rules", rule_name)
 
 def load_status(status_name):
-    """Load a status from a JSON file based on the status name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "status", f"{status_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a status by name; returns None if it doesn't exist."""
+    return _lookup("status", status_name)
 
 def load_weather(weather_name):
-    """Load a weather effect from a JSON file based on the weather name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "weather", f"{weather_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:  # Ensure UTF-8 encoding for special characters
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a weather effect by name; returns None if it doesn't exist."""
+    return _lookup("weather", weather_name)
 
 def load_item(item_name):
-    """Load an item from a JSON file based on the item name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "items", f"{item_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up an item by name; returns None if it doesn't exist."""
+    return _lookup("items", item_name)
 
 def load_potion(potion_name):
-    """Load a potion from a JSON file based on the potion name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "potions", f"{potion_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a potion by name; returns None if it doesn't exist."""
+    return _lookup("potions", potion_name)
 
 def load_z_move(zmove_name):
-    """Load a Z‑Move from a JSON file based on the z‑move name."""
-    file_path = os.path.join(os.path.dirname(__file__), "Data", "z_moves", f"{zmove_name}.json")
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None  # Return None if the file does not exist
+    """Look up a Z‑Move by name; returns None if it doesn't exist."""
+    return _lookup("z_moves", zmove_name)
@@ -0,0 +1,83 @@
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from game_data import get_catalog
+from pagination import paginate_lines
+
+class ItemIndex:
+    """
+    Every item in Data/items, sorted by name and rendered to its
+    /filter_items line once, plus the set of item positions for each
+    category and rarity (matched case-insensitively). Combined filters are
+    set intersections; the pages for each filter are built on first use
+    and kept.
+    """
+
+    def __init__(self, catalog):
+        items = [catalog.get("items", name, normalized=True) for name in catalog.names("items")]
+        items.sort(key=lambda i: str(i.get("name", "Unknown")).lower())
+
+        self.lines: List[str] = [
+            f"**{i.get('name', 'Unknown')}** - {i.get('category', '')} - {i.get('rarity', '')}"
+            for i in items
+        ]
+        self.by_category = self._invert(items, "category")
+        self.by_rarity = self._invert(items, "rarity")
+        self.categories: List[str] = sorted({i["category"] for i in items if i.get("category")})
+        self.rarities: List[str] = sorted({i["rarity"] for i in items if i.get("rarity")})
+        self._pages: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, ...]] = {}
+
+    @staticmethod
+    def _invert(items: list, field: str) -> Dict[str, FrozenSet[int]]:
+        positions: Dict[str, set] = {}
+        for pos, item in enumerate(items):
+            value = item.get(field)
+            if value:
+                positions.setdefault(str(value).lower(), set()).add(pos)
+        return {value: frozenset(found) for value, found in positions.items()}
+
+    def matching(self, category: str = None, rarity: str = None) -> List[int]:
+        """Positions (in name order) of the items passing both filters; None means no filter."""
+        found = None
+        for table, value in ((self.by_category, category), (self.by_rarity, rarity)):
+            if value:
+                matches = table.get(value.lower(), frozenset())
+                found = matches if found is None else found & matches
+        if found is None:
+            return list(range(len(self.lines)))
+        return sorted(found)
+
+    def pages(self, category: str = None, rarity: str = None) -> Tuple[str, ...]:
+        """The /filter_items messages for a filter, or () when nothing matches."""
+        key = (category.lower() if category else None, rarity.lower() if rarity else None)
+        found = self._pages.get(key)
+        if found is None:
+            positions = self.matching(category, rarity)
+            found = paginate_lines([self.lines[pos] for pos in positions]) if positions else ()
+            # Only known filters are kept, so free text typed by users can't grow the cache
+            if (key[0] is None or key[0] in self.by_category) and (key[1] is None or key[1] in self.by_rarity):
+                self._pages[key] = found
+        return found
+
+_index = None
+_index_version = None
+_index_items = None
+_index_lock = threading.Lock()
+
+def get_item_index() -> ItemIndex:
+    """
+    Return the shared item index. After /reload_data it is rebuilt only
+    when Data/items itself changed, not on every new data version.
+    """
+    global _index, _index_version, _index_items
+    catalog = get_catalog()
+    if _index is None or _index_version != catalog.version:
+        with _index_lock:
+            if _index is None or _index_version != catalog.version:
+                items = catalog.records("items")
+                if _index is None or items != _index_items:
+                    _index = ItemIndex(catalog)
+                    print(f"[ItemIndex] Indexed {len(_index.lines)} items")
+                _index_items = items
+                _index_version = catalog.version
+    return _index
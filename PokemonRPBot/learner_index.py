@@ -0,0 +1,82 @@
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from game_data import get_catalog
+from species import RANK_ORDER
+
+# Non-rank moves sections a species can learn from, in display order
+LEARN_SOURCES = ["tm", "egg", "tutor"]
+# Source of every move listed under one of the RANK_ORDER sections
+RANK_SOURCE = "rank"
+SOURCE_LABELS = {RANK_SOURCE: "Rank-up", "tm": "TM", "egg": "Egg", "tutor": "Tutor"}
+
+@dataclass(frozen=True)
+class Learner:
+    """One way a species learns a move: at a rank, or from a TM, egg or tutor."""
+    species: str
+    source: str            # RANK_SOURCE or one of LEARN_SOURCES
+    rank: Optional[str]    # set for RANK_SOURCE only
+
+    @property
+    def label(self) -> str:
+        if self.source == RANK_SOURCE:
+            return self.rank.title()
+        return SOURCE_LABELS[self.source]
+
+class LearnerIndex:
+    """
+    Inverted index of the species' own moves sections: move name (case-
+    insensitive) -> every Learner of it, ordered by species file name, then
+    rank, then TM/Egg/Tutor.
+    """
+
+    def __init__(self, catalog):
+        self._by_move: Dict[str, List[Learner]] = {}
+        self._names: Dict[str, str] = {}  # lowercase -> first spelling seen
+        sections = [(rank, RANK_SOURCE, rank) for rank in RANK_ORDER]
+        sections += [(source, source, None) for source in LEARN_SOURCES]
+
+        for name in sorted(catalog.names("pokemon"), key=lambda n: f"{n}.json"):
+            record = catalog.get("pokemon", name, normalized=True)
+            moves = record.get("moves", {})
+            if not isinstance(moves, dict):
+                continue
+            species = record.get("name") or name
+            for key, source, rank in sections:
+                for move in moves.get(key) or []:
+                    folded = move.lower()
+                    self._names.setdefault(folded, move)
+                    self._by_move.setdefault(folded, []).append(Learner(species, source, rank))
+
+        self.move_names: List[str] = sorted(self._names.values(), key=str.lower)
+
+    def learners(self, move: str, rank: str = None, source: str = None) -> Tuple[str, List[Learner]]:
+        """
+        (move name as spelled in the data, matching learners). `rank` keeps
+        rank-up entries at that rank or earlier; `source` keeps one source.
+        """
+        folded = move.lower()
+        found = self._by_move.get(folded, [])
+        if source:
+            found = [l for l in found if l.source == source]
+        if rank:
+            allowed = set(RANK_ORDER[:RANK_ORDER.index(rank.lower()) + 1])
+            found = [l for l in found if l.source != RANK_SOURCE or l.rank in allowed]
+        return self._names.get(folded, move), found
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+def get_learner_index() -> LearnerIndex:
+    """Return the shared move -> learners index, rebuilt when the game data changes."""
+    global _index, _index_version
+    catalog = get_catalog()
+    if _index is None or _index_version != catalog.version:
+        with _index_lock:
+            if _index is None or _index_version != catalog.version:
+                _index = LearnerIndex(catalog)
+                _index_version = catalog.version
+                print(f"[LearnerIndex] Indexed {len(_index.move_names)} learnable moves")
+    return _index
@@ -0,0 +1,97 @@
+import random
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from game_data import get_catalog
+
+class AliasTable:
+    """
+    Weighted choice in O(1) per draw (Vose's alias method). Building the
+    table is O(n) and happens once per loot table, not on every open.
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("An alias table needs at least one entry")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("An alias table needs a positive total weight")
+
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        # Whatever is left is 1 up to floating point error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self, rng=random) -> int:
+        """Index of one weighted draw."""
+        column = int(rng.random() * len(self.prob))
+        return column if rng.random() < self.prob[column] else self.alias[column]
+
+class LootTable:
+    """
+    One lockbox compiled for sampling: a table over its categories (boxes
+    whose data file is a dict of categories) and one over the items of
+    each category (or of the box itself when it is a flat item list).
+    """
+
+    def __init__(self, name: str, data):
+        self.name = name
+        if isinstance(data, dict):
+            self.categories: List[Optional[str]] = list(data)
+            item_lists = [data[category]["items"] for category in self.categories]
+            self._category_table = AliasTable([data[c]["probability"] for c in self.categories])
+        else:
+            self.categories = [None]
+            item_lists = [data]
+            self._category_table = None
+        self._items = [[entry["item"] for entry in items] for items in item_lists]
+        self._item_tables = [AliasTable([entry["probability"] for entry in items]) for items in item_lists]
+
+    def open(self, rng=random) -> Tuple[Optional[str], str]:
+        """Open one box: (category or None, item)."""
+        c = self._category_table.draw(rng) if self._category_table else 0
+        return self.categories[c], self._items[c][self._item_tables[c].draw(rng)]
+
+    def open_many(self, count: int, rng=random) -> Counter:
+        """Open `count` boxes and tally how often each item came out."""
+        return Counter(self.open(rng)[1] for _ in range(count))
+
+_tables = None
+_box_names = []
+_tables_version = None
+_tables_lock = threading.Lock()
+
+def get_loot_tables() -> Dict[str, LootTable]:
+    """Box name -> LootTable for every file in Data/lock_boxes, rebuilt when the data changes."""
+    global _tables, _box_names, _tables_version
+    catalog = get_catalog()
+    if _tables is None or _tables_version != catalog.version:
+        with _tables_lock:
+            if _tables is None or _tables_version != catalog.version:
+                tables = {}
+                for name, data in catalog.records("lock_boxes").items():
+                    try:
+                        tables[name] = LootTable(name, data)
+                    except (KeyError, TypeError, ValueError) as e:
+                        print(f"[LootTables] Skipping lock box {name}: {e!r}")
+                _tables = tables
+                _box_names = sorted(tables)
+                _tables_version = catalog.version
+    return _tables
+
+def get_box_names() -> List[str]:
+    """Sorted lock box names, the same list object until the data changes (for autocomplete)."""
+    get_loot_tables()
+    return _box_names
@@ -0,0 +1,65 @@
+import threading
+from typing import Dict, Optional
+
+from game_data import get_catalog, normalize_keys
+
+MAX_GUARD = "Max Guard"
+
+def _types(move: dict) -> list:
+    """The lowercased type(s) of a normalized move record."""
+    value = move.get("type")
+    values = value if isinstance(value, list) else [value]
+    return [t.lower() for t in values if isinstance(t, str) and t]
+
+def build_type_map(records: dict, skip=()) -> Dict[str, dict]:
+    """
+    Type (lowercase) -> move record for one folder of Max-style moves.
+    When several moves share a type, attacking moves win over Support ones
+    and then the alphabetically first name wins, so the pick never depends
+    on directory order.
+    """
+    candidates = []
+    for name in sorted(records, key=str.lower):
+        if name.lower() in skip:
+            continue
+        data = records[name]
+        for move in (data if isinstance(data, list) else [data]):
+            if not isinstance(move, dict):
+                continue
+            normalized = normalize_keys(move)
+            is_support = str(normalized.get("category", "")).lower() == "support"
+            candidates.append((is_support, name.lower(), _types(normalized), move))
+
+    by_type = {}
+    for _, _, types, move in sorted(candidates, key=lambda c: (c[0], c[1])):
+        for t in types:
+            by_type.setdefault(t, move)
+    return by_type
+
+class MaxMoveIndex:
+    """Max and G-Max moves keyed by type, plus Max Guard for Support moves."""
+
+    def __init__(self, catalog):
+        max_records = catalog.records("max_moves")
+        guard_names = {name.lower() for name in max_records if name.lower().startswith(MAX_GUARD.lower())}
+        self.max_by_type = build_type_map(max_records, skip=guard_names)
+        self.g_max_by_type = build_type_map(catalog.records("g_max_moves"))
+        guard = catalog.get("max_moves", MAX_GUARD)
+        if guard is None and guard_names:
+            guard = catalog.get("max_moves", min(guard_names))
+        self.max_guard: Optional[dict] = guard
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+def get_max_move_index() -> MaxMoveIndex:
+    """Return the shared Max/G-Max move index, rebuilt when the game data changes."""
+    global _index, _index_version
+    catalog = get_catalog()
+    if _index is None or _index_version != catalog.version:
+        with _index_lock:
+            if _index is None or _index_version != catalog.version:
+                _index = MaxMoveIndex(catalog)
+                _index_version = catalog.version
+    return _index
@@ -0,0 +1,109 @@
+import threading
+from dataclasses import dataclass
+from game_data import get_catalog
+
+# Effect keywords the encounter generator treats as multi-hit moves
+SUCCESSIVE_KEYWORDS = ['successive', 'double', 'triple']
+MULTI_HIT_KEYWORDS = SUCCESSIVE_KEYWORDS + ['multi-hit', 'hits']
+
+@dataclass(frozen=True)
+class MoveFeatures:
+    """Everything the encounter scoring needs to know about one move."""
+    name: str
+    category: str
+    type: str
+    target: str
+    power: int             # numeric power, falling back to N in a "Rank + N" damage string
+    base_power: int        # numeric power only, 0 when it isn't a number
+    damage_power: int      # N from a "Stat + N" damage string, or the damage string itself if numeric
+    target_score: int      # 2 for All Foes / Area moves, 1 otherwise
+    successive: bool       # effect mentions successive/double/triple hits
+    multi_hit: bool        # successive, or effect mentions multi-hit/hits
+    crit: int
+    recoil: bool
+    charges: bool          # effect mentions charging or recharging
+    insight_accuracy: bool # accuracy is rolled with Insight
+
+def _power(move: dict) -> int:
+    try:
+        return int(move.get('power', 0))
+    except (TypeError, ValueError):
+        damage_str = move.get('damage', '')
+        if isinstance(damage_str, str) and '+' in damage_str:
+            parts = damage_str.split('+')
+            if parts[1].strip().isdigit():
+                return int(parts[1].strip())
+        return 0
+
+def _base_power(move: dict) -> int:
+    try:
+        return int(move.get('power', 0))
+    except (TypeError, ValueError):
+        return 0
+
+def _damage_power(move: dict) -> int:
+    damage_str = move.get('damage', '0')
+    if not isinstance(damage_str, str):
+        return 0
+    try:
+        if '+' in damage_str:
+            parts = damage_str.split('+')
+            return int(parts[1].strip()) if parts[1].strip().isdigit() else 0
+        return int(damage_str)
+    except ValueError:
+        return 0
+
+def _crit(move: dict) -> int:
+    try:
+        return int(move.get('crit', '0'))
+    except (TypeError, ValueError):
+        return 0
+
+def build_move_features(name: str, move: dict) -> MoveFeatures:
+    """Compute the feature record for a move with lowercased keys."""
+    effect = move.get('effect', '').lower()
+    target = move.get('target', '')
+    accuracy = move.get('accuracy', '')
+    return MoveFeatures(
+        name=name,
+        category=move.get('category', ''),
+        type=move.get('type', ''),
+        target=target,
+        power=_power(move),
+        base_power=_base_power(move),
+        damage_power=_damage_power(move),
+        target_score=2 if 'All Foes' in target or 'Area' in target else 1,
+        successive=any(kw in effect for kw in SUCCESSIVE_KEYWORDS),
+        multi_hit=any(kw in effect for kw in MULTI_HIT_KEYWORDS),
+        crit=_crit(move),
+        recoil=bool(move.get('recoil', False)) or 'recoil' in effect,
+        charges='charge' in effect,
+        insight_accuracy='insight' in accuracy.lower() if isinstance(accuracy, str) else False,
+    )
+
+_features = None
+_features_version = None
+_features_lock = threading.Lock()
+
+def get_move_features() -> dict:
+    """Move name -> MoveFeatures for every move in the catalog, rebuilt when the data changes."""
+    global _features, _features_version
+    catalog = get_catalog()
+    if _features is None or _features_version != catalog.version:
+        with _features_lock:
+            if _features is None or _features_version != catalog.version:
+                _features = {
+                    name: build_move_features(name, catalog.get('moves', name, normalized=True))
+                    for name in catalog.names('moves')
+                }
+                _features_version = catalog.version
+    return _features
+
+def move_features(move_name: str):
+    """Feature record for one move (case-insensitive like load_move), or None."""
+    features = get_move_features()
+    found = features.get(move_name)
+    if found is None and isinstance(move_name, str):
+        key = get_catalog().resolve('moves', move_name)
+        found = features.get(key) if key else None
+    return found
@@ -0,0 +1,106 @@
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Tuple
+
+from game_data import get_catalog
+from move_features import get_move_features
+
+# Move classes /metronome can leave out
+MAX_MOVES = "max"
+CHARGE_MOVES = "charge"
+
+def g(obj, *keys, default="—"):
+    """Return the first key that exists in *obj* (case-insensitive)."""
+    for k in keys:
+        if k in obj:               # exact match
+            return obj[k]
+        k_low = k.lower()
+        for kk in obj:             # fallback: case-folded match
+            if kk.lower() == k_low:
+                return obj[kk]
+    return default
+
+@dataclass(frozen=True)
+class MoveSummary:
+    """The display fields of a move, with old- and new-style field names reconciled."""
+    name: str
+    description: str
+    type: str
+    category: str
+    target: str
+    damage: Any
+    power: Any             # a number in most files, kept as stored
+    accuracy: str
+    effect: str
+
+    @classmethod
+    def from_record(cls, file_name: str, move: dict) -> "MoveSummary":
+        return cls(
+            name=g(move, "Name", "name", default=file_name),
+            description=g(move, "Description", "description", default=""),
+            type=g(move, "Type", "type"),
+            category=g(move, "Category", "category"),
+            target=g(move, "Target", "target"),
+            damage=g(move, "Damage1", "damage", default=""),
+            power=g(move, "Power", "power", default=""),
+            accuracy=g(move, "Accuracy1", "accuracy"),
+            effect=g(move, "Effect", "effect"),
+        )
+
+class MoveIndex:
+    """
+    Every move in Data/moves as a MoveSummary, plus the set of moves in
+    each excludable class. Pools for each combination of excluded classes
+    are built on first use and kept, so a random pick is one choice() call.
+    """
+
+    def __init__(self, catalog):
+        names = catalog.names("moves")
+        self.moves: Tuple[MoveSummary, ...] = tuple(
+            MoveSummary.from_record(name, catalog.get("moves", name) or {}) for name in names
+        )
+
+        max_names = set(catalog.names("max_moves")) | set(catalog.names("g_max_moves"))
+        features = get_move_features()
+        self.classes: Dict[str, FrozenSet[int]] = {
+            MAX_MOVES: frozenset(
+                i for i, name in enumerate(names)
+                if name in max_names or name.startswith(("Max ", "G-Max "))
+            ),
+            CHARGE_MOVES: frozenset(
+                i for i, name in enumerate(names)
+                if name in features and features[name].charges
+            ),
+        }
+        self._pools: Dict[FrozenSet[str], Tuple[MoveSummary, ...]] = {}
+
+    def pool(self, exclude: FrozenSet[str] = frozenset()) -> Tuple[MoveSummary, ...]:
+        """All moves outside the excluded classes."""
+        found = self._pools.get(exclude)
+        if found is None:
+            skipped = set().union(*(self.classes[c] for c in exclude))
+            found = tuple(move for i, move in enumerate(self.moves) if i not in skipped)
+            self._pools[exclude] = found
+        return found
+
+    def random_move(self, exclude: FrozenSet[str] = frozenset()):
+        """A random move outside the excluded classes, or None if none are left."""
+        pool = self.pool(exclude)
+        return random.choice(pool) if pool else None
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+def get_move_index() -> MoveIndex:
+    """Return the shared move index, rebuilt when the game data changes."""
+    global _index, _index_version
+    catalog = get_catalog()
+    if _index is None or _index_version != catalog.version:
+        with _index_lock:
+            if _index is None or _index_version != catalog.version:
+                _index = MoveIndex(catalog)
+                _index_version = catalog.version
+                print(f"[MoveIndex] Indexed {len(_index.moves)} moves")
+    return _index
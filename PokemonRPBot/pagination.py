@@ -0,0 +1,60 @@
+from typing import List, Sequence, Tuple
+
+import discord
+
+# Discord's message limit
+MESSAGE_LIMIT = 2000
+
+def paginate_lines(lines: Sequence[str], header: str = "", limit: int = MESSAGE_LIMIT) -> Tuple[str, ...]:
+    """
+    Pack lines into as few pages of at most `limit` characters as possible,
+    starting every page with `header`. Lines are never split; a single line
+    longer than a page is truncated.
+    """
+    pages: List[str] = []
+    current = header
+    for line in lines:
+        if len(current) + len(line) + 1 > limit and current != header:
+            pages.append(current)
+            current = header
+        if len(header) + len(line) + 1 > limit:
+            line = line[:limit - len(header) - 4] + "..."
+        current = f"{current}\n{line}" if current else line
+    if current != header or not pages:
+        pages.append(current)
+    return tuple(pages)
+
+class PageView(discord.ui.View):
+    """Previous/Next buttons over a fixed list of prerendered pages, for the user who asked."""
+
+    def __init__(self, pages: Sequence[str], owner_id: int, timeout: float = 180.0):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.owner_id = owner_id
+        self.index = 0
+        self._refresh()
+
+    def _refresh(self):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index >= len(self.pages) - 1
+        self.counter.label = f"{self.index + 1}/{len(self.pages)}"
+
+    async def _show(self, interaction: discord.Interaction, index: int):
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("You did not invoke this command.", ephemeral=True)
+            return
+        self.index = index
+        self._refresh()
+        await interaction.response.edit_message(content=self.pages[self.index], view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, max(self.index - 1, 0))
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True)
+    async def counter(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, min(self.index + 1, len(self.pages) - 1))
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from helpers import ParsedRollQuery, FAIL_THRESHOLD
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only /playtest_sim needs it
+    np = None
+
+# Playtest crit rules: d100 under base chance + crit_modifier per success over 1
+BASE_CRIT_CHANCE = 15
+CRIT_ABILITY_CRIT_CHANCE = 30
+
+# Reroll policies the simulator can apply (a roll can be rerolled once)
+REROLL_NONE = "none"
+REROLL_ACCURACY_ON_MISS = "accuracy on miss"
+REROLL_LOW_DAMAGE = "damage below average"
+REROLL_EITHER = "accuracy on miss, else low damage"
+
+SIM_CHUNK_SIZE = 100_000
+DAMAGE_PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+def crit_chance(final_successes: int, crit_modifier: int, crit_ability: bool) -> Tuple[int, int, int]:
+    """(crit chance %, base chance %, successes over the first) for the playtest crit roll."""
+    base = CRIT_ABILITY_CRIT_CHANCE if crit_ability else BASE_CRIT_CHANCE
+    excess = max(0, final_successes - 1)
+    return min(100, base + excess * crit_modifier), base, excess
+
+def is_no_damage(damage: str) -> bool:
+    """True for damage strings that mean a status move ("0", "0d6", "")."""
+    damage_clean = damage.replace(" ", "").lower()
+    return damage_clean in ("0", "0d", "0d6", "0d8", "") or damage_clean.startswith("0d")
+
+@dataclass
+class SimulationResult:
+    trials: int
+    hit_rate: float
+    crit_rate: float                      # hits that also crit
+    mean_damage: float                    # per attack, misses count as 0
+    mean_damage_on_hit: float
+    damage_percentiles: Dict[int, int]    # percentile -> damage successes, over hits
+
+def _success_query(label: str, query: str) -> ParsedRollQuery:
+    """Parse a roll the simulator can count successes for (plain d6 pools only)."""
+    parsed = ParsedRollQuery.from_query(query)
+    if parsed.sides != 6 or parsed.flat_addition != 0:
+        raise ValueError(
+            f"{label} must be a plain d6 pool such as '5d6'; '{query}' has no successes to count"
+        )
+    return parsed
+
+def _pool(rng, query: ParsedRollQuery, size: int):
+    """Successes of `size` rolls of a d6 query, counted like ParsedRollQuery."""
+    dice = rng.integers(1, query.sides + 1, size=(size, query.amount), dtype=np.int8)
+    return (dice > FAIL_THRESHOLD).sum(axis=1, dtype=np.int64)
+
+def simulate_playtest(
+    accuracy: str,
+    damage: str,
+    accuracy_mod: int = 0,
+    crit_modifier: int = 2,
+    crit_ability: bool = False,
+    trials: int = 200_000,
+    reroll: str = REROLL_NONE,
+    seed=None,
+) -> SimulationResult:
+    """
+    Simulate /playtest_roll `trials` times, SIM_CHUNK_SIZE attacks per
+    vectorized step. Blocking; run it in a worker thread. Raises
+    ValueError for rolls that do not count successes (non-d6 or +bonus).
+    """
+    acc_query = _success_query("Accuracy", accuracy)
+    dmg_query = None if is_no_damage(damage) else _success_query("Damage", damage)
+    if np is None:
+        raise RuntimeError("NumPy is required for playtest simulations")
+
+    rng = np.random.default_rng(seed)
+    average_damage = dmg_query.amount / 2 if dmg_query else 0
+    reroll_accuracy = reroll in (REROLL_ACCURACY_ON_MISS, REROLL_EITHER)
+    reroll_damage = reroll in (REROLL_LOW_DAMAGE, REROLL_EITHER)
+
+    hits = crits = 0
+    damage_total = 0
+    damage_histogram = np.zeros((dmg_query.amount if dmg_query else 0) + 1, dtype=np.int64)
+
+    done = 0
+    while done < trials:
+        size = min(SIM_CHUNK_SIZE, trials - done)
+        done += size
+
+        final = np.maximum(0, _pool(rng, acc_query, size) + accuracy_mod)
+        hit = final > 0
+
+        # The crit roll always uses the first accuracy roll, rerolled or not
+        chance = np.minimum(
+            100,
+            (CRIT_ABILITY_CRIT_CHANCE if crit_ability else BASE_CRIT_CHANCE)
+            + np.maximum(0, final - 1) * crit_modifier,
+        )
+        crit = rng.integers(1, 101, size=size) <= chance
+
+        used_reroll = np.zeros(size, dtype=bool)
+        if reroll_accuracy:
+            missed = ~hit
+            rerolled = np.maximum(0, _pool(rng, acc_query, int(missed.sum())) + accuracy_mod)
+            hit[missed] = rerolled > 0
+            used_reroll = missed
+
+        if dmg_query is not None:
+            dealt = _pool(rng, dmg_query, size)
+            if reroll_damage:
+                low = hit & ~used_reroll & (dealt < average_damage)
+                dealt[low] = _pool(rng, dmg_query, int(low.sum()))
+            dealt = dealt[hit]
+            damage_total += int(dealt.sum())
+            damage_histogram += np.bincount(dealt, minlength=len(damage_histogram))
+
+        hits += int(hit.sum())
+        crits += int((hit & crit).sum())
+
+    percentiles = {}
+    if hits and dmg_query is not None:
+        cumulative = np.cumsum(damage_histogram)
+        for p in DAMAGE_PERCENTILES:
+            percentiles[p] = int(np.searchsorted(cumulative, hits * p / 100))
+
+    return SimulationResult(
+        trials=trials,
+        hit_rate=hits / trials,
+        crit_rate=crits / trials,
+        mean_damage=damage_total / trials,
+        mean_damage_on_hit=damage_total / hits if hits else 0.0,
+        damage_percentiles=percentiles,
+    )
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+from typing import Tuple
+
+from helpers import CRIT, FAIL_THRESHOLD, DEFAULT_CRIT_DIE_COUNT
+
+SIDES = 6
+
+# Chance of one d6 landing on a failure, a success that isn't a six, or a six
+P_FAIL = FAIL_THRESHOLD / SIDES
+P_CRIT_FACE = (SIDES - CRIT + 1) / SIDES
+P_PLAIN_SUCCESS = 1 - P_FAIL - P_CRIT_FACE
+
+# Largest pool the tables are built for (attack and damage dice go up to 40/80)
+MAX_POOL = 100
+
+@lru_cache(maxsize=None)
+def joint_distribution(dice: int) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Exact joint distribution of a d6 pool: table[successes][sixes] is the
+    chance of rolling that many successes, of which that many are sixes.
+    """
+    table = []
+    for successes in range(dice + 1):
+        row = []
+        fail_part = P_FAIL ** (dice - successes) * comb(dice, successes)
+        for sixes in range(successes + 1):
+            row.append(
+                fail_part
+                * comb(successes, sixes)
+                * P_CRIT_FACE ** sixes
+                * P_PLAIN_SUCCESS ** (successes - sixes)
+            )
+        table.append(tuple(row))
+    return tuple(table)
+
+@lru_cache(maxsize=None)
+def success_distribution(dice: int) -> Tuple[float, ...]:
+    """Chance of exactly k successes for k = 0..dice."""
+    return tuple(sum(row) for row in joint_distribution(dice))
+
+@lru_cache(maxsize=None)
+def at_least(dice: int, successes: int) -> float:
+    """Chance of rolling `successes` or more successes with `dice` d6."""
+    if successes <= 0:
+        return 1.0
+    return sum(success_distribution(dice)[successes:])
+
+@dataclass(frozen=True)
+class AttackOdds:
+    accuracy_dice: int
+    required_accuracy: int
+    crit_6_count: int
+    hit: float             # at least `required_accuracy` successes
+    crit: float            # a hit with at least `crit_6_count` sixes
+    expected_successes: float
+
+    def summary(self) -> str:
+        text = f"{percent(self.hit)} to hit"
+        if self.crit_6_count > 0:
+            text += f", {percent(self.crit)} to crit"
+        return text
+
+@lru_cache(maxsize=4096)
+def attack_odds(accuracy_dice: int, accuracy_reduction: int = 0, crit_6_count: int = DEFAULT_CRIT_DIE_COUNT) -> AttackOdds:
+    """Exact hit and crit chances for an accuracy roll, using the same rules as ParsedRollQuery."""
+    dice = max(1, min(accuracy_dice, MAX_POOL))
+    required = 1 + (accuracy_reduction or 0)
+    table = joint_distribution(dice)
+
+    hit = crit = 0.0
+    for successes in range(required, dice + 1):
+        row = table[successes]
+        hit += sum(row)
+        if crit_6_count > 0:
+            crit += sum(row[crit_6_count:])
+    return AttackOdds(
+        accuracy_dice=dice,
+        required_accuracy=required,
+        crit_6_count=crit_6_count,
+        hit=hit,
+        crit=crit,
+        expected_successes=dice * (1 - P_FAIL),
+    )
+
+def percent(chance: float) -> str:
+    """Format a chance for chat: 2 decimals, with "<0.01%" instead of rounding to zero."""
+    if 0 < chance < 0.0001:
+        return "<0.01%"
+    if 0.9999 < chance < 1:
+        return ">99.99%"
+    return f"{chance * 100:.2f}%"
+
+def odds_footer(accuracy_dice: int, accuracy_reduction: int = 0, crit_6_count: int = DEFAULT_CRIT_DIE_COUNT) -> str:
+    """The "-# Odds: ..." line attack_roll can append to its results."""
+    return f"-# Odds: {attack_odds(accuracy_dice, accuracy_reduction, crit_6_count).summary()}"
@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from game_data import get_catalog
+
+# How many rendered responses to keep across all commands
+DEFAULT_MAX_ENTRIES = 1024
+
+class ResponseCache:
+    """
+    Bounded LRU cache of fully rendered command responses, keyed by
+    (command, entity, data version). When /reload_data loads changed game
+    data (game_data.reload_catalog) every older entry is dropped, so an
+    edited JSON file never shows a stale response after the reload. Hit
+    and miss counts are kept per command.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # (command, entity, version) -> payload
+        self._version = None
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(self, command: str, entity: str, render: Callable[[], Optional[object]]):
+        """
+        The cached payload for `entity`, or render() it and remember the
+        result. None (nothing found) is returned but not cached.
+        """
+        version = get_catalog().version
+        key = (command, entity.lower(), version)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits[command] = self._hits.get(command, 0) + 1
+                return self._entries[key]
+            self._misses[command] = self._misses.get(command, 0) + 1
+
+        payload = render()
+        if payload is not None:
+            with self._lock:
+                if version == self._version:
+                    self._entries[key] = payload
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """command -> {"hits", "misses", "hit_rate"}"""
+        with self._lock:
+            commands = sorted(set(self._hits) | set(self._misses))
+            result = {}
+            for command in commands:
+                hits, misses = self._hits.get(command, 0), self._misses.get(command, 0)
+                result[command] = {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses)}
+            return result
+
+    def __len__(self):
+        return len(self._entries)
+
+_cache = ResponseCache()
+
+def get_response_cache() -> ResponseCache:
+    """Return the response cache shared by the lookup cogs."""
+    return _cache
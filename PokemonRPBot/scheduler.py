@@ -0,0 +1,95 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+class TimerScheduler:
+    """
+    Runs callbacks at wall-clock times using one background task and a
+    min-heap. The task sleeps until the earliest entry is due and is woken
+    early whenever something sooner is scheduled, so nothing polls and
+    idle cost does not grow with the number of pending timers.
+
+    Entries are keyed; scheduling an existing key replaces it and
+    cancelled entries are dropped lazily when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap = []       # [due timestamp, sequence, key, callback, active]
+        self._entries = {}    # key -> heap entry
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._firing = set()  # callbacks in flight; the loop only holds weak references to tasks
+
+    def schedule(self, key, when: float, callback):
+        """
+        Call `await callback()` at Unix time `when` (immediately if it is
+        already in the past). Must be called from the event loop.
+        """
+        self.cancel(key)
+        entry = [when, next(self._counter), key, callback, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        self._ensure_running()
+
+    def cancel(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[4] = False
+
+    def pending(self) -> int:
+        return len(self._entries)
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            while self._heap and not self._heap[0][4]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            entry = heapq.heappop(self._heap)
+            del self._entries[entry[2]]
+            entry[4] = False
+            # Deliver in its own task so a slow send never delays the next timer
+            task = asyncio.create_task(self._fire(entry[2], entry[3]))
+            self._firing.add(task)
+            task.add_done_callback(self._firing.discard)
+
+    @staticmethod
+    async def _fire(key, callback):
+        try:
+            await callback()
+        except Exception as e:
+            print(f"[Scheduler] Timer {key!r} failed: {e!r}")
+
+_scheduler = None
+
+def get_scheduler() -> TimerScheduler:
+    """Return the scheduler shared by every cog."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TimerScheduler()
+    return _scheduler
@@ -0,0 +1,249 @@
+import bisect
+import re
+import threading
+from game_data import get_catalog
+
+# Move ranks in the order a Pokémon unlocks them
+RANK_ORDER = ["bronze", "silver", "gold", "platinum", "diamond", "master"]
+
+def normalize_name(name: str) -> str:
+    """
+    Converts a Pokémon name to a normalized form:
+      - Lowercase
+      - Replaces non-alphanumeric characters with hyphens
+      - Merges multiple hyphens and strips leading/trailing hyphens.
+    Example: "Sirfetch'd" -> "sirfetch-d"
+    """
+    normalized = name.lower()
+    normalized = re.sub(r'[^a-z0-9]', '-', normalized)
+    normalized = re.sub(r'-+', '-', normalized)
+    return normalized.strip('-')
+
+class SpeciesResolver:
+    """
+    Maps user-typed Pokémon names to species file names without scanning
+    Data/pokemon. Matching follows the old directory-scan rules, in order:
+      1. a file literally named after the normalized name (case-insensitive)
+      2. a file whose normalized name equals the normalized name
+      3. a file whose hyphen-free name equals, contains or is contained in
+         the hyphen-free target, preferring the first file in name order
+    """
+
+    def __init__(self, names: list):
+        # Same order as a sorted directory listing, so ties break the way they used to
+        self.names = sorted(names, key=lambda n: f"{n}.json")
+        self._exact = {}
+        self._normalized = {}
+        self._compact = {}  # hyphen-free normalized name -> first file index
+        suffixes = []
+        for idx, name in enumerate(self.names):
+            self._exact.setdefault(name.lower(), idx)
+            norm = normalize_name(name)
+            self._normalized.setdefault(norm, idx)
+            compact = norm.replace("-", "")
+            self._compact.setdefault(compact, idx)
+            for start in range(len(compact)):
+                suffixes.append((compact[start:], idx))
+
+        # Sorted suffixes of every hyphen-free name: all names containing a
+        # target form one contiguous block starting at bisect(target).
+        suffixes.sort()
+        self._suffixes = [s for s, _ in suffixes]
+        self._min_table = self._build_min_table([idx for _, idx in suffixes])
+
+    @staticmethod
+    def _build_min_table(values: list) -> list:
+        """Sparse table so the smallest file index in any suffix block is an O(1) lookup."""
+        table = [values]
+        width = 1
+        while width * 2 <= len(values):
+            prev = table[-1]
+            table.append([min(prev[i], prev[i + width]) for i in range(len(prev) - width)])
+            width *= 2
+        return table
+
+    def _range_min(self, lo: int, hi: int):
+        if lo >= hi:
+            return None
+        level = (hi - lo).bit_length() - 1
+        row = self._min_table[level]
+        return min(row[lo], row[hi - (1 << level)])
+
+    def _fuzzy(self, target: str):
+        # Names that contain the target
+        lo = bisect.bisect_left(self._suffixes, target)
+        hi = bisect.bisect_left(self._suffixes, target + "\uffff")
+        best = self._range_min(lo, hi)
+
+        # Names that are contained in the target
+        for start in range(len(target)):
+            for end in range(start + 1, len(target) + 1):
+                idx = self._compact.get(target[start:end])
+                if idx is not None and (best is None or idx < best):
+                    best = idx
+        return best
+
+    def resolve(self, name: str):
+        """Return the species file name (without .json) for `name`, or None."""
+        normalized = normalize_name(name)
+        idx = self._exact.get(normalized)
+        if idx is None:
+            idx = self._normalized.get(normalized)
+        if idx is None:
+            idx = self._fuzzy(normalized.replace("-", ""))
+        return self.names[idx] if idx is not None else None
+
+_resolver = None
+_resolver_version = None
+_resolver_lock = threading.Lock()
+
+def get_species_resolver() -> SpeciesResolver:
+    """Return the resolver for the current catalog, rebuilding it if the data changed."""
+    global _resolver, _resolver_version
+    catalog = get_catalog()
+    if _resolver is None or _resolver_version != catalog.version:
+        with _resolver_lock:
+            if _resolver is None or _resolver_version != catalog.version:
+                _resolver = SpeciesResolver(catalog.names("pokemon"))
+                _resolver_version = catalog.version
+    return _resolver
+
+def find_species(name: str):
+    """Resolve a Pokémon name to its species file name (without .json), or None."""
+    return get_species_resolver().resolve(name)
+
+def load_species(name: str, normalized: bool = True):
+    """
+    Resolve a Pokémon name and return its data (keys lowercased by default),
+    or None. The record is shared; copy it before changing anything.
+    """
+    key = find_species(name)
+    if key is None:
+        return None
+    return get_catalog().get("pokemon", key, normalized=normalized)
+
+_rank_index = None
+_rank_index_version = None
+_rank_index_lock = threading.Lock()
+
+def build_rank_index(records: dict) -> dict:
+    """
+    Map each rank in RANK_ORDER to the species that have at least one move
+    at that rank or below, in species file order.
+    """
+    index = {rank: [] for rank in RANK_ORDER}
+    for name in sorted(records, key=lambda n: f"{n}.json"):
+        record = records[name]
+        moves = record.get("moves", {}) if isinstance(record, dict) else {}
+        if not isinstance(moves, dict):
+            continue
+        moves = {str(k).lower(): v for k, v in moves.items()}
+        # First rank with any moves; the species qualifies from there upwards
+        first = next((i for i, rank in enumerate(RANK_ORDER) if moves.get(rank)), None)
+        if first is None:
+            continue
+        for rank in RANK_ORDER[first:]:
+            index[rank].append(name)
+    return index
+
+def get_rank_index() -> dict:
+    """Return the rank -> eligible species index for the current catalog, rebuilding it if the data changed."""
+    global _rank_index, _rank_index_version
+    catalog = get_catalog()
+    if _rank_index is None or _rank_index_version != catalog.version:
+        with _rank_index_lock:
+            if _rank_index is None or _rank_index_version != catalog.version:
+                _rank_index = build_rank_index(catalog.records("pokemon"))
+                _rank_index_version = catalog.version
+    return _rank_index
+
+def eligible_species(rank: str) -> list:
+    """Species with moves up to `rank`; unknown ranks fall back to Bronze. The list is shared, don't modify it."""
+    rank = rank.lower()
+    return get_rank_index()[rank if rank in RANK_ORDER else RANK_ORDER[0]]
+
+# Move categories learned by rank, in unlock order, for evolution-line merging
+LINE_RANKS = ["bronze", "silver", "gold", "platinum", "diamond"]
+
+def build_evolution_keys(evo_data: dict) -> dict:
+    """Hyphen-free normalized name -> pokemon_evolutions.json key (first key wins, as the old scan did)."""
+    keys = {}
+    for key in evo_data:
+        keys.setdefault(normalize_name(key).replace("-", ""), key)
+    return keys
+
+_evolution_keys = None
+_evolution_keys_version = None
+_evolution_keys_lock = threading.Lock()
+
+def find_evolution_key(name: str):
+    """The pokemon_evolutions.json key for `name`, ignoring case and punctuation, or None."""
+    global _evolution_keys, _evolution_keys_version
+    catalog = get_catalog()
+    if _evolution_keys is None or _evolution_keys_version != catalog.version:
+        with _evolution_keys_lock:
+            if _evolution_keys is None or _evolution_keys_version != catalog.version:
+                _evolution_keys = build_evolution_keys(catalog.document("evolutions"))
+                _evolution_keys_version = catalog.version
+    return _evolution_keys.get(normalize_name(name).replace("-", ""))
+
+def combine_moves(main_moves: dict, related_moves: list) -> dict:
+    """
+    Combine a Pokémon's moves with those of its pre-evolutions:
+      - For TM/Egg/Tutor and other non-rank categories, union and mark extras with '*'
+      - For badge ranks, merge in progression order, drop moves already
+        learned at an earlier rank and mark extras
+    `related_moves` holds the moves sections of the related species.
+    """
+    combined = {}
+
+    # 1) Non-rank categories: tm, egg, tutor, etc.
+    for cat in [cat for cat in main_moves if cat not in LINE_RANKS]:
+        own = set(main_moves.get(cat, []))
+        union = set(own)
+        for moves in related_moves:
+            union.update(moves.get(cat, []))
+        combined[cat] = [m if m in own else f"{m}*" for m in sorted(union, key=lambda m: m.lower())]
+
+    # 2) Ranked categories: preserve progression order, avoid duplicates
+    seen = set()
+    for rank in LINE_RANKS:
+        own = set(main_moves.get(rank, []))
+        union = set(own)
+        for moves in related_moves:
+            union.update(moves.get(rank, []))
+        new_moves = sorted(union - seen, key=lambda m: m.lower())
+        combined[rank] = [m if m in own else f"{m}*" for m in new_moves]
+        seen |= union
+
+    return combined
+
+_line_moves = {}
+_line_moves_version = None
+_line_moves_lock = threading.Lock()
+
+def load_line_moves(name: str):
+    """
+    Resolve a Pokémon name and return its moves merged across its evolution
+    line (see combine_moves), or None. Computed once per species and data
+    version; the result is shared, don't modify it.
+    """
+    global _line_moves, _line_moves_version
+    catalog = get_catalog()
+    with _line_moves_lock:
+        if _line_moves_version != catalog.version:
+            _line_moves = {}
+            _line_moves_version = catalog.version
+        line_moves = _line_moves
+
+    key = find_species(name)
+    if key is None:
+        return None
+    if key not in line_moves:
+        moves = catalog.get("pokemon", key, normalized=True).get("moves", {})
+        evo_key = find_evolution_key(key)
+        if evo_key:
+            related = [load_species(rel) for rel in catalog.document("evolutions")[evo_key]]
+            moves = combine_moves(moves, [rel.get("moves", {}) for rel in related if rel])
+        line_moves[key] = moves
+    return line_moves[key]
@@ -0,0 +1,136 @@
+import ast
+import asyncio
+import importlib
+import importlib.util
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+# The extension whose setup() is running in the current task
+_current: ContextVar[Optional["ExtensionTiming"]] = ContextVar("startup_extension", default=None)
+
+@dataclass
+class ExtensionTiming:
+    """Where the time went while loading one extension, in seconds."""
+    name: str
+    import_s: float = 0.0     # top-level dependencies in a worker thread (wall time, includes waiting on shared ones)
+    construct_s: float = 0.0  # module body and cog constructor, up to add_cog()
+    setup_s: float = 0.0      # add_cog() (including cog_load) and the rest of setup()
+    error: Optional[str] = None
+    _mark: float = 0.0
+    _constructed: bool = False
+
+    @property
+    def total(self) -> float:
+        return self.import_s + self.construct_s + self.setup_s
+
+def cog_added():
+    """Called by the bot as a cog is added: ends the constructor phase of the extension being loaded."""
+    timing = _current.get()
+    if timing is not None and not timing._constructed:
+        now = time.perf_counter()
+        timing.construct_s = now - timing._mark
+        timing._mark = now
+        timing._constructed = True
+
+def extension_dependencies(name: str, skip: Iterable[str] = ()) -> List[str]:
+    """Absolute modules an extension imports at top level, read from its source without running it."""
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return []
+    source = spec.loader.get_source(name)
+    if not source:
+        return []
+    skip = set(skip)
+    found = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Import):
+            found.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            found.append(node.module)
+    return [module for module in dict.fromkeys(found) if module not in skip]
+
+def import_dependencies(name: str, skip: Iterable[str] = ()):
+    for module in extension_dependencies(name, skip):
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            # load_extension imports it again on the event loop and reports any real error;
+            # this also catches deadlocks between modules imported from parallel threads
+            print(f"[Startup] Pre-importing {module} for {name} failed, retrying on load: {e!r}")
+
+class StartupProfiler:
+    """
+    Loads extensions concurrently and records how long each phase of
+    startup took. Dependencies of every extension are imported in worker
+    threads first, so the event loop only runs the extension modules
+    themselves and their setup().
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.extensions: Dict[str, ExtensionTiming] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup step that is not an extension (catalog load, command sync, ...)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    async def warm(self, name: str, build: Callable[[], object]):
+        """Run a blocking cache build in a worker thread and time it."""
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(build)
+        except Exception as e:
+            print(f"[Startup] Warming {name} failed: {e}")
+        self.phases[f"warm {name}"] = time.perf_counter() - start
+
+    async def load_extension(self, bot, name: str, skip: Iterable[str] = ()):
+        timing = ExtensionTiming(name)
+        self.extensions[name] = timing
+        token = _current.set(timing)
+        try:
+            start = time.perf_counter()
+            await asyncio.to_thread(import_dependencies, name, skip)
+            timing.import_s = time.perf_counter() - start
+
+            timing._mark = time.perf_counter()
+            await bot.load_extension(name)
+            elapsed = time.perf_counter() - timing._mark
+            if timing._constructed:
+                timing.setup_s = elapsed
+            else:
+                timing.construct_s = elapsed
+            print(f"Loaded extension: {name}")
+        except Exception as e:
+            timing.error = str(e)
+            print(f"Failed to load extension {name}: {e}")
+        finally:
+            _current.reset(token)
+
+    async def load_extensions(self, bot, names: List[str]):
+        """Load independent extensions concurrently."""
+        await asyncio.gather(*(self.load_extension(bot, name, skip=names) for name in names))
+
+    def report(self, limit: int = 10) -> str:
+        """Startup summary: overall time, other phases and the slowest extensions."""
+        lines = [f"[Startup] Ready in {time.perf_counter() - self.started:.2f}s"]
+        for name, seconds in sorted(self.phases.items(), key=lambda p: -p[1]):
+            lines.append(f"[Startup]   {name}: {seconds * 1000:.0f} ms")
+        slowest = sorted(self.extensions.values(), key=lambda t: -t.total)
+        lines.append(f"[Startup] {len(self.extensions)} extensions (import / constructor / setup):")
+        # The slowest ones, plus any that failed
+        for t in slowest[:limit] + [t for t in slowest[limit:] if t.error]:
+            status = f"  FAILED: {t.error}" if t.error else ""
+            lines.append(
+                f"[Startup]   {t.name}: {t.import_s * 1000:.0f} / {t.construct_s * 1000:.0f} / "
+                f"{t.setup_s * 1000:.0f} ms{status}"
+            )
+        return "\n".join(lines)
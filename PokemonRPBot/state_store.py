@@ -0,0 +1,336 @@
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# One SQLite file for everything the bot writes at runtime
+STATE_DB_PATH = os.path.join(BASE_DIR, "bot_state.db")
+
+# JSON files the cogs used before the database, imported once on first start.
+# They are relative to the working directory, like the cogs opened them.
+LEGACY_REMINDERS_FILE = "reminders.json"
+LEGACY_QUEST_REMINDERS_FILE = "quest_reminders.json"
+LEGACY_OFFSETS_FILE = "user_offsets.json"
+LEGACY_GM_TIME_FILE = os.path.join("Data", "gm_time.json")
+LEGACY_MOODY_PATTERN = os.path.join("Data", "*_stats.json")
+
+# What a malformed legacy row can raise; such rows are skipped, not migrated
+_BAD_ROW_ERRORS = (
+    KeyError, TypeError, ValueError, AttributeError,
+    sqlite3.IntegrityError, sqlite3.InterfaceError, sqlite3.ProgrammingError,
+)
+
+def _skip_row(table: str, key, error: Exception):
+    print(f"[StateStore] Skipping malformed {table} entry {key!r}: {error!r}")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id             TEXT PRIMARY KEY,
+    user_id        INTEGER NOT NULL,
+    channel_id     INTEGER NOT NULL,
+    remind_time    TEXT NOT NULL,
+    message        TEXT NOT NULL,
+    bot_message_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS quest_reminders (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    remind_ts     INTEGER NOT NULL,
+    channel_id    INTEGER NOT NULL,
+    mentions      TEXT NOT NULL,
+    reminder_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_offsets (
+    user_id INTEGER PRIMARY KEY,
+    hours   INTEGER NOT NULL,
+    minutes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gm_time (
+    user_id INTEGER PRIMARY KEY,
+    time    REAL NOT NULL DEFAULT 0,
+    exp     INTEGER NOT NULL DEFAULT 0,
+    poke    INTEGER NOT NULL DEFAULT 0,
+    credits INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS moody_stats (
+    user_id INTEGER NOT NULL,
+    pokemon TEXT NOT NULL,
+    stats   TEXT NOT NULL,
+    PRIMARY KEY (user_id, pokemon)
+);
+CREATE TABLE IF NOT EXISTS migrations (
+    name        TEXT PRIMARY KEY,
+    migrated_at TEXT NOT NULL
+);
+"""
+
+def _read_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        print(f"[StateStore] Could not read {path} for migration: {e}")
+        return None
+
+class StateStore:
+    """
+    SQLite store (WAL mode) for reminders, quest reminders, timezone offsets,
+    GM time and Moody stats. Every change touches only its own rows inside a
+    transaction, so cogs no longer rewrite whole files or race on them.
+    """
+
+    def __init__(self, path: str = STATE_DB_PATH, migrate: bool = True):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        if migrate:
+            self.migrate_legacy_files()
+
+    def _transaction(self):
+        return _Transaction(self)
+
+    def _query(self, sql: str, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---- one-time migration from the old JSON files ----
+
+    def migrate_legacy_files(self):
+        """Import each legacy JSON file the first time the database is opened."""
+        for name, migrate in (
+            ("reminders", self._migrate_reminders),
+            ("quest_reminders", self._migrate_quest_reminders),
+            ("user_offsets", self._migrate_offsets),
+            ("gm_time", self._migrate_gm_time),
+            ("moody_stats", self._migrate_moody),
+        ):
+            if self._query("SELECT 1 FROM migrations WHERE name = ?", (name,)):
+                continue
+            with self._transaction() as cur:
+                count = migrate(cur)
+                cur.execute(
+                    "INSERT INTO migrations (name, migrated_at) VALUES (?, ?)",
+                    (name, datetime.now(timezone.utc).isoformat()),
+                )
+            if count:
+                print(f"[StateStore] Migrated {count} {name} row(s) from JSON")
+
+    def _migrate_reminders(self, cur) -> int:
+        data = _read_json(LEGACY_REMINDERS_FILE) if os.path.exists(LEGACY_REMINDERS_FILE) else None
+        if not isinstance(data, dict):
+            return 0
+        count = 0
+        for reminder_id, r in data.items():
+            try:
+                cur.execute(
+                    "INSERT OR REPLACE INTO reminders VALUES (?, ?, ?, ?, ?, ?)",
+                    (str(reminder_id), r["user_id"], r["channel_id"], r["remind_time"],
+                     r.get("message") or "", r.get("bot_message_id")),
+                )
+            except _BAD_ROW_ERRORS as e:
+                _skip_row("reminders", reminder_id, e)
+                continue
+            count += 1
+        return count
+
+    def _migrate_quest_reminders(self, cur) -> int:
+        data = _read_json(LEGACY_QUEST_REMINDERS_FILE) if os.path.exists(LEGACY_QUEST_REMINDERS_FILE) else None
+        if not isinstance(data, list):
+            return 0
+        count = 0
+        for position, r in enumerate(data):
+            try:
+                cur.execute(
+                    "INSERT INTO quest_reminders (remind_ts, channel_id, mentions, reminder_name) VALUES (?, ?, ?, ?)",
+                    (r["remind_ts"], r["channel_id"], r["mentions"], r["reminder_name"]),
+                )
+            except _BAD_ROW_ERRORS as e:
+                _skip_row("quest_reminders", position, e)
+                continue
+            count += 1
+        return count
+
+    def _migrate_offsets(self, cur) -> int:
+        data = _read_json(LEGACY_OFFSETS_FILE) if os.path.exists(LEGACY_OFFSETS_FILE) else None
+        if not isinstance(data, dict):
+            return 0
+        count = 0
+        for user_id, value in data.items():
+            if isinstance(value, list) and len(value) == 2:
+                try:
+                    cur.execute("INSERT OR REPLACE INTO user_offsets VALUES (?, ?, ?)", (int(user_id), value[0], value[1]))
+                except _BAD_ROW_ERRORS as e:
+                    _skip_row("user_offsets", user_id, e)
+                    continue
+                count += 1
+        return count
+
+    def _migrate_gm_time(self, cur) -> int:
+        data = _read_json(LEGACY_GM_TIME_FILE) if os.path.exists(LEGACY_GM_TIME_FILE) else None
+        if not isinstance(data, dict):
+            return 0
+        count = 0
+        for user_id, p in data.items():
+            try:
+                cur.execute(
+                    "INSERT OR REPLACE INTO gm_time VALUES (?, ?, ?, ?, ?)",
+                    (int(user_id), p.get("time", 0.0), p.get("exp", 0), p.get("poke", 0), p.get("credits", 0)),
+                )
+            except _BAD_ROW_ERRORS as e:
+                _skip_row("gm_time", user_id, e)
+                continue
+            count += 1
+        return count
+
+    def _migrate_moody(self, cur) -> int:
+        count = 0
+        for path in sorted(glob.glob(LEGACY_MOODY_PATTERN)):
+            m = re.fullmatch(r"(\d+)_stats\.json", os.path.basename(path))
+            data = _read_json(path) if m else None
+            if not isinstance(data, dict):
+                continue
+            for pokemon, stats in data.items():
+                try:
+                    cur.execute(
+                        "INSERT OR REPLACE INTO moody_stats VALUES (?, ?, ?)",
+                        (int(m.group(1)), pokemon, json.dumps(stats)),
+                    )
+                except _BAD_ROW_ERRORS as e:
+                    _skip_row("moody_stats", pokemon, e)
+                    continue
+                count += 1
+        return count
+
+    # ---- /remind ----
+
+    def load_reminders(self) -> dict:
+        """reminder id -> reminder dict, in the shape remind.py has always used."""
+        return {
+            row["id"]: {
+                "user_id": row["user_id"],
+                "channel_id": row["channel_id"],
+                "remind_time": row["remind_time"],
+                "message": row["message"],
+                "bot_message_id": row["bot_message_id"],
+            }
+            for row in self._query("SELECT * FROM reminders")
+        }
+
+    def save_reminder(self, reminder_id: str, reminder: dict):
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO reminders VALUES (?, ?, ?, ?, ?, ?)",
+                (reminder_id, reminder["user_id"], reminder["channel_id"], reminder["remind_time"],
+                 reminder["message"], reminder.get("bot_message_id")),
+            )
+
+    def delete_reminders(self, reminder_ids):
+        with self._transaction() as cur:
+            cur.executemany("DELETE FROM reminders WHERE id = ?", [(rid,) for rid in reminder_ids])
+
+    # ---- /quest_reminder ----
+
+    def load_quest_reminders(self) -> list:
+        return [dict(row) for row in self._query("SELECT * FROM quest_reminders ORDER BY remind_ts, id")]
+
+    def add_quest_reminder(self, reminder: dict) -> int:
+        """Store a quest reminder and return its row id."""
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT INTO quest_reminders (remind_ts, channel_id, mentions, reminder_name) VALUES (?, ?, ?, ?)",
+                (reminder["remind_ts"], reminder["channel_id"], reminder["mentions"], reminder["reminder_name"]),
+            )
+            return cur.lastrowid
+
+    def delete_quest_reminders(self, reminder_ids):
+        with self._transaction() as cur:
+            cur.executemany("DELETE FROM quest_reminders WHERE id = ?", [(rid,) for rid in reminder_ids])
+
+    # ---- timezone offsets ----
+
+    def load_user_offsets(self) -> dict:
+        """user id -> (hours, minutes)"""
+        return {row["user_id"]: (row["hours"], row["minutes"]) for row in self._query("SELECT * FROM user_offsets")}
+
+    def get_user_offset(self, user_id: int):
+        rows = self._query("SELECT hours, minutes FROM user_offsets WHERE user_id = ?", (user_id,))
+        return (rows[0]["hours"], rows[0]["minutes"]) if rows else None
+
+    def set_user_offset(self, user_id: int, hours: int, minutes: int):
+        with self._transaction() as cur:
+            cur.execute("INSERT OR REPLACE INTO user_offsets VALUES (?, ?, ?)", (user_id, hours, minutes))
+
+    # ---- GM time ----
+
+    def load_gm_profiles(self) -> dict:
+        """str(user id) -> profile dict, matching gm_time.py's in-memory layout."""
+        return {
+            str(row["user_id"]): {"time": row["time"], "exp": row["exp"], "poke": row["poke"], "credits": row["credits"]}
+            for row in self._query("SELECT * FROM gm_time")
+        }
+
+    def save_gm_profile(self, user_id: int, profile: dict):
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO gm_time VALUES (?, ?, ?, ?, ?)",
+                (int(user_id), profile["time"], profile["exp"], profile["poke"], profile["credits"]),
+            )
+
+    # ---- Moody ----
+
+    def get_moody_stats(self, user_id: int) -> dict:
+        """Pokémon name -> stat stages for one user."""
+        rows = self._query("SELECT pokemon, stats FROM moody_stats WHERE user_id = ? ORDER BY rowid", (user_id,))
+        return {row["pokemon"]: json.loads(row["stats"]) for row in rows}
+
+    def save_moody_stats(self, user_id: int, pokemon: str, stats: dict):
+        with self._transaction() as cur:
+            # Upsert rather than REPLACE so the row keeps its rowid (and its place in the list)
+            cur.execute(
+                "INSERT INTO moody_stats VALUES (?, ?, ?) "
+                "ON CONFLICT (user_id, pokemon) DO UPDATE SET stats = excluded.stats",
+                (user_id, pokemon, json.dumps(stats)),
+            )
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error; holds the store lock throughout."""
+
+    def __init__(self, store: StateStore):
+        self.store = store
+
+    def __enter__(self):
+        self.store._lock.acquire()
+        self.cur = self.store._conn.cursor()
+        self.cur.execute("BEGIN IMMEDIATE")
+        return self.cur
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.cur.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.store._lock.release()
+        return False
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_state_store() -> StateStore:
+    """Return the shared state store, creating (and migrating) the database on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = StateStore()
+    return _store
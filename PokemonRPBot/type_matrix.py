@@ -0,0 +1,153 @@
+import math
+import re
+import threading
+from itertools import product
+from typing import Dict, List, Sequence, Tuple
+
+from emojis import get_type_emoji
+from game_data import get_catalog
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; combos of 3+ types fall back to a Python product
+    np = None
+
+# Types with emojis and moves that typechart.json has no rows for (yet).
+# They take and deal neutral damage unless the chart file lists them.
+EXTRA_TYPES = ["Shadow", "Virus"]
+
+def get_effectiveness_category(multiplier: float) -> str:
+    """
+    Convert the combined multiplier into a text category using base-2 logarithms:
+      - log₂(4) = 2    → "Super Effective (+2)"
+      - log₂(2) = 1    → "Effective (+1)"
+      - log₂(0.5) = -1 → "Ineffective (-1)"
+      - log₂(0.25) = -2→ "Super Ineffective (-2)"
+      - 0 multiplier  → "Immune (No Damage)"
+    """
+    if multiplier == 0:
+        return "Immune (No Damage)"
+    shift = round(math.log(multiplier, 2))
+    if shift == 0:
+        return "Neutral (0)"
+    elif shift == 1:
+        return "Effective (+1)"
+    elif shift == 2:
+        return "Super Effective (+2)"
+    elif shift == -1:
+        return "Ineffective (-1)"
+    elif shift == -2:
+        return "Super Ineffective (-2)"
+    elif shift > 2:
+        return f"Ultra Effective (+{shift})"
+    return f"Ultra Ineffective ({shift})"
+
+def sort_key(category: str) -> float:
+    """Numeric value in parentheses, e.g. '(+2)'; "Immune (No Damage)" sorts last."""
+    if category.startswith("Immune"):
+        return -999
+    m = re.search(r'\(([-+]\d+)\)', category)
+    return int(m.group(1)) if m else 0
+
+class TypeMatrix:
+    """
+    The defensive type chart as a dense matrix: rows are defending types,
+    columns attacking types, in chart order with Shadow and Virus added.
+
+    The grouped interactions and rendered text for every one- and two-type
+    defender are computed once up front; three and four types are one
+    product over the matching rows. Type names resolve through a lowercase dict.
+    """
+
+    def __init__(self, chart: Dict[str, Dict[str, float]]):
+        self.types: List[str] = list(chart) + [t for t in EXTRA_TYPES if t not in chart]
+        self._index = {t.lower(): i for i, t in enumerate(self.types)}
+        self.rows: Tuple[Tuple[float, ...], ...] = tuple(
+            tuple(float(chart.get(defender, {}).get(attacker, 1)) for attacker in self.types)
+            for defender in self.types
+        )
+        self._array = np.array(self.rows, dtype=np.float64) if np is not None else None
+
+        self._groups = {}
+        for i in range(len(self.types)):
+            self._groups[(i,)] = self._group(self.rows[i])
+        for i, j in product(range(len(self.types)), repeat=2):
+            self._groups[(i, j)] = self._group(tuple(a * b for a, b in zip(self.rows[i], self.rows[j])))
+        self._rendered = {indices: _render(grouped) for indices, grouped in self._groups.items()}
+
+    def normalize_type(self, t: str) -> str:
+        """The chart's spelling of a type name, or the input if it isn't a type."""
+        i = self._index.get(t.lower())
+        return self.types[i] if i is not None else t
+
+    def multipliers(self, defender_types: Sequence[str]) -> Tuple[float, ...]:
+        """Combined multiplier of each attacking type (in self.types order)."""
+        indices = self._indices(defender_types)
+        if np is not None:
+            return tuple(np.prod(self._array[list(indices)], axis=0).tolist())
+        combined = [1.0] * len(self.types)
+        for i in indices:
+            combined = [a * b for a, b in zip(combined, self.rows[i])]
+        return tuple(combined)
+
+    def interactions(self, defender_types: Sequence[str]) -> List[Tuple[str, List[str]]]:
+        """
+        Non-neutral interactions as (category, attacking types) pairs, the
+        strongest category first. Raises KeyError for an unknown type.
+        """
+        indices = self._indices(defender_types)
+        grouped = self._groups.get(indices)
+        if grouped is None:
+            grouped = self._group(self.multipliers(defender_types))
+        return grouped
+
+    def render(self, defender_types: Sequence[str]) -> str:
+        """The category headings and type lists shown under a type chart title."""
+        rendered = self._rendered.get(self._indices(defender_types))
+        if rendered is None:
+            rendered = _render(self.interactions(defender_types))
+        return rendered
+
+    def _indices(self, defender_types: Sequence[str]) -> Tuple[int, ...]:
+        indices = []
+        for t in defender_types:
+            i = self._index.get(t.lower())
+            if i is None:
+                raise KeyError(t)
+            indices.append(i)
+        return tuple(indices)
+
+    def _group(self, multipliers: Sequence[float]) -> List[Tuple[str, List[str]]]:
+        results = {}
+        for attack_type, multiplier in zip(self.types, multipliers):
+            if multiplier == 1:
+                continue
+            category = get_effectiveness_category(multiplier)
+            if category != "Neutral (0)":
+                results.setdefault(category, []).append(attack_type)
+        return [(category, results[category]) for category in sorted(results, key=sort_key, reverse=True)]
+
+def _render(grouped) -> str:
+    lines = []
+    for category, attack_types in grouped:
+        lines.append(f"### {category}")
+        lines.append("  |  ".join(f"{get_type_emoji(t)} {t}" for t in attack_types))
+    return "\n".join(lines)
+
+_matrix = None
+_matrix_version = None
+_matrix_lock = threading.Lock()
+
+def get_type_matrix() -> TypeMatrix:
+    """Return the shared type matrix, rebuilt when typechart.json changes."""
+    global _matrix, _matrix_version
+    catalog = get_catalog()
+    if _matrix is None or _matrix_version != catalog.version:
+        with _matrix_lock:
+            if _matrix is None or _matrix_version != catalog.version:
+                _matrix = TypeMatrix(catalog.document("typechart") or {})
+                _matrix_version = catalog.version
+    return _matrix
+
+def normalize_type(t: str) -> str:
+    return get_type_matrix().normalize_type(t)
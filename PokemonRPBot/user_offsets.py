@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+
+from state_store import get_state_store
+
+class UserOffsetService:
+    """
+    Users' timezone offsets, loaded from the state database once and served
+    from memory. The database row is written in a worker thread (one
+    transaction per change), so neither lookups nor updates block the
+    event loop on disk I/O. Updates are serialized, so the database
+    always ends up with the same value as memory.
+    """
+
+    def __init__(self):
+        self._offsets: Dict[int, Tuple[int, int]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._write_lock: Optional[asyncio.Lock] = None  # created on the bot's event loop
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._offsets = get_state_store().load_user_offsets()
+                    self._loaded = True
+                    print(f"[UserOffsets] Loaded {len(self._offsets)} offset(s)")
+
+    def get(self, user_id: int) -> Optional[Tuple[int, int]]:
+        """(hours, minutes) for the user, or None if they never set one."""
+        self._ensure_loaded()
+        return self._offsets.get(user_id)
+
+    async def set(self, user_id: int, hours: int, minutes: int):
+        """Persist the offset in the background and update memory in the same step."""
+        self._ensure_loaded()
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        # Two quick updates for one user must reach the database in call order
+        async with self._write_lock:
+            self._offsets[user_id] = (hours, minutes)
+            await asyncio.to_thread(get_state_store().set_user_offset, user_id, hours, minutes)
+
+_service = UserOffsetService()
+
+def get_offset_service() -> UserOffsetService:
+    return _service
+
+async def get_user_offset(user_id: int) -> Optional[Tuple[int, int]]:
+    """
+    Return (hours, minutes) if found for the user, else None.
+    """
+    return _service.get(user_id)
+
+async def set_user_offset(user_id: int, hours: int, minutes: int):
+    """
+    Save the user's offset as (hours, minutes).
+    """
+    await _service.set(user_id, hours, minutes)